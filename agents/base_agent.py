@@ -36,22 +36,25 @@ class BaseAgent(ABC):
         self.description = description
         self.dependencies = dependencies or []
 
-        # Status and metrics tracking
+        # Status and metrics tracking, aggregated over every invocation of this
+        # (possibly pooled) instance; per-run state lives in the returned result
         self.status = AgentStatus.IDLE
         self.success_count = 0
         self.failure_count = 0
+        self.retry_count = 0  # Total retries across runs
         self.last_execution_time = 0.0
         self.total_execution_time = 0.0
         self.created_at = datetime.now()
         self.last_run_at = None
 
-        # Configuration and context
+        # Configuration and context shared by all runs; per-run data belongs in input_data
         self.config = {}
         self.context = {}
-        self.output_cache = None
-        self.retry_count = 0
         self.max_retries = 3
 
+        # Concurrent invocations of a shared (pooled) instance
+        self.active_runs = 0
+
         # Setup logging
         self.logger = logging.getLogger(f"{self.__class__.__name__}")
 
@@ -100,10 +103,6 @@ class BaseAgent(ABC):
         Returns:
             Processed result
         """
-        # Cache successful results
-        if result.get("status") == "success":
-            self.output_cache = result.get("result")
-
         # Log execution completion
         self.logger.info(f"Completed execution of {self.name}")
 
@@ -119,8 +118,27 @@ class BaseAgent(ABC):
         Returns:
             Standardized result dictionary
         """
-        start_time = datetime.now()
+        self.active_runs += 1
         self.status = AgentStatus.RUNNING
+        result = None
+        try:
+            result = await self._run_attempts(input_data)
+            return result
+        finally:
+            self.active_runs -= 1
+            # A shared instance stays RUNNING while other invocations are in flight
+            if self.active_runs:
+                self.status = AgentStatus.RUNNING
+            elif result is None:
+                self.status = AgentStatus.CANCELLED
+            elif result["status"] == "success":
+                self.status = AgentStatus.COMPLETED
+            else:
+                self.status = AgentStatus.ERROR
+
+    async def _run_attempts(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute with retries and record metrics for a single invocation"""
+        start_time = datetime.now()
         self.last_run_at = start_time
 
         attempt = 0
@@ -139,8 +157,6 @@ class BaseAgent(ABC):
 
                 # Success metrics
                 self.success_count += 1
-                self.status = AgentStatus.COMPLETED
-                self.retry_count = 0
 
                 end_time = datetime.now()
                 execution_time = (end_time - start_time).total_seconds()
@@ -160,18 +176,17 @@ class BaseAgent(ABC):
             except Exception as e:
                 attempt += 1
                 last_error = e
-                self.retry_count = attempt
 
                 self.logger.warning(f"Attempt {attempt} failed for {self.name}: {str(e)}")
 
                 if attempt <= self.max_retries:
+                    self.retry_count += 1
                     # Wait before retry with exponential backoff
                     await asyncio.sleep(2 ** attempt)
                     continue
                 else:
                     # Max retries exceeded
                     self.failure_count += 1
-                    self.status = AgentStatus.ERROR
 
                     end_time = datetime.now()
                     execution_time = (end_time - start_time).total_seconds()
@@ -192,7 +207,6 @@ class BaseAgent(ABC):
                     }
 
         # This should never be reached, but just in case
-        self.status = AgentStatus.IDLE
         return {
             "status": "error",
             "agent": self.name,
@@ -201,6 +215,56 @@ class BaseAgent(ABC):
             "result": None
         }
 
+    async def run_with_timeout(self, input_data: Dict[str, Any], timeout: Optional[float]) -> Dict[str, Any]:
+        """
+        Run the agent with a time limit covering all attempts and retry backoff
+
+        Args:
+            input_data: Input data for execution
+            timeout: Time limit in seconds, or None for no limit
+
+        Returns:
+            Standardized result dictionary; an error result if the limit is hit
+        """
+        start_time = datetime.now()
+
+        try:
+            return await asyncio.wait_for(self.run(input_data), timeout)
+        except asyncio.TimeoutError:
+            self.failure_count += 1
+            if not self.active_runs:
+                self.status = AgentStatus.ERROR
+
+            execution_time = (datetime.now() - start_time).total_seconds()
+            self.last_execution_time = execution_time
+
+            self.logger.error(f"Timed out after {timeout}s: {self.name}")
+
+            return self.error_result(f"Timed out after {timeout} seconds", "TimeoutError", execution_time)
+
+    def error_result(self, error: str, error_type: str, execution_time: float = 0.0) -> Dict[str, Any]:
+        """
+        Build a standardized error result for an agent that did not complete
+
+        Args:
+            error: Error message
+            error_type: Error class name or category
+            execution_time: Time spent before giving up
+
+        Returns:
+            Result dictionary in the same shape as a failed run
+        """
+        return {
+            "status": "error",
+            "agent": self.name,
+            "phase": self.phase,
+            "execution_time": execution_time,
+            "error": error,
+            "error_type": error_type,
+            "result": None,
+            "timestamp": datetime.now().isoformat()
+        }
+
     def validate_dependencies(self, input_data: Dict[str, Any]) -> bool:
         """
         Validate that all required dependencies are available in input data
@@ -216,8 +280,14 @@ class BaseAgent(ABC):
 
         agent_results = input_data.get("agent_results", {})
 
+        # Results are keyed by class name; run() results also carry the agent name
+        available = set(agent_results)
+        available.update(
+            result.get("agent") for result in agent_results.values() if isinstance(result, dict)
+        )
+
         for dependency in self.dependencies:
-            if dependency not in agent_results:
+            if dependency not in available:
                 self.logger.error(f"Missing dependency: {dependency}")
                 return False
 
@@ -246,6 +316,7 @@ class BaseAgent(ABC):
             "average_execution_time": round(avg_execution_time, 3),
             "total_execution_time": round(self.total_execution_time, 3),
             "retry_count": self.retry_count,
+            "active_runs": self.active_runs,
             "dependencies": self.dependencies,
             "created_at": self.created_at.isoformat(),
             "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None
@@ -259,7 +330,6 @@ class BaseAgent(ABC):
         self.total_execution_time = 0.0
         self.retry_count = 0
         self.status = AgentStatus.IDLE
-        self.output_cache = None
 
     def configure(self, config: Dict[str, Any]):
         """
@@ -276,22 +346,13 @@ class BaseAgent(ABC):
 
     def set_context(self, context: Dict[str, Any]):
         """
-        Set agent execution context
+        Set agent execution context shared by every run of this instance
 
         Args:
-            context: Context data for execution
+            context: Context data for execution; per-request data goes in input_data
         """
         self.context.update(context)
 
-    def get_cached_output(self) -> Optional[Dict[str, Any]]:
-        """
-        Get the last successful output from cache
-
-        Returns:
-            Cached output or None if no cache exists
-        """
-        return self.output_cache
-
     def __str__(self) -> str:
         """String representation of the agent"""
         return f"{self.name} ({self.phase}) - {self.status.value}"
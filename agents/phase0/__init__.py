@@ -1,7 +1,14 @@
-from .self_learning_superviser_agent import SelfLearningSuperviserAgent
-from .brainstorming_agent import BrainstormingAgent
+from importlib import import_module
 
-__all__ = [
-    'SelfLearningSuperviserAgent',
-    'BrainstormingAgent'
-]
+_AGENT_MODULES = {
+    "SelfLearningSuperviserAgent": ".self_learning_superviser_agent",
+    "BrainstormingAgent": ".brainstorming_agent",
+}
+
+__all__ = list(_AGENT_MODULES)
+
+
+def __getattr__(name):
+    if name in _AGENT_MODULES:
+        return getattr(import_module(_AGENT_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
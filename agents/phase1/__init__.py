@@ -1,39 +1,30 @@
-from .brand_alignment_agent import BrandAlignmentAgent
-from .audience_analysis_agent import AudienceAnalysisAgent
-from .trend_analysis_agent import TrendAnalysisAgent
-from .topic_generation_agent import TopicGenerationAgent
-from .competitor_analysis_agent import CompetitorAnalysisAgent
-from .context_history_agent import ContextHistoryAgent
-from .audience_persona_agent import AudiencePersonaAgent
-from .goal_definition_agent import GoalDefinitionAgent
-from .context_gathering_agent import ContextGatheringAgent
-from .topic_list_monitoring_agent import TopicListMonitoringAgent
-from .topic_uniqueness_validation_agent import TopicUniquenessValidationAgent
-from .final_topic_selection_agent import FinalTopicSelectionAgent
-from .topic_validation_agent import TopicValidationAgent
-from .audience_sentiment_agent import AudienceSentimentAgent
-from .niche_authority_agent import NicheAuthorityAgent
-from .semantic_gap_agent import SemanticGapAgent
-from .regulatory_landscape_agent import RegulatoryLandscapeAgent
-from .ethical_bias_agent import EthicalBiasAgent
+from importlib import import_module
 
-__all__ = [
-    "BrandAlignmentAgent",
-    "AudienceAnalysisAgent",
-    "TrendAnalysisAgent",
-    "TopicGenerationAgent",
-    "CompetitorAnalysisAgent",
-    "ContextHistoryAgent",
-    "AudiencePersonaAgent",
-    "GoalDefinitionAgent",
-    "ContextGatheringAgent",
-    "TopicListMonitoringAgent",
-    "TopicUniquenessValidationAgent",
-    "FinalTopicSelectionAgent",
-    "TopicValidationAgent",
-    "AudienceSentimentAgent",
-    "NicheAuthorityAgent",
-    "SemanticGapAgent",
-    "RegulatoryLandscapeAgent",
-    "EthicalBiasAgent",
-]
+_AGENT_MODULES = {
+    "BrandAlignmentAgent": ".brand_alignment_agent",
+    "AudienceAnalysisAgent": ".audience_analysis_agent",
+    "TrendAnalysisAgent": ".trend_analysis_agent",
+    "TopicGenerationAgent": ".topic_generation_agent",
+    "CompetitorAnalysisAgent": ".competitor_analysis_agent",
+    "ContextHistoryAgent": ".context_history_agent",
+    "AudiencePersonaAgent": ".audience_persona_agent",
+    "GoalDefinitionAgent": ".goal_definition_agent",
+    "ContextGatheringAgent": ".context_gathering_agent",
+    "TopicListMonitoringAgent": ".topic_list_monitoring_agent",
+    "TopicUniquenessValidationAgent": ".topic_uniqueness_validation_agent",
+    "FinalTopicSelectionAgent": ".final_topic_selection_agent",
+    "TopicValidationAgent": ".topic_validation_agent",
+    "AudienceSentimentAgent": ".audience_sentiment_agent",
+    "NicheAuthorityAgent": ".niche_authority_agent",
+    "SemanticGapAgent": ".semantic_gap_agent",
+    "RegulatoryLandscapeAgent": ".regulatory_landscape_agent",
+    "EthicalBiasAgent": ".ethical_bias_agent",
+}
+
+__all__ = list(_AGENT_MODULES)
+
+
+def __getattr__(name):
+    if name in _AGENT_MODULES:
+        return getattr(import_module(_AGENT_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,19 +1,20 @@
-from .cms_upload_agent import CMSUploadAgent
-from .final_review_approval_agent import FinalReviewApprovalAgent
-from .formatting_preview_agent import FormattingPreviewAgent
-from .publication_confirmation_agent import PublicationConfirmationAgent
-from .publish_timing_agent import PublishTimingAgent
-from .publish_timing_conflict_agent import PublishTimingConflictAgent
-from .scheduled_posting_agent import ScheduledPostingAgent
-from .scheduling_agent import SchedulingAgent
+from importlib import import_module
 
-__all__ = [
-    "CMSUploadAgent",
-    "FinalReviewApprovalAgent",
-    "FormattingPreviewAgent",
-    "PublicationConfirmationAgent",
-    "PublishTimingAgent",
-    "PublishTimingConflictAgent",
-    "ScheduledPostingAgent",
-    "SchedulingAgent"
-]
+_AGENT_MODULES = {
+    "CMSUploadAgent": ".cms_upload_agent",
+    "FinalReviewApprovalAgent": ".final_review_approval_agent",
+    "FormattingPreviewAgent": ".formatting_preview_agent",
+    "PublicationConfirmationAgent": ".publication_confirmation_agent",
+    "PublishTimingAgent": ".publish_timing_agent",
+    "PublishTimingConflictAgent": ".publish_timing_conflict_agent",
+    "ScheduledPostingAgent": ".scheduled_posting_agent",
+    "SchedulingAgent": ".scheduling_agent",
+}
+
+__all__ = list(_AGENT_MODULES)
+
+
+def __getattr__(name):
+    if name in _AGENT_MODULES:
+        return getattr(import_module(_AGENT_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
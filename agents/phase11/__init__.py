@@ -1,11 +1,16 @@
-from .newsletter_content_generator_agent import NewsletterContentGeneratorAgent
-from .promotion_generation_agent import PromotionGenerationAgent
-from .promotion_scheduler_agent import PromotionSchedulerAgent
-from .social_media_generator_agent import SocialMediaGeneratorAgent
-
-__all__ = [
-    "NewsletterContentGeneratorAgent",
-    "PromotionGenerationAgent",
-    "PromotionSchedulerAgent",
-    "SocialMediaGeneratorAgent"
-]
+from importlib import import_module
+
+_AGENT_MODULES = {
+    "NewsletterContentGeneratorAgent": ".newsletter_content_generator_agent",
+    "PromotionGenerationAgent": ".promotion_generation_agent",
+    "PromotionSchedulerAgent": ".promotion_scheduler_agent",
+    "SocialMediaGeneratorAgent": ".social_media_generator_agent",
+}
+
+__all__ = list(_AGENT_MODULES)
+
+
+def __getattr__(name):
+    if name in _AGENT_MODULES:
+        return getattr(import_module(_AGENT_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
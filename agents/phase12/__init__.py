@@ -1,23 +1,22 @@
-from .update_rewrite_suggestion_agent import UpdateRewriteSuggestionAgent
-from .update_suggestion_agent import UpdateSuggestionAgent
-from .analytics_agent import AnalyticsAgent
-from .blog_performance_monitoring_agent import BlogPerformanceMonitoringAgent
-from .content_relevance_drift_detector_agent import ContentRelevanceDriftDetectorAgent
-from .content_update_recommendation_agent import ContentUpdateRecommendationAgent
-from .engagement_analytics_agent import EngagementAnalyticsAgent
-from .historical_seo_impact_analyzer_agent import HistoricalSEOImpactAnalyzerAgent
-from .publishing_report_agent import PublishingReportAgent
-from .seo_performance_tracker_agent import SEOPerformanceTrackerAgent
+from importlib import import_module
 
-__all__ = [
-    "UpdateRewriteSuggestionAgent",
-    "UpdateSuggestionAgent",
-    "AnalyticsAgent",
-    "BlogPerformanceMonitoringAgent",
-    "ContentRelevanceDriftDetectorAgent",
-    "ContentUpdateRecommendationAgent",
-    "EngagementAnalyticsAgent",
-    "HistoricalSEOImpactAnalyzerAgent",
-    "PublishingReportAgent",
-    "SEOPerformanceTrackerAgent"
-]
+_AGENT_MODULES = {
+    "UpdateRewriteSuggestionAgent": ".update_rewrite_suggestion_agent",
+    "UpdateSuggestionAgent": ".update_suggestion_agent",
+    "AnalyticsAgent": ".analytics_agent",
+    "BlogPerformanceMonitoringAgent": ".blog_performance_monitoring_agent",
+    "ContentRelevanceDriftDetectorAgent": ".content_relevance_drift_detector_agent",
+    "ContentUpdateRecommendationAgent": ".content_update_recommendation_agent",
+    "EngagementAnalyticsAgent": ".engagement_analytics_agent",
+    "HistoricalSEOImpactAnalyzerAgent": ".historical_seo_impact_analyzer_agent",
+    "PublishingReportAgent": ".publishing_report_agent",
+    "SEOPerformanceTrackerAgent": ".seo_performance_tracker_agent",
+}
+
+__all__ = list(_AGENT_MODULES)
+
+
+def __getattr__(name):
+    if name in _AGENT_MODULES:
+        return getattr(import_module(_AGENT_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
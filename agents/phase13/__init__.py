@@ -1,19 +1,20 @@
-from .chatbot_agent import ChatbotAgent
-from .chatbot_analytics_agent import ChatbotAnalyticsAgent
-from .feedback_analysis_agent import FeedbackAnalysisAgent
-from .feedback_iteration_agent import FeedbackIterationAgent
-from .feedback_moderation_agent import FeedbackModerationAgent
-from .feedback_popup_agent import FeedbackPopupAgent
-from .poll_comment_agent import PollCommentAgent
-from .review_collection_agent import ReviewCollectionAgent
+from importlib import import_module
 
-__all__ = [
-    "ChatbotAgent",
-    "ChatbotAnalyticsAgent",
-    "FeedbackAnalysisAgent",
-    "FeedbackIterationAgent",
-    "FeedbackModerationAgent",
-    "FeedbackPopupAgent",
-    "PollCommentAgent",
-    "ReviewCollectionAgent"
-]
+_AGENT_MODULES = {
+    "ChatbotAgent": ".chatbot_agent",
+    "ChatbotAnalyticsAgent": ".chatbot_analytics_agent",
+    "FeedbackAnalysisAgent": ".feedback_analysis_agent",
+    "FeedbackIterationAgent": ".feedback_iteration_agent",
+    "FeedbackModerationAgent": ".feedback_moderation_agent",
+    "FeedbackPopupAgent": ".feedback_popup_agent",
+    "PollCommentAgent": ".poll_comment_agent",
+    "ReviewCollectionAgent": ".review_collection_agent",
+}
+
+__all__ = list(_AGENT_MODULES)
+
+
+def __getattr__(name):
+    if name in _AGENT_MODULES:
+        return getattr(import_module(_AGENT_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,15 @@
-from .content_parsing_segmentation_agent import ContentParsingSegmentationAgent
-from .content_rewriting_paraphrasing_agent import ContentRewritingParaphrasingAgent
-from .url_content_extraction_agent import URLContentExtractionAgent
-
-__all__ = [
-    "ContentParsingSegmentationAgent",
-    "ContentRewritingParaphrasingAgent",
-    "URLContentExtractionAgent"
-]
+from importlib import import_module
+
+_AGENT_MODULES = {
+    "ContentParsingSegmentationAgent": ".content_parsing_segmentation_agent",
+    "ContentRewritingParaphrasingAgent": ".content_rewriting_paraphrasing_agent",
+    "URLContentExtractionAgent": ".url_content_extraction_agent",
+}
+
+__all__ = list(_AGENT_MODULES)
+
+
+def __getattr__(name):
+    if name in _AGENT_MODULES:
+        return getattr(import_module(_AGENT_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,23 +1,22 @@
-from .broken_media_asset_recovery_agent import BrokenMediaAssetRecoveryAgent
-from .content_tamper_detection_agent import ContentTamperDetectionAgent
-from .internal_crawlability_indexation_tester_agent import InternalCrawlabilityIndexationTesterAgent
-from .live_post_health_agent import LivePostHealthAgent
-from .negative_seo_malicious_spam_detection_agent import NegativeSEOMaliciousSpamDetectionAgent
-from .search_engine_algorithm_change_monitor_agent import SearchEngineAlgorithmChangeMonitorAgent
-from .security_review_agent import SecurityReviewAgent
-from .tamper_detection_agent import TamperDetectionAgent
-from .traffic_spike_anomaly_response_agent import TrafficSpikeAnomalyResponseAgent
-from .user_session_journey_analysis_agent import UserSessionJourneyAnalysisAgent
+from importlib import import_module
 
-__all__ = [
-    "BrokenMediaAssetRecoveryAgent",
-    "ContentTamperDetectionAgent",
-    "InternalCrawlabilityIndexationTesterAgent",
-    "LivePostHealthAgent",
-    "NegativeSEOMaliciousSpamDetectionAgent",
-    "SearchEngineAlgorithmChangeMonitorAgent",
-    "SecurityReviewAgent",
-    "TamperDetectionAgent",
-    "TrafficSpikeAnomalyResponseAgent",
-    "UserSessionJourneyAnalysisAgent"
-]
+_AGENT_MODULES = {
+    "BrokenMediaAssetRecoveryAgent": ".broken_media_asset_recovery_agent",
+    "ContentTamperDetectionAgent": ".content_tamper_detection_agent",
+    "InternalCrawlabilityIndexationTesterAgent": ".internal_crawlability_indexation_tester_agent",
+    "LivePostHealthAgent": ".live_post_health_agent",
+    "NegativeSEOMaliciousSpamDetectionAgent": ".negative_seo_malicious_spam_detection_agent",
+    "SearchEngineAlgorithmChangeMonitorAgent": ".search_engine_algorithm_change_monitor_agent",
+    "SecurityReviewAgent": ".security_review_agent",
+    "TamperDetectionAgent": ".tamper_detection_agent",
+    "TrafficSpikeAnomalyResponseAgent": ".traffic_spike_anomaly_response_agent",
+    "UserSessionJourneyAnalysisAgent": ".user_session_journey_analysis_agent",
+}
+
+__all__ = list(_AGENT_MODULES)
+
+
+def __getattr__(name):
+    if name in _AGENT_MODULES:
+        return getattr(import_module(_AGENT_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
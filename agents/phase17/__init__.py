@@ -1,9 +1,15 @@
-from .change_suggestion_aggregator_agent import ChangeSuggestionAggregatorAgent
-from .editorial_workflow_agent import EditorialWorkflowAgent
-from .peer_review_collaborative_editing_agent import PeerReviewCollaborativeEditingAgent
-
-__all__ = [
-    "ChangeSuggestionAggregatorAgent",
-    "EditorialWorkflowAgent",
-    "PeerReviewCollaborativeEditingAgent"
-]
+from importlib import import_module
+
+_AGENT_MODULES = {
+    "ChangeSuggestionAggregatorAgent": ".change_suggestion_aggregator_agent",
+    "EditorialWorkflowAgent": ".editorial_workflow_agent",
+    "PeerReviewCollaborativeEditingAgent": ".peer_review_collaborative_editing_agent",
+}
+
+__all__ = list(_AGENT_MODULES)
+
+
+def __getattr__(name):
+    if name in _AGENT_MODULES:
+        return getattr(import_module(_AGENT_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,35 +1,28 @@
-from .increment_function_agent import IncrementFunctionAgent
-from .incremental_function_agent import IncrementalFunctionAgent
-from .localization_agent import LocalizationAgent
-from .semantic_consistency_validator_agent import SemanticConsistencyValidatorAgent
-from .sentiment_analysis_agent import SentimentAnalysisAgent
-from .social_proof_collector_agent import SocialProofCollectorAgent
-from .table_chart_generator_agent import TableChartGeneratorAgent
-from .table_formatter_agent import TableFormatterAgent
-from .table_generator_agent import TableGeneratorAgent
-from .tag_checker_agent import TagCheckerAgent
-from .tag_fixing_agent import TagFixingAgent
-from .ux_journey_simulator_agent import UXJourneySimulatorAgent
-from .content_gap_checker_agent import ContentGapCheckerAgent
-from .content_increment_agent import ContentIncrementAgent
-from .content_localization_cultural_adaptation_agent import ContentLocalizationCulturalAdaptationAgent
-from .fact_updater_agent import FactUpdaterAgent
+from importlib import import_module
 
-__all__ = [
-    "IncrementFunctionAgent",
-    "IncrementalFunctionAgent",
-    "LocalizationAgent",
-    "SemanticConsistencyValidatorAgent",
-    "SentimentAnalysisAgent",
-    "SocialProofCollectorAgent",
-    "TableChartGeneratorAgent",
-    "TableFormatterAgent",
-    "TableGeneratorAgent",
-    "TagCheckerAgent",
-    "TagFixingAgent",
-    "UXJourneySimulatorAgent",
-    "ContentGapCheckerAgent",
-    "ContentIncrementAgent",
-    "ContentLocalizationCulturalAdaptationAgent",
-    "FactUpdaterAgent"
-]
+_AGENT_MODULES = {
+    "IncrementFunctionAgent": ".increment_function_agent",
+    "IncrementalFunctionAgent": ".incremental_function_agent",
+    "LocalizationAgent": ".localization_agent",
+    "SemanticConsistencyValidatorAgent": ".semantic_consistency_validator_agent",
+    "SentimentAnalysisAgent": ".sentiment_analysis_agent",
+    "SocialProofCollectorAgent": ".social_proof_collector_agent",
+    "TableChartGeneratorAgent": ".table_chart_generator_agent",
+    "TableFormatterAgent": ".table_formatter_agent",
+    "TableGeneratorAgent": ".table_generator_agent",
+    "TagCheckerAgent": ".tag_checker_agent",
+    "TagFixingAgent": ".tag_fixing_agent",
+    "UXJourneySimulatorAgent": ".ux_journey_simulator_agent",
+    "ContentGapCheckerAgent": ".content_gap_checker_agent",
+    "ContentIncrementAgent": ".content_increment_agent",
+    "ContentLocalizationCulturalAdaptationAgent": ".content_localization_cultural_adaptation_agent",
+    "FactUpdaterAgent": ".fact_updater_agent",
+}
+
+__all__ = list(_AGENT_MODULES)
+
+
+def __getattr__(name):
+    if name in _AGENT_MODULES:
+        return getattr(import_module(_AGENT_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
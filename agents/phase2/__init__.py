@@ -1,21 +1,21 @@
-from .research_agent import ResearchAgent
-from .research_harvesting_agent import ResearchHarvestingAgent
-from .source_credibility_agent import SourceCredibilityAgent
-from .reference_validation_agent import ReferenceValidationAgent
-from .literature_content_gap_checker_agent import LiteratureContentGapCheckerAgent
-from .source_reliability_agent import SourceReliabilityAgent
-from .source_reliability_scoring_agent import SourceReliabilityScoringAgent
-from .source_reliability_validation_agent import SourceReliabilityValidationAgent
-from .outline_structuring_agent import OutlineStructuringAgent
+from importlib import import_module
 
-__all__ = [
-    "ResearchAgent",
-    "ResearchHarvestingAgent",
-    "SourceCredibilityAgent",
-    "ReferenceValidationAgent",
-    "LiteratureContentGapCheckerAgent",
-    "SourceReliabilityAgent",
-    "SourceReliabilityScoringAgent",
-    "SourceReliabilityValidationAgent",
-    "OutlineStructuringAgent"
-]
+_AGENT_MODULES = {
+    "ResearchAgent": ".research_agent",
+    "ResearchHarvestingAgent": ".research_harvesting_agent",
+    "SourceCredibilityAgent": ".source_credibility_agent",
+    "ReferenceValidationAgent": ".reference_validation_agent",
+    "LiteratureContentGapCheckerAgent": ".literature_content_gap_checker_agent",
+    "SourceReliabilityAgent": ".source_reliability_agent",
+    "SourceReliabilityScoringAgent": ".source_reliability_scoring_agent",
+    "SourceReliabilityValidationAgent": ".source_reliability_validation_agent",
+    "OutlineStructuringAgent": ".outline_structuring_agent",
+}
+
+__all__ = list(_AGENT_MODULES)
+
+
+def __getattr__(name):
+    if name in _AGENT_MODULES:
+        return getattr(import_module(_AGENT_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -18,7 +18,8 @@ class OutlineStructuringAgent(BaseAgent):
             outline.append({
                 "section_title": concept.get("concept", "Untitled Section"),
                 "importance": concept.get("importance", "Medium"),
-                "details": f"Detailed discussion on {concept.get('concept', '')}"
+                "details": f"Detailed discussion on {concept.get('concept', '')}",
+                "key_points": concept.get("key_points", [])
             })
 
         outline_quality = random.uniform(75, 95)
@@ -1,15 +1,18 @@
-from .keyword_extraction import KeywordExtractionAgent
-from .keyword_clustering_agent import KeywordClusteringAgent
-from .keyword_integration_planning_agent import KeywordIntegrationPlanningAgent
-from .seo_roadmapping_agent import SEORoadmappingAgent
-from .semantic_seo_integration_agent import SemanticSEOIntegrationAgent
-from .voice_search_optimization_agent import VoiceSearchOptimizationAgent
-
-__all__ = [
-    "KeywordExtractionAgent",
-    "KeywordClusteringAgent",
-    "KeywordIntegrationPlanningAgent",
-    "SEORoadmappingAgent",
-    "SemanticSEOIntegrationAgent",
-    "VoiceSearchOptimizationAgent"
-]
+from importlib import import_module
+
+_AGENT_MODULES = {
+    "KeywordExtractionAgent": ".keyword_extraction",
+    "KeywordClusteringAgent": ".keyword_clustering_agent",
+    "KeywordIntegrationPlanningAgent": ".keyword_integration_planning_agent",
+    "SEORoadmappingAgent": ".seo_roadmapping_agent",
+    "SemanticSEOIntegrationAgent": ".semantic_seo_integration_agent",
+    "VoiceSearchOptimizationAgent": ".voice_search_optimization_agent",
+}
+
+__all__ = list(_AGENT_MODULES)
+
+
+def __getattr__(name):
+    if name in _AGENT_MODULES:
+        return getattr(import_module(_AGENT_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,23 +1,22 @@
-from .title_generation_agent import TitleGenerationAgent
-from .meta_description_snippet_agent import MetaDescriptionSnippetAgent
-from .meta_snippet_generator_agent import MetaSnippetGeneratorAgent
-from .draft_introduction_agent import DraftIntroductionAgent
-from .section_writing_agent import SectionWritingAgent
-from .section_body_writer_agent import SectionBodyWriterAgent
-from .example_story_integration_agent import ExampleStoryIntegrationAgent
-from .snippet_generator_agent import SnippetGeneratorAgent
-from .scaling_cloning_agent import ScalingCloningAgent
-from .data_quote_insertion_agent import DataQuoteInsertionAgent
+from importlib import import_module
 
-__all__ = [
-    "TitleGenerationAgent",
-    "MetaDescriptionSnippetAgent",
-    "MetaSnippetGeneratorAgent",
-    "DraftIntroductionAgent",
-    "SectionWritingAgent",
-    "SectionBodyWriterAgent",
-    "ExampleStoryIntegrationAgent",
-    "SnippetGeneratorAgent",
-    "ScalingCloningAgent",
-    "DataQuoteInsertionAgent"
-]
+_AGENT_MODULES = {
+    "TitleGenerationAgent": ".title_generation_agent",
+    "MetaDescriptionSnippetAgent": ".meta_description_snippet_agent",
+    "MetaSnippetGeneratorAgent": ".meta_snippet_generator_agent",
+    "DraftIntroductionAgent": ".draft_introduction_agent",
+    "SectionWritingAgent": ".section_writing_agent",
+    "SectionBodyWriterAgent": ".section_body_writer_agent",
+    "ExampleStoryIntegrationAgent": ".example_story_integration_agent",
+    "SnippetGeneratorAgent": ".snippet_generator_agent",
+    "ScalingCloningAgent": ".scaling_cloning_agent",
+    "DataQuoteInsertionAgent": ".data_quote_insertion_agent",
+}
+
+__all__ = list(_AGENT_MODULES)
+
+
+def __getattr__(name):
+    if name in _AGENT_MODULES:
+        return getattr(import_module(_AGENT_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,19 +6,19 @@ class SectionWritingAgent(BaseAgent):
     def __init__(self):
         super().__init__("Section Writing Agent", "Drafting & Content Generation")
 
-async def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-    section_title = input_data.get("section_title", "")
-    key_points = input_data.get("key_points", [])
+    async def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        section_title = input_data.get("section_title", "")
+        key_points = input_data.get("key_points", [])
 
-    # Simulate content generation for the section
-    content = f"Section: {section_title}\n"
-    for idx, point in enumerate(key_points, 1):
-        content += f"{idx}. {point}\n"
+        # Simulate content generation for the section
+        content = f"Section: {section_title}\n"
+        for idx, point in enumerate(key_points, 1):
+            content += f"{idx}. {point}\n"
 
-    quality_score = random.uniform(80, 95)
+        quality_score = random.uniform(80, 95)
 
-    return {
-        "generated_content": content,
-        "quality_score": quality_score,
-        "status": "Section writing complete"
-    }
+        return {
+            "generated_content": content,
+            "quality_score": quality_score,
+            "status": "Section writing complete"
+        }
@@ -1,21 +1,21 @@
-from .clarity_readability_agent import ClarityReadabilityAgent
-from .formatting_agent import FormattingAgent
-from .grammar_checker_agent import GrammarCheckerAgent
-from .human_review_trigger_agent import HumanReviewTriggerAgent
-from .paraphrase_agent import ParaphraseAgent
-from .readability_clarity_agent import ReadabilityClarityAgent
-from .spelling_punctuation_agent import SpellingPunctuationAgent
-from .style_guide_compliance_agent import StyleGuideComplianceAgent
-from .visual_preview_agent import VisualPreviewAgent
+from importlib import import_module
 
-__all__ = [
-    "ClarityReadabilityAgent",
-    "FormattingAgent",
-    "GrammarCheckerAgent",
-    "HumanReviewTriggerAgent",
-    "ParaphraseAgent",
-    "ReadabilityClarityAgent",
-    "SpellingPunctuationAgent",
-    "StyleGuideComplianceAgent",
-    "VisualPreviewAgent"
-]
+_AGENT_MODULES = {
+    "ClarityReadabilityAgent": ".clarity_readability_agent",
+    "FormattingAgent": ".formatting_agent",
+    "GrammarCheckerAgent": ".grammar_checker_agent",
+    "HumanReviewTriggerAgent": ".human_review_trigger_agent",
+    "ParaphraseAgent": ".paraphrase_agent",
+    "ReadabilityClarityAgent": ".readability_clarity_agent",
+    "SpellingPunctuationAgent": ".spelling_punctuation_agent",
+    "StyleGuideComplianceAgent": ".style_guide_compliance_agent",
+    "VisualPreviewAgent": ".visual_preview_agent",
+}
+
+__all__ = list(_AGENT_MODULES)
+
+
+def __getattr__(name):
+    if name in _AGENT_MODULES:
+        return getattr(import_module(_AGENT_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,21 +1,21 @@
-from .ai_hallucination_detection_agent import AIHallucinationDetectionAgent
-from .content_hallucination_detection_agent import ContentHallucinationDetectionAgent
-from .deep_fact_reference_cross_validation_agent import DeepFactReferenceCrossValidationAgent
-from .final_originality_validator_agent import FinalOriginalityValidatorAgent
-from .originality_check_plagiarism_detection_agent import OriginalityCheckPlagiarismDetectionAgent
-from .paraphrase_correction_agent import ParaphraseCorrectionAgent
-from .plagiarism_detection_agent import PlagiarismDetectionAgent
-from .plagiarism_paraphrase_agent import PlagiarismParaphraseAgent
-from .post_publish_hallucination_recheck_agent import PostPublishHallucinationRecheckAgent
+from importlib import import_module
 
-__all__ = [
-    "AIHallucinationDetectionAgent",
-    "ContentHallucinationDetectionAgent",
-    "DeepFactReferenceCrossValidationAgent",
-    "FinalOriginalityValidatorAgent",
-    "OriginalityCheckPlagiarismDetectionAgent",
-    "ParaphraseCorrectionAgent",
-    "PlagiarismDetectionAgent",
-    "PlagiarismParaphraseAgent",
-    "PostPublishHallucinationRecheckAgent"
-]
+_AGENT_MODULES = {
+    "AIHallucinationDetectionAgent": ".ai_hallucination_detection_agent",
+    "ContentHallucinationDetectionAgent": ".content_hallucination_detection_agent",
+    "DeepFactReferenceCrossValidationAgent": ".deep_fact_reference_cross_validation_agent",
+    "FinalOriginalityValidatorAgent": ".final_originality_validator_agent",
+    "OriginalityCheckPlagiarismDetectionAgent": ".originality_check_plagiarism_detection_agent",
+    "ParaphraseCorrectionAgent": ".paraphrase_correction_agent",
+    "PlagiarismDetectionAgent": ".plagiarism_detection_agent",
+    "PlagiarismParaphraseAgent": ".plagiarism_paraphrase_agent",
+    "PostPublishHallucinationRecheckAgent": ".post_publish_hallucination_recheck_agent",
+}
+
+__all__ = list(_AGENT_MODULES)
+
+
+def __getattr__(name):
+    if name in _AGENT_MODULES:
+        return getattr(import_module(_AGENT_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
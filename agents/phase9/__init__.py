@@ -1,11 +1,16 @@
-from .content_monetization_strategy_agent import ContentMonetizationStrategyAgent
-from .ad_placement_agent import AdPlacementAgent
-from .ad_response_monitor_agent import AdResponseMonitorAgent
-from .ad_script_integration_agent import AdScriptIntegrationAgent
-
-__all__ = [
-    "ContentMonetizationStrategyAgent",
-    "AdPlacementAgent",
-    "AdResponseMonitorAgent",
-    "AdScriptIntegrationAgent"
-]
+from importlib import import_module
+
+_AGENT_MODULES = {
+    "ContentMonetizationStrategyAgent": ".content_monetization_strategy_agent",
+    "AdPlacementAgent": ".ad_placement_agent",
+    "AdResponseMonitorAgent": ".ad_response_monitor_agent",
+    "AdScriptIntegrationAgent": ".ad_script_integration_agent",
+}
+
+__all__ = list(_AGENT_MODULES)
+
+
+def __getattr__(name):
+    if name in _AGENT_MODULES:
+        return getattr(import_module(_AGENT_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
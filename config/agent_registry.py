@@ -0,0 +1,212 @@
+"""
+Declarative agent registry: phase name -> dotted paths of its agent classes.
+
+Modules are imported only when their phase first runs (see utils.agent_pool).
+"""
+
+AGENT_REGISTRY = {
+    "Core System & Learning": [
+        "agents.phase0.self_learning_superviser_agent.SelfLearningSuperviserAgent",
+        "agents.phase0.brainstorming_agent.BrainstormingAgent",
+    ],
+    "Ideation & Planning": [
+        "agents.phase1.brand_alignment_agent.BrandAlignmentAgent",
+        "agents.phase1.audience_analysis_agent.AudienceAnalysisAgent",
+        "agents.phase1.audience_persona_agent.AudiencePersonaAgent",
+        "agents.phase1.audience_sentiment_agent.AudienceSentimentAgent",
+        "agents.phase1.competitor_analysis_agent.CompetitorAnalysisAgent",
+        "agents.phase1.context_gathering_agent.ContextGatheringAgent",
+        "agents.phase1.context_history_agent.ContextHistoryAgent",
+        "agents.phase1.ethical_bias_agent.EthicalBiasAgent",
+        "agents.phase1.final_topic_selection_agent.FinalTopicSelectionAgent",
+        "agents.phase1.goal_definition_agent.GoalDefinitionAgent",
+        "agents.phase1.niche_authority_agent.NicheAuthorityAgent",
+        "agents.phase1.regulatory_landscape_agent.RegulatoryLandscapeAgent",
+        "agents.phase1.semantic_gap_agent.SemanticGapAgent",
+        "agents.phase1.topic_generation_agent.TopicGenerationAgent",
+        "agents.phase1.topic_list_monitoring_agent.TopicListMonitoringAgent",
+        "agents.phase1.topic_uniqueness_validation_agent.TopicUniquenessValidationAgent",
+        "agents.phase1.topic_validation_agent.TopicValidationAgent",
+    ],
+    "Research & Structuring": [
+        "agents.phase2.literature_content_gap_checker_agent.LiteratureContentGapCheckerAgent",
+        "agents.phase2.outline_structuring_agent.OutlineStructuringAgent",
+        "agents.phase2.reference_validation_agent.ReferenceValidationAgent",
+        "agents.phase2.research_agent.ResearchAgent",
+        "agents.phase2.research_harvesting_agent.ResearchHarvestingAgent",
+        "agents.phase2.source_credibility_agent.SourceCredibilityAgent",
+        "agents.phase2.source_reliability_agent.SourceReliabilityAgent",
+        "agents.phase2.source_reliability_scoring_agent.SourceReliabilityScoringAgent",
+        "agents.phase2.source_reliability_validation_agent.SourceReliabilityValidationAgent",
+    ],
+    "SEO & Keyword Preparation": [
+        "agents.phase3.keyword_clustering_agent.KeywordClusteringAgent",
+        "agents.phase3.keyword_extraction.KeywordExtractionAgent",
+        "agents.phase3.keyword_integration_planning_agent.KeywordIntegrationPlanningAgent",
+        "agents.phase3.semantic_seo_integration_agent.SemanticSEOIntegrationAgent",
+        "agents.phase3.seo_roadmapping_agent.SEORoadmappingAgent",
+        "agents.phase3.voice_search_optimization_agent.VoiceSearchOptimizationAgent",
+    ],
+    "Drafting & Content Generation": [
+        "agents.phase4.data_quote_insertion_agent.DataQuoteInsertionAgent",
+        "agents.phase4.draft_introduction_agent.DraftIntroductionAgent",
+        "agents.phase4.example_story_integration_agent.ExampleStoryIntegrationAgent",
+        "agents.phase4.meta_description_snippet_agent.MetaDescriptionSnippetAgent",
+        "agents.phase4.meta_snippet_generator_agent.MetaSnippetGeneratorAgent",
+        "agents.phase4.scaling_cloning_agent.ScalingCloningAgent",
+        "agents.phase4.section_body_writer_agent.SectionBodyWriterAgent",
+        "agents.phase4.section_writing_agent.SectionWritingAgent",
+        "agents.phase4.snippet_generator_agent.SnippetGeneratorAgent",
+        "agents.phase4.title_generation_agent.TitleGenerationAgent",
+    ],
+    "Content Enrichment": [
+        "agents.phase5.content_sensitivity_moderation_agent.ContentSensitivityModerationAgent",
+        "agents.phase5.data_stat_insertion_agent.DataStatInsertionAgent",
+        "agents.phase5.dynamic_example_inserter_agent.DynamicExampleInserterAgent",
+        "agents.phase5.image_generation_agent.ImageGenerationAgent",
+        "agents.phase5.image_prompting_agent.ImagePromptingAgent",
+        "agents.phase5.image_resizer_agent.ImageResizerAgent",
+        "agents.phase5.image_resizing_optimization_agent.ImageResizingOptimizationAgent",
+        "agents.phase5.image_rights_agent.ImageRightsAgent",
+        "agents.phase5.image_rights_verification_agent.ImageRightsVerificationAgent",
+        "agents.phase5.interactive_content_embedder_agent.InteractiveContentEmbedderAgent",
+        "agents.phase5.multimedia_embed_agent.MultimediaEmbedAgent",
+        "agents.phase5.poll_popup_suggestion_agent.PollPopupSuggestionAgent",
+        "agents.phase5.quote_curation_agent.QuoteCurationAgent",
+        "agents.phase5.stat_injector_agent.StatInjectorAgent",
+    ],
+    "SEO Optimization & Linking": [
+        "agents.phase6.backlink_health_linkrot_monitor_agent.BacklinkHealthLinkRotMonitorAgent",
+        "agents.phase6.backlink_monitor_agent.BacklinkMonitorAgent",
+        "agents.phase6.backlink_placement_agent.BacklinkPlacementAgent",
+        "agents.phase6.backlink_quality_tracker_agent.BacklinkQualityTrackerAgent",
+        "agents.phase6.broken_link_redirect_monitor_agent.BrokenLinkRedirectMonitorAgent",
+        "agents.phase6.call_to_action_writer_agent.CallToActionWriterAgent",
+        "agents.phase6.internal_external_linking_agent.InternalExternalLinkingAgent",
+        "agents.phase6.keyword_placement_agent.KeywordPlacementAgent",
+        "agents.phase6.meta_data_completion_agent.MetaDataCompletionAgent",
+        "agents.phase6.meta_description_agent.MetaDescriptionAgent",
+        "agents.phase6.ranking_monitor_agent.RankingMonitorAgent",
+        "agents.phase6.rich_snippet_schema_markup_generator_agent.RichSnippetSchemaMarkupGeneratorAgent",
+        "agents.phase6.schema_markup_agent.SchemaMarkupAgent",
+        "agents.phase6.schema_markup_generator_agent.SchemaMarkupGeneratorAgent",
+        "agents.phase6.subheading_agent.SubheadingAgent",
+    ],
+    "Editing & Validation": [
+        "agents.phase7.clarity_readability_agent.ClarityReadabilityAgent",
+        "agents.phase7.formatting_agent.FormattingAgent",
+        "agents.phase7.grammar_checker_agent.GrammarCheckerAgent",
+        "agents.phase7.human_review_trigger_agent.HumanReviewTriggerAgent",
+        "agents.phase7.paraphrase_agent.ParaphraseAgent",
+        "agents.phase7.readability_clarity_agent.ReadabilityClarityAgent",
+        "agents.phase7.spelling_punctuation_agent.SpellingPunctuationAgent",
+        "agents.phase7.style_guide_compliance_agent.StyleGuideComplianceAgent",
+        "agents.phase7.visual_preview_agent.VisualPreviewAgent",
+    ],
+    "Plagiarism & Originality": [
+        "agents.phase8.ai_hallucination_detection_agent.AIHallucinationDetectionAgent",
+        "agents.phase8.content_hallucination_detection_agent.ContentHallucinationDetectionAgent",
+        "agents.phase8.deep_fact_reference_cross_validation_agent.DeepFactReferenceCrossValidationAgent",
+        "agents.phase8.final_originality_validator_agent.FinalOriginalityValidatorAgent",
+        "agents.phase8.originality_check_plagiarism_detection_agent.OriginalityCheckPlagiarismDetectionAgent",
+        "agents.phase8.paraphrase_correction_agent.ParaphraseCorrectionAgent",
+        "agents.phase8.plagiarism_detection_agent.PlagiarismDetectionAgent",
+        "agents.phase8.plagiarism_paraphrase_agent.PlagiarismParaphraseAgent",
+        "agents.phase8.post_publish_hallucination_recheck_agent.PostPublishHallucinationRecheckAgent",
+    ],
+    "Ads & Monetization": [
+        "agents.phase9.ad_placement_agent.AdPlacementAgent",
+        "agents.phase9.ad_response_monitor_agent.AdResponseMonitorAgent",
+        "agents.phase9.ad_script_integration_agent.AdScriptIntegrationAgent",
+        "agents.phase9.content_monetization_strategy_agent.ContentMonetizationStrategyAgent",
+    ],
+    "Scheduling & Publishing": [
+        "agents.phase10.scheduling_agent.SchedulingAgent",
+        "agents.phase10.cms_upload_agent.CMSUploadAgent",
+        "agents.phase10.scheduled_posting_agent.ScheduledPostingAgent",
+        "agents.phase10.publish_timing_agent.PublishTimingAgent",
+        "agents.phase10.publish_timing_conflict_agent.PublishTimingConflictAgent",
+        "agents.phase10.publication_confirmation_agent.PublicationConfirmationAgent",
+        "agents.phase10.formatting_preview_agent.FormattingPreviewAgent",
+        "agents.phase10.final_review_approval_agent.FinalReviewApprovalAgent",
+    ],
+    "Promotion": [
+        "agents.phase11.social_media_generator_agent.SocialMediaGeneratorAgent",
+        "agents.phase11.promotion_generation_agent.PromotionGenerationAgent",
+        "agents.phase11.promotion_scheduler_agent.PromotionSchedulerAgent",
+        "agents.phase11.newsletter_content_generator_agent.NewsletterContentGeneratorAgent",
+    ],
+    "Analytics & Update": [
+        "agents.phase12.analytics_agent.AnalyticsAgent",
+        "agents.phase12.blog_performance_monitoring_agent.BlogPerformanceMonitoringAgent",
+        "agents.phase12.content_relevance_drift_detector_agent.ContentRelevanceDriftDetectorAgent",
+        "agents.phase12.content_update_recommendation_agent.ContentUpdateRecommendationAgent",
+        "agents.phase12.engagement_analytics_agent.EngagementAnalyticsAgent",
+        "agents.phase12.historical_seo_impact_analyzer_agent.HistoricalSEOImpactAnalyzerAgent",
+        "agents.phase12.publishing_report_agent.PublishingReportAgent",
+        "agents.phase12.seo_performance_tracker_agent.SEOPerformanceTrackerAgent",
+        "agents.phase12.update_rewrite_suggestion_agent.UpdateRewriteSuggestionAgent",
+        "agents.phase12.update_suggestion_agent.UpdateSuggestionAgent",
+    ],
+    "Chatbot & Feedback": [
+        "agents.phase13.chatbot_agent.ChatbotAgent",
+        "agents.phase13.feedback_analysis_agent.FeedbackAnalysisAgent",
+        "agents.phase13.feedback_moderation_agent.FeedbackModerationAgent",
+        "agents.phase13.feedback_iteration_agent.FeedbackIterationAgent",
+        "agents.phase13.chatbot_analytics_agent.ChatbotAnalyticsAgent",
+        "agents.phase13.feedback_popup_agent.FeedbackPopupAgent",
+        "agents.phase13.poll_comment_agent.PollCommentAgent",
+        "agents.phase13.review_collection_agent.ReviewCollectionAgent",
+    ],
+    "Quality Assurance & Compliance": [
+        "agents.phase14.human_in_loop_review_agent.HumanInTheLoopReviewAgent",
+        "agents.phase14.accessibility_compliance_agent.AccessibilityComplianceAgent",
+        "agents.phase14.accessibility_review_agent.AccessibilityReviewAgent",
+        "agents.phase14.bias_inclusive_language_agent.BiasInclusiveLanguageAgent",
+        "agents.phase14.compliance_agent.ComplianceAgent",
+        "agents.phase14.compliance_snapshot_agent.ComplianceSnapshotAgent",
+        "agents.phase14.privacy_data_minimization_agent.PrivacyDataMinimizationAgent",
+        "agents.phase14.regulatory_compliance_agent.RegulatoryComplianceAgent",
+        "agents.phase14.regulatory_compliance_duplicate_agent.RegulatoryComplianceDuplicateAgent",
+    ],
+    "Content Acquisition & Cloning": [
+        "agents.phase15.content_parsing_segmentation_agent.ContentParsingSegmentationAgent",
+        "agents.phase15.content_rewriting_paraphrasing_agent.ContentRewritingParaphrasingAgent",
+        "agents.phase15.url_content_extraction_agent.URLContentExtractionAgent",
+    ],
+    "Safety, Security & Monitoring": [
+        "agents.phase16.security_review_agent.SecurityReviewAgent",
+        "agents.phase16.broken_media_asset_recovery_agent.BrokenMediaAssetRecoveryAgent",
+        "agents.phase16.content_tamper_detection_agent.ContentTamperDetectionAgent",
+        "agents.phase16.internal_crawlability_indexation_tester_agent.InternalCrawlabilityIndexationTesterAgent",
+        "agents.phase16.live_post_health_agent.LivePostHealthAgent",
+        "agents.phase16.negative_seo_malicious_spam_detection_agent.NegativeSEOMaliciousSpamDetectionAgent",
+        "agents.phase16.search_engine_algorithm_change_monitor_agent.SearchEngineAlgorithmChangeMonitorAgent",
+        "agents.phase16.tamper_detection_agent.TamperDetectionAgent",
+        "agents.phase16.traffic_spike_anomaly_response_agent.TrafficSpikeAnomalyResponseAgent",
+        "agents.phase16.user_session_journey_analysis_agent.UserSessionJourneyAnalysisAgent",
+    ],
+    "Editorial Management & Collaboration": [
+        "agents.phase17.change_suggestion_aggregator_agent.ChangeSuggestionAggregatorAgent",
+        "agents.phase17.editorial_workflow_agent.EditorialWorkflowAgent",
+        "agents.phase17.peer_review_collaborative_editing_agent.PeerReviewCollaborativeEditingAgent",
+    ],
+    "Auxiliary/Support": [
+        "agents.phase18.tag_fixing_agent.TagFixingAgent",
+        "agents.phase18.table_chart_generator_agent.TableChartGeneratorAgent",
+        "agents.phase18.incremental_function_agent.IncrementalFunctionAgent",
+        "agents.phase18.localization_agent.LocalizationAgent",
+        "agents.phase18.sentiment_analysis_agent.SentimentAnalysisAgent",
+        "agents.phase18.semantic_consistency_validator_agent.SemanticConsistencyValidatorAgent",
+        "agents.phase18.ux_journey_simulator_agent.UXJourneySimulatorAgent",
+        "agents.phase18.content_gap_checker_agent.ContentGapCheckerAgent",
+        "agents.phase18.content_increment_agent.ContentIncrementAgent",
+        "agents.phase18.content_localization_cultural_adaptation_agent.ContentLocalizationCulturalAdaptationAgent",
+        "agents.phase18.fact_updater_agent.FactUpdaterAgent",
+        "agents.phase18.increment_function_agent.IncrementFunctionAgent",
+        "agents.phase18.social_proof_collector_agent.SocialProofCollectorAgent",
+        "agents.phase18.table_generator_agent.TableGeneratorAgent",
+        "agents.phase18.table_formatter_agent.TableFormatterAgent",
+        "agents.phase18.tag_checker_agent.TagCheckerAgent",
+    ],
+}
@@ -15,6 +15,16 @@ SETTINGS = {
     # Agent Configuration
     "MAX_CONCURRENT_AGENTS": 10,
     "AGENT_TIMEOUT_SECONDS": 120,
+    "PHASE_TIMEOUT_SECONDS": 300,
+    "PIPELINE_TIMEOUT_SECONDS": 1200,
+    "PREWARM_AGENT_PHASES": [],  # Phases whose agents are imported at startup
+
+    # Background Jobs
+    "MAX_CONCURRENT_JOBS": 4,
+    "JOB_QUEUE_SIZE": 100,
+    "TASK_RECORDER_BATCH_SIZE": 200,  # Agent results written per transaction
+    "TASK_RECORDER_FLUSH_SECONDS": 2.0,
+    "TASK_RECORDER_MAX_BUFFER": 5000,  # Oldest results are dropped beyond this
     "DEFAULT_CONTENT_LENGTH": "1500-2000",
 
     # Blog Defaults
@@ -27,8 +37,25 @@ SETTINGS = {
 
     # Performance Settings
     "CACHE_DURATION": 3600,  # 1 hour
+    "LLM_CACHE_MAX_ENTRIES": 256,  # In-memory tier
+    "LLM_CACHE_PURGE_INTERVAL": 600,  # Seconds between deletes of expired SQLite rows, run on write
     "MAX_RETRIES": 3,
     "REQUEST_TIMEOUT": 30,
+    "GEMINI_MAX_CONCURRENCY": int(os.getenv("GEMINI_MAX_CONCURRENCY", "3")),  # In-flight image generations
+    "GEMINI_MIN_INTERVAL_SECONDS": float(os.getenv("GEMINI_MIN_INTERVAL_SECONDS", "0.2")),  # Between request starts
+    "SECTION_MAX_CONCURRENCY": int(os.getenv("SECTION_MAX_CONCURRENCY", "4")),  # H2 sections written at once
+    "EXPORT_IMAGE_CONCURRENCY": int(os.getenv("EXPORT_IMAGE_CONCURRENCY", "6")),  # Images fetched before layout
+    "HTTP_MAX_CONNECTIONS": 20,  # Pooled outbound connections across all hosts
+    "HTTP_MAX_CONNECTIONS_PER_HOST": 6,
+    "PEXELS_CACHE_TTL": 3600,  # Search results per query/page/orientation
+    "PEXELS_CACHE_MAX_ENTRIES": 512,
+    "PEXELS_RATE_LIMIT_RESERVE": 20,  # Start spacing calls out below this many remaining
+    "PEXELS_MAX_THROTTLE_SECONDS": 5,
+    "IMAGE_CACHE_MAX_MEMORY_MB": 64,  # Processed export images; the disk tier expires by age
+    "IMAGE_CACHE_TTL": 7 * 24 * 3600,
+    "RENDER_WORKERS": 3,  # Export rendering processes
+    "RENDER_TIMEOUT_SECONDS": 60,
+    "RENDER_MEMORY_LIMIT_MB": 2048,  # Address-space cap per worker; 0 disables
 
     # Content Quality
     "MIN_READABILITY_SCORE": 70,
@@ -39,6 +66,7 @@ SETTINGS = {
     "UPLOAD_FOLDER": "data/uploads",
     "OUTPUT_FOLDER": "data/output",
     "LOG_FOLDER": "data/logs",
+    "IMAGE_CACHE_FOLDER": "data/cache/images",
 
     # Social Media
     "GENERATE_SOCIAL_POSTS": True,
@@ -13,29 +13,41 @@ API keys are loaded ONLY from environment (.env), not from frontend.
 import os
 import json
 import re
-import time
 import base64
 import traceback
 import asyncio
-from io import BytesIO
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator, Callable, Awaitable
 
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response, JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response, JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
-import requests
-from fpdf import FPDF
-from docx import Document
-from docx.shared import Pt, RGBColor, Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from PIL import Image
-from groq import Groq
+from groq import AsyncGroq
 import google.generativeai as genai
 
+from agents.phase2.outline_structuring_agent import OutlineStructuringAgent
+from config.settings import SETTINGS
+from utils.agent_manager import AgentManager
+from utils.agent_pool import agent_pool
+from utils.async_database import db
+from utils.http_client import http_client
+from utils.image_cache import image_cache
+from utils.exporters import (
+    EXPORT_FORMATS, HTML_IMAGE_MODES, IMAGE_REQUEST_HEADERS, build_zip, html_image_files, html_image_sources,
+    iter_html, normalize_image, read_image_source, render_export,
+)
+from utils.markdown_blocks import parse_markdown
+from utils.job_queue import JobQueue, QueueFullError
+from utils.llm_cache import llm_cache
+from utils.pexels_api import pexels_api
+from utils.render_pool import render_pool, RenderError
+from utils.single_flight import SingleFlight
+from utils.task_recorder import task_recorder
+
 # =========================================================
 # ENV + APP BOOTSTRAP
 # =========================================================
@@ -64,6 +76,35 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+agent_manager = AgentManager()
+job_queue = JobQueue()
+
+
+@app.on_event("startup")
+async def init_storage():
+    """
+    Create/upgrade the SQLite schema and drop expired LLM cache entries and images.
+    """
+    await db.init_db()
+    purged = await llm_cache.purge_expired()
+    if purged:
+        print(f"Purged {purged} expired LLM cache entries")
+    purged = await asyncio.to_thread(image_cache.purge_expired)
+    if purged:
+        print(f"Purged {purged} expired cached images")
+
+
+@app.on_event("startup")
+async def prewarm_agents():
+    """
+    Import agent modules of the configured phases before the first request.
+    Every other phase is imported lazily the first time it runs.
+    """
+    phases = SETTINGS["PREWARM_AGENT_PHASES"]
+    if phases:
+        loaded = agent_pool.prewarm(phases)
+        print(f"Prewarmed {loaded} agents for {len(phases)} phases")
+
 
 # =========================================================
 # Pydantic Models
@@ -85,6 +126,8 @@ class BlogGenerationRequest(BaseModel):
     numAiImages: int = 3
     usePexels: bool = False
     numPexelsImages: int = 2
+    useCache: bool = True  # Reuse cached LLM output for identical prompts
+    parallelSections: bool = False  # Outline first, then write H2 sections concurrently
 
 
 class BlogGenerationResponse(BaseModel):
@@ -106,6 +149,30 @@ class ExportRequest(BaseModel):
     images: List[str] = []
     imageDescriptions: List[str] = []
     metaInfo: Dict[str, Any] = {}
+    imageMode: str = "original"  # HTML only: "original", "inline" or "files"
+
+
+class ExportBundleRequest(BaseModel):
+    title: str
+    content: str
+    formats: List[str] = ["pdf", "docx", "html"]
+    images: List[str] = []
+    imageDescriptions: List[str] = []
+    metaInfo: Dict[str, Any] = {}
+    imageMode: str = "original"  # HTML only: "original", "inline" or "files"
+
+
+class PipelineJobRequest(BaseModel):
+    topic: str
+    targetAudience: str = "general"
+    tone: str = "professional"
+    length: str = "1500-2000"
+    keywords: str = ""
+
+
+class JobSubmitResponse(BaseModel):
+    jobId: int
+    status: str
 
 
 # For dashboard-style endpoints
@@ -127,21 +194,109 @@ class AgentInfo(BaseModel):
 # LLM / Image Helpers (Groq + Gemini + Pexels)
 # =========================================================
 
+GROQ_MODEL = "llama-3.1-8b-instant"
+
+_groq_client: Optional[AsyncGroq] = None
+
+# Identical concurrent completions / generation requests share one upstream call
+completion_flight = SingleFlight()
+blog_generation_flight = SingleFlight()
+
+
 def get_groq_client():
     """
-    Return a Groq client using GROQ_API_KEY from environment.
+    Return the shared async Groq client using GROQ_API_KEY from environment.
+    One client per process keeps its HTTP connections alive between requests,
+    and awaiting it never blocks the event loop.
     """
+    global _groq_client
+
     api_key = ENV_GROQ_API_KEY
     if not api_key:
         return None, "GROQ_API_KEY not set in environment (.env)"
+    if _groq_client is not None:
+        return _groq_client, None
     try:
-        client = Groq(api_key=api_key)
-        return client, None
+        _groq_client = AsyncGroq(api_key=api_key)
+        return _groq_client, None
     except Exception as e:
         return None, f"Failed to initialize Groq client: {e}"
 
 
-def generate_blog_with_llm(
+async def close_groq_client():
+    global _groq_client
+    if _groq_client is not None:
+        await _groq_client.close()
+        _groq_client = None
+
+
+async def create_chat_completion(
+    client: AsyncGroq,
+    messages: List[Dict[str, str]],
+    temperature: float,
+    max_tokens: int,
+    use_cache: bool = True,
+    parse: Optional[Callable[[str], Any]] = None,
+) -> Any:
+    """
+    Run a Groq chat completion through the LLM response cache.
+    Identical messages/model/temperature/max_tokens reuse the stored text,
+    and identical calls already in flight are joined instead of repeated.
+
+    With ``parse``, the parsed text is returned instead, and text that fails
+    to parse is raised to the caller without being cached, so retrying an
+    identical request asks the model again.
+    """
+    key = llm_cache.make_key(GROQ_MODEL, messages, temperature, max_tokens)
+
+    async def complete() -> str:
+        response = await client.chat.completions.create(
+            model=GROQ_MODEL,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        content = response.choices[0].message.content
+        if parse is not None:
+            parse(content)
+        if use_cache and content:
+            await llm_cache.set(key, content)
+        return content
+
+    if not use_cache:
+        content = await complete()
+    else:
+        content = await llm_cache.get(key)
+        if content is not None and parse is not None:
+            try:
+                return parse(content)
+            except Exception:
+                content = None  # Cached before validation existed; replace it
+        if content is None:
+            content = await completion_flight.do(key, complete)
+
+    return parse(content) if parse is not None else content
+
+
+def parse_json_list(content: str) -> List[str]:
+    """Parse an LLM reply that must be a JSON array of strings"""
+    value = json.loads(content.strip())
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValueError("Expected a JSON array of strings")
+    return value
+
+
+def parse_outline_plan(content: str) -> Dict[str, Any]:
+    """Parse the JSON object of an outline plan; it must contain at least one section heading"""
+    plan = json.loads(content[content.find("{"):content.rfind("}") + 1])
+    if not isinstance(plan, dict) or not any(
+        isinstance(section, dict) and section.get("heading") for section in plan.get("sections") or []
+    ):
+        raise ValueError("Outline plan has no sections")
+    return plan
+
+
+def build_blog_messages(
     topic: str,
     category: str,
     niche: str,
@@ -153,15 +308,11 @@ def generate_blog_with_llm(
     length: str,
     writing_style: str,
     additional_context: str = "",
-) -> str:
+) -> List[Dict[str, str]]:
     """
-    Use Groq (Llama-3.1) to generate a full blog in markdown-style text.
-    Mirrors your Streamlit app logic.
+    Build the chat messages for full blog generation.
+    Shared by the blocking and the streaming generation paths.
     """
-    client, err = get_groq_client()
-    if err:
-        raise RuntimeError(err)
-
     length_hint = {
         "Short (800-1000 words)": "around 800-1000 words",
         "Medium (2000-2500 words)": "around 2000-2500 words",
@@ -194,40 +345,342 @@ Additional Context:
 {additional_context or "No extra context."}
 """
 
-    response = client.chat.completions.create(
-        model="llama-3.1-8b-instant",
-        messages=[
-            {
-                "role": "system",
-                "content": (
-                    "You are a world-class blog writer and SEO expert. "
-                    "Use clean markdown headings, bold/italic, lists. "
-                    "Avoid using separator-only lines like ====, ----, ****, ___."
-                ),
-            },
-            {"role": "user", "content": prompt},
-        ],
+    return [
+        {
+            "role": "system",
+            "content": (
+                "You are a world-class blog writer and SEO expert. "
+                "Use clean markdown headings, bold/italic, lists. "
+                "Avoid using separator-only lines like ====, ----, ****, ___."
+            ),
+        },
+        {"role": "user", "content": prompt},
+    ]
+
+
+def blog_llm_kwargs(request: BlogGenerationRequest) -> Dict[str, str]:
+    """
+    Map a BlogGenerationRequest onto generate_blog_with_llm / build_blog_messages arguments.
+    """
+    return {
+        "topic": request.topic,
+        "category": request.category,
+        "niche": request.niche,
+        "keywords": request.keywords,
+        "target_audience": request.targetAudience,
+        "content_intent": request.contentIntent,
+        "expertise_level": request.expertiseLevel,
+        "tone": request.tone,
+        "length": request.length,
+        "writing_style": request.writingStyle,
+        "additional_context": request.additionalContext,
+    }
+
+
+async def generate_blog_with_llm(
+    topic: str,
+    category: str,
+    niche: str,
+    keywords: str,
+    target_audience: str,
+    content_intent: str,
+    expertise_level: str,
+    tone: str,
+    length: str,
+    writing_style: str,
+    additional_context: str = "",
+    use_cache: bool = True,
+) -> str:
+    """
+    Use Groq (Llama-3.1) to generate a full blog in markdown-style text.
+    Mirrors your Streamlit app logic.
+    """
+    client, err = get_groq_client()
+    if err:
+        raise RuntimeError(err)
+
+    messages = build_blog_messages(
+        topic, category, niche, keywords, target_audience, content_intent,
+        expertise_level, tone, length, writing_style, additional_context,
+    )
+    return await create_chat_completion(client, messages, 0.7, 8000, use_cache)
+
+
+def target_word_count(length: str) -> int:
+    """
+    Midpoint of the word range in a length label, e.g. "Long (3500-4000 words)" -> 3750.
+    """
+    numbers = [int(n) for n in re.findall(r"\d+", length or "")]
+    if not numbers:
+        return 3000
+    return sum(numbers[:2]) // len(numbers[:2])
+
+
+def as_string_list(value: Any) -> List[str]:
+    """
+    Coerce an LLM-provided list field to a list of non-empty strings.
+    A bare string becomes a one-item list; any other non-list is dropped.
+    """
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list):
+        return []
+    return [str(item).strip() for item in value if item is not None and str(item).strip()]
+
+
+async def generate_blog_outline(
+    topic: str,
+    keywords: str,
+    target_audience: str,
+    content_intent: str,
+    expertise_level: str,
+    length: str,
+    additional_context: str = "",
+    use_cache: bool = True,
+) -> Dict[str, Any]:
+    """
+    Plan a blog as a title plus ordered H2 sections.
+    The LLM proposes the sections; OutlineStructuringAgent turns them into the outline.
+
+    Returns:
+        {"title": str, "sections": [{"section_title", "importance", "details", "key_points"}]}
+    """
+    client, err = get_groq_client()
+    if err:
+        raise RuntimeError(err)
+
+    num_sections = max(4, min(10, target_word_count(length) // 500))
+    prompt = f"""
+Plan a blog article about "{topic}".
+
+Primary Keywords: {keywords or "Not specified"}
+Audience: {target_audience}
+Intent: {content_intent}
+Expertise Level: {expertise_level}
+Additional Context: {additional_context or "No extra context."}
+
+Return ONLY a JSON object:
+{{"title": "H1 title", "sections": [{{"heading": "H2 heading", "importance": "High|Medium|Low", "key_points": ["point", "point"]}}]}}
+
+Use {num_sections} sections in reading order. The first section introduces the topic and the last one concludes it.
+"""
+    messages = [
+        {"role": "system", "content": "You are an expert content strategist who plans well-structured articles."},
+        {"role": "user", "content": prompt},
+    ]
+    plan = await create_chat_completion(client, messages, 0.4, 1500, use_cache, parse=parse_outline_plan)
+
+    key_concepts = [
+        {
+            "concept": section.get("heading", ""),
+            "importance": section.get("importance", "Medium"),
+            "key_points": as_string_list(section.get("key_points")),
+        }
+        for section in plan["sections"]
+        if isinstance(section, dict) and section.get("heading")
+    ]
+
+    agent = agent_pool.get(OutlineStructuringAgent)
+    outcome = await agent.run({"topic": topic, "research_findings": {"key_concepts": key_concepts}})
+    if outcome.get("status") != "success":
+        raise RuntimeError(outcome.get("error", "Outline structuring failed"))
+
+    return {
+        "title": plan.get("title") or f"{topic}: A Comprehensive Guide",
+        "sections": outcome["result"]["outline"],
+    }
+
+
+async def generate_blog_section(
+    client: AsyncGroq,
+    topic: str,
+    title: str,
+    section: Dict[str, Any],
+    headings: List[str],
+    words: int,
+    tone: str,
+    writing_style: str,
+    target_audience: str,
+    expertise_level: str,
+    keywords: str,
+    use_cache: bool = True,
+) -> str:
+    """
+    Write one H2 section of an outlined blog in markdown.
+    """
+    heading = section["section_title"]
+    points = "\n".join(f"- {point}" for point in as_string_list(section.get("key_points"))) or "- Cover the heading thoroughly"
+    prompt = f"""
+You are writing ONE section of the blog article "{title}" (topic: {topic}).
+
+Full outline, for context only:
+{chr(10).join(f"{i + 1}. {h}" for i, h in enumerate(headings))}
+
+Write ONLY the section "{heading}":
+- Start with the line "## {heading}"
+- Use H3 subheadings, bullet or numbered lists where helpful
+- Around {words} words
+- Do not repeat material that belongs to other sections
+- No H1 title, no separator lines like "====" or "----"
+
+Points to cover:
+{points}
+
+Audience: {target_audience}
+Expertise Level: {expertise_level}
+Tone: {tone}
+Writing Style: {writing_style}
+Primary Keywords: {keywords or "Not specified"}
+"""
+    messages = [
+        {
+            "role": "system",
+            "content": (
+                "You are a world-class blog writer and SEO expert. "
+                "Use clean markdown headings, bold/italic, lists. "
+                "Avoid using separator-only lines like ====, ----, ****, ___."
+            ),
+        },
+        {"role": "user", "content": prompt},
+    ]
+    content = (await create_chat_completion(client, messages, 0.7, min(4000, words * 2 + 300), use_cache)).strip()
+    if not content.startswith("## "):
+        content = f"## {heading}\n\n{content}"
+    return content
+
+
+async def generate_sectioned_blog_with_llm(
+    topic: str,
+    category: str,
+    niche: str,
+    keywords: str,
+    target_audience: str,
+    content_intent: str,
+    expertise_level: str,
+    tone: str,
+    length: str,
+    writing_style: str,
+    additional_context: str = "",
+    use_cache: bool = True,
+) -> str:
+    """
+    Outline first, then write every H2 section concurrently and stitch them in order.
+    Wall time is roughly the outline plus the slowest section instead of one long
+    completion. Falls back to single-pass generation if no usable outline comes back
+    or every section fails. A section that fails twice is replaced by its heading
+    and key points, so one bad completion does not discard the others.
+    """
+    client, err = get_groq_client()
+    if err:
+        raise RuntimeError(err)
+
+    try:
+        outline = await generate_blog_outline(
+            topic, keywords, target_audience, content_intent, expertise_level,
+            length, additional_context, use_cache,
+        )
+    except Exception as e:
+        print(f"Outline generation failed, writing in a single pass: {e}")
+        outline = {"sections": []}
+
+    sections = outline["sections"]
+    if len(sections) < 2:
+        return await generate_blog_with_llm(
+            topic, category, niche, keywords, target_audience, content_intent,
+            expertise_level, tone, length, writing_style, additional_context, use_cache,
+        )
+
+    headings = [section["section_title"] for section in sections]
+    words = max(200, target_word_count(length) // len(sections))
+    semaphore = asyncio.Semaphore(SETTINGS["SECTION_MAX_CONCURRENCY"])
+
+    async def write(section: Dict[str, Any]) -> Optional[str]:
+        for attempt in range(2):
+            try:
+                async with semaphore:
+                    return await generate_blog_section(
+                        client, topic, outline["title"], section, headings, words, tone,
+                        writing_style, target_audience, expertise_level, keywords, use_cache,
+                    )
+            except Exception as e:
+                print(f"Section '{section['section_title']}' failed (attempt {attempt + 1}): {e}")
+        return None
+
+    bodies = await asyncio.gather(*(write(section) for section in sections))
+    if all(body is None for body in bodies):
+        return await generate_blog_with_llm(
+            topic, category, niche, keywords, target_audience, content_intent,
+            expertise_level, tone, length, writing_style, additional_context, use_cache,
+        )
+
+    for i, body in enumerate(bodies):
+        if body is None:
+            points = "\n".join(f"- {point}" for point in as_string_list(sections[i].get("key_points")))
+            bodies[i] = f"## {sections[i]['section_title']}\n\n{points}".rstrip()
+    return f"# {outline['title']}\n\n" + "\n\n".join(bodies)
+
+
+async def stream_blog_with_llm(messages: List[Dict[str, str]], use_cache: bool = True) -> AsyncIterator[str]:
+    """
+    Stream blog text from Groq, yielding content deltas as they arrive.
+    A cached completion is yielded as a single chunk; a fully streamed one is cached.
+    Closing the generator early closes the upstream connection.
+    """
+    client, err = get_groq_client()
+    if err:
+        raise RuntimeError(err)
+
+    key = llm_cache.make_key(GROQ_MODEL, messages, 0.7, 8000)
+    if use_cache:
+        cached = await llm_cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+    stream = await client.chat.completions.create(
+        model=GROQ_MODEL,
+        messages=messages,
         temperature=0.7,
         max_tokens=8000,
+        stream=True,
     )
+    chunks: List[str] = []
+    try:
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                chunks.append(delta)
+                yield delta
+    finally:
+        await stream.close()
 
-    return response.choices[0].message.content
+    if use_cache and chunks:
+        await llm_cache.set(key, "".join(chunks))
+
+
+_gemini_model = None
+_gemini_semaphore = asyncio.Semaphore(SETTINGS["GEMINI_MAX_CONCURRENCY"])
+_gemini_next_start = 0.0
 
 
 def get_gemini_model():
     """
-    Return a Gemini image model using GEMINI_API_KEY from environment.
+    Return the shared Gemini image model using GEMINI_API_KEY from environment.
     Uses models/gemini-2.5-flash-image like your app2.py.
     """
+    global _gemini_model
+
     api_key = ENV_GEMINI_API_KEY
     if not api_key:
         return None
+    if _gemini_model is not None:
+        return _gemini_model
 
     try:
         genai.configure(api_key=api_key)
         # Same as your working script: image model
-        model = genai.GenerativeModel("models/gemini-2.5-flash-image")
-        return model
+        _gemini_model = genai.GenerativeModel("models/gemini-2.5-flash-image")
+        return _gemini_model
     except Exception as e:
         print(f"Failed to initialize Gemini model: {e}")
         return None
@@ -263,16 +716,33 @@ def extract_gemini_image_bytes(response):
         return None
 
 
-def generate_gemini_image(prompt: str) -> Optional[str]:
+async def wait_for_gemini_slot():
+    """
+    Space out Gemini request starts by GEMINI_MIN_INTERVAL_SECONDS (process-wide).
+    """
+    global _gemini_next_start
+
+    loop = asyncio.get_running_loop()
+    now = loop.time()
+    start = max(now, _gemini_next_start)
+    _gemini_next_start = start + SETTINGS["GEMINI_MIN_INTERVAL_SECONDS"]
+    if start > now:
+        await asyncio.sleep(start - now)
+
+
+async def generate_gemini_image(prompt: str) -> Optional[str]:
     """
     Generate an image with Gemini and return a data URL (data:image/png;base64,...)
+    At most GEMINI_MAX_CONCURRENCY calls are in flight across all requests.
     """
     model = get_gemini_model()
     if not model:
         return None
 
     try:
-        response = model.generate_content(prompt)
+        async with _gemini_semaphore:
+            await wait_for_gemini_slot()
+            response = await model.generate_content_async(prompt)
         image_bytes = extract_gemini_image_bytes(response)
 
         if not image_bytes:
@@ -289,33 +759,33 @@ def generate_gemini_image(prompt: str) -> Optional[str]:
         return None
 
 
-def fetch_pexels_images(query: str, num_images: int = 3) -> List[str]:
+async def generate_gemini_images(prompts: List[str]) -> List[Optional[str]]:
+    """
+    Generate one image per prompt concurrently.
+    Returns data URLs in prompt order, with None for images that failed.
+    """
+    results = await asyncio.gather(
+        *(generate_gemini_image(p) for p in prompts), return_exceptions=True
+    )
+    return [r if isinstance(r, str) else None for r in results]
+
+
+async def fetch_pexels_images(query: str, num_images: int = 3) -> List[str]:
     """
     Fetch image URLs from Pexels API based on query.
     Returns a list of image URLs (landscape images).
     """
-    api_key = ENV_PEXELS_API_KEY
-    if not api_key:
+    if not ENV_PEXELS_API_KEY:
         return []
 
-    try:
-        url = "https://api.pexels.com/v1/search"
-        headers = {"Authorization": api_key}
-        params = {"query": query, "per_page": num_images, "orientation": "landscape"}
-        resp = requests.get(url, headers=headers, params=params, timeout=10)
-
-        if resp.status_code != 200:
-            return []
-
-        data = resp.json()
-        photos = data.get("photos", [])
-        image_urls = [p["src"]["large"] for p in photos if "src" in p and "large" in p["src"]]
-        return image_urls
-    except Exception:
-        return []
+    data = await pexels_api.search_images(
+        query, per_page=num_images, orientation="landscape", mock_fallback=False
+    )
+    photos = data.get("photos", [])
+    return [p["src"]["large"] for p in photos if "src" in p and "large" in p["src"]]
 
 
-def generate_image_prompts(topic: str, num_prompts: int = 3) -> List[str]:
+async def generate_image_prompts(topic: str, num_prompts: int = 3, use_cache: bool = True) -> List[str]:
     """
     Generate relevant image prompts based on the blog topic using LLM.
     """
@@ -336,25 +806,17 @@ Example: ["prompt 1", "prompt 2", "prompt 3"]
 """
 
     try:
-        response = client.chat.completions.create(
-            model="llama-3.1-8b-instant",
-            messages=[
-                {"role": "system", "content": "You are an expert at creating image generation prompts."},
-                {"role": "user", "content": prompt},
-            ],
-            temperature=0.8,
-            max_tokens=500,
-        )
-
-        content = response.choices[0].message.content.strip()
-        prompts = json.loads(content)
-        return prompts if isinstance(prompts, list) else []
+        messages = [
+            {"role": "system", "content": "You are an expert at creating image generation prompts."},
+            {"role": "user", "content": prompt},
+        ]
+        return await create_chat_completion(client, messages, 0.8, 500, use_cache, parse=parse_json_list)
     except Exception as e:
         print(f"Could not generate image prompts: {e}")
         return []
 
 
-def generate_image_captions_from_prompts(topic: str, prompts: List[str]) -> List[str]:
+async def generate_image_captions_from_prompts(topic: str, prompts: List[str], use_cache: bool = True) -> List[str]:
     """
     Convert detailed prompts into short figure captions (max 8 words).
     """
@@ -389,17 +851,11 @@ Prompts:
 """
 
     try:
-        resp = client.chat.completions.create(
-            model="llama-3.1-8b-instant",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            temperature=0.3,
-            max_tokens=300,
-        )
-
-        captions = json.loads(resp.choices[0].message.content.strip())
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+        captions = await create_chat_completion(client, messages, 0.3, 300, use_cache, parse=parse_json_list)
         clean_caps = []
         for c in captions:
             c = re.sub(r"[^\w\s]", "", c).strip()
@@ -414,604 +870,62 @@ Prompts:
         return fallback
 
 
-# =========================================================
-# Text Cleaning Helpers
-# =========================================================
-
-def clean_text(text: str) -> str:
-    """Remove emojis & unsupported chars for PDF safety."""
-    return re.sub(r"[^\x00-\x7F]+", " ", text)
-
-
-def clean_separator_lines(text: str) -> str:
-    """Remove separator lines like ====, ----, ___, ****."""
-    lines = text.split("\n")
-    cleaned = []
-    for line in lines:
-        stripped = line.strip()
-        if stripped and all(c in "=-_*#" for c in stripped):
-            continue
-        cleaned.append(line)
-    return "\n".join(cleaned)
-
-
-def clean_markdown_formatting(text: str) -> str:
+async def get_ai_image_prompts(topic: str, num_images: int, use_cache: bool = True) -> List[str]:
     """
-    Remove markdown formatting like **bold**, *italic*, and leading # from headings.
+    Prefer the structured infographic/flowchart prompts; fall back to LLM-generated ones.
     """
-    text = re.sub(r"\*\*(.*?)\*\*", r"\1", text)
-    text = re.sub(r"(?<!\*)\*(?!\*)([^*]+?)\*(?!\*)", r"\1", text)
-    text = re.sub(r"^\s*#{1,6}\s*", "", text)
-    return text
+    image_prompts = [
+        f"{topic} infographic, clean layout, labeled sections, icons, flat vector design, pastel colors, corporate look, boxes with labels, arrows showing relationships, modern UI infographic, high resolution",
+        f"{topic} overview infographic, blocks with titles, arrows, minimal flow structure, flat modern vector style, pastel theme",
+        f"{topic} visual summary infographic, simplified labeled blocks, icons, modern flat UI, clean corporate infographic style",
+        f"{topic} flowchart diagram, rectangular blocks with labels, arrows between steps, white background, thin lines, flat vector style, professional process diagram",
+        f"{topic} decision flowchart, diamond decision nodes, labeled rectangles, directional arrows, minimal pastel colors, clean schematic diagram",
+        f"{topic} process flowchart, linear step-by-step boxes, arrows connecting each stage, modern vector workflow diagram",
+    ][:num_images]
 
-
-def sanitize_caption(caption: str, max_words: int = 8) -> str:
-    caption = re.sub(r"[^\w\s]", " ", caption)
-    caption = re.sub(r"\s+", " ", caption).strip()
-
-    words = caption.split()
-    if not words:
-        return "Image"
-
-    words = words[:max_words]
-    words = [w[:20] for w in words]
-    return " ".join(words)
+    if not image_prompts:
+        image_prompts = await generate_image_prompts(topic, num_images, use_cache)
+    return image_prompts
 
 
 # =========================================================
-# PDF / DOCX / HTML generation (from your app2.py)
+# Export image prefetch (rendering lives in utils/exporters.py, run in utils/render_pool.py)
 # =========================================================
 
-def add_image_to_pdf(pdf: FPDF, img_url_or_path: str, max_width: int = 160, caption: str = "") -> bool:
-    try:
-        # Load image
-        if img_url_or_path.startswith("data:image"):
-            header, b64data = img_url_or_path.split(",", 1)
-            img = Image.open(BytesIO(base64.b64decode(b64data)))
-        elif img_url_or_path.startswith("http"):
-            headers = {"User-Agent": "Mozilla/5.0"}
-            resp = requests.get(img_url_or_path, timeout=20, stream=True, headers=headers)
-            resp.raise_for_status()
-            img = Image.open(BytesIO(resp.content))
-        else:
-            img = Image.open(img_url_or_path)
-
-        if img.mode in ("RGBA", "LA", "P"):
-            bg = Image.new("RGB", img.size, (255, 255, 255))
-            img = img.convert("RGBA")
-            bg.paste(img, mask=img.split()[3])
-            img = bg
-
-        w, h = img.size
-        aspect = h / w
-
-        usable_width = pdf.w - pdf.l_margin - pdf.r_margin
-        new_w = min(max_width, usable_width)
-        new_h = new_w * aspect
-
-        # Convert px → mm (approx 3.78 px/mm)
-        resized = img.resize((int(new_w * 3.78), int(new_h * 3.78)), Image.Resampling.LANCZOS)
-
-        temp = f"temp_{int(time.time()*1000)}.jpg"
-        resized.save(temp, "JPEG", quality=85)
-
-        x = pdf.l_margin + (usable_width - new_w) / 2
-        pdf.image(temp, x=x, w=new_w)
-
-        os.remove(temp)
-
-        pdf.ln(4)
-
-        if caption:
-            safe_caption = sanitize_caption(caption)
-            page_width = pdf.w - pdf.l_margin - pdf.r_margin
-            pdf.set_font("helvetica", "I", 9)
-            pdf.set_text_color(110, 110, 110)
-            pdf.multi_cell(page_width, 5, safe_caption, 0, "C")
-            pdf.set_text_color(40, 40, 40)
-            pdf.ln(3)
-
-        return True
-
-    except Exception:
-        pdf.set_font("helvetica", "I", 9)
-        pdf.set_text_color(150, 150, 150)
-        pdf.multi_cell(0, 5, "[Image could not be loaded]", 0, "C")
-        pdf.set_text_color(40, 40, 40)
-        pdf.ln(4)
-        return False
-
-
-def generate_pdf(
-    title: str,
-    content: str,
-    meta_info: Dict[str, Any],
-    images: Optional[List[str]] = None,
-    image_descriptions: Optional[List[str]] = None,
-) -> bytes:
-    images = images or []
-    image_descriptions = image_descriptions or []
-
-    content = clean_separator_lines(content)
-    content = clean_text(content)
-    title = title[:150]
-
-    pdf = FPDF(orientation="P", unit="mm", format="A4")
-    pdf.set_left_margin(15)
-    pdf.set_right_margin(15)
-    pdf.set_auto_page_break(auto=True, margin=15)
-    pdf.add_page()
-
-    # Title
-    pdf.set_font("helvetica", "B", 20)
-    pdf.multi_cell(0, 10, clean_markdown_formatting(title), 0, "C")
-    pdf.ln(4)
-
-    # Divider
-    pdf.set_draw_color(52, 152, 219)
-    pdf.set_line_width(0.8)
-    y = pdf.get_y()
-    pdf.line(pdf.l_margin, y, pdf.w - pdf.r_margin, y)
-    pdf.ln(8)
-
-    # Meta info
-    pdf.set_font("helvetica", "", 10)
-    pdf.set_text_color(90, 90, 90)
-    pdf.cell(0, 5, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}", 0, 1)
-
-    # Expecting keys like word_count, reading_time, seo_score
-    for key, val in meta_info.items():
-        label = key.replace("_", " ").title()
-        pdf.cell(0, 5, f"{label}: {val}", 0, 1)
-
-    pdf.set_text_color(40, 40, 40)
-    pdf.ln(8)
-
-    # Images section
-    if images:
-        pdf.set_font("helvetica", "B", 14)
-        pdf.cell(0, 8, "Visual Content", 0, 1)
-        pdf.ln(2)
-
-        for i, img in enumerate(images):
-            desc = image_descriptions[i] if i < len(image_descriptions) else "Image"
-            caption = f"Figure {i+1}: {sanitize_caption(desc)}"
-            add_image_to_pdf(pdf, img, max_width=170, caption=caption)
-
-        pdf.ln(4)
-
-    heading_pattern = re.compile(r"^\s*(#{1,6})\s*(.*)")
-    page_width = pdf.w - pdf.l_margin - pdf.r_margin
-
-    for raw in content.split("\n"):
-        line = raw.strip()
-
-        if not line:
-            pdf.ln(3)
-            continue
-
-        # Headings
-        m = heading_pattern.match(line)
-        if m:
-            level = len(m.group(1))
-            heading = clean_markdown_formatting(m.group(2))
-
-            if level == 1:
-                pdf.set_font("helvetica", "B", 16)
-            elif level == 2:
-                pdf.set_font("helvetica", "B", 13)
-            else:
-                pdf.set_font("helvetica", "B", 12)
-
-            pdf.multi_cell(0, 7, heading, 0, "L")
-            pdf.ln(2)
-            continue
-
-        # Numbered list
-        num = re.match(r"^(\d+)\.\s+(.*)", line)
-        if num:
-            number = num.group(1)
-            text_line = clean_markdown_formatting(num.group(2))
-
-            pdf.set_font("helvetica", "", 11)
-
-            indent = pdf.l_margin + 5
-            pdf.set_x(indent)
-            pdf.cell(8, 6, f"{number}.", 0, 0)
-            pdf.multi_cell(page_width - 13, 6, text_line, 0, "L")
-            continue
-
-        # Bullet list
-        if line.startswith("- ") or line.startswith("* "):
-            pdf.set_font("helvetica", "", 11)
-            bullet = clean_markdown_formatting(line[2:])
-            pdf.set_x(pdf.l_margin + 5)
-            pdf.multi_cell(page_width - 5, 6, f"- {bullet}", 0, "L")
-            continue
-
-        # Blockquote
-        if line.startswith("> "):
-            pdf.set_font("helvetica", "I", 11)
-            pdf.set_text_color(120, 120, 120)
-            quote = clean_markdown_formatting(line[2:])
-            pdf.multi_cell(page_width, 6, quote, 0, "L")
-            pdf.set_text_color(40, 40, 40)
-            continue
-
-        # Normal text
-        pdf.set_font("helvetica", "", 11)
-        safe = re.sub(r"[^\x00-\x7F]+", " ", line)
-        pdf.multi_cell(page_width, 6, safe, 0, "L")
-
-    return bytes(pdf.output())
-
-
-def generate_docx(
-    title: str,
-    content: str,
-    meta_info: Dict[str, Any],
-    images: Optional[List[str]] = None,
-    image_descriptions: Optional[List[str]] = None,
-) -> bytes:
-    images = images or []
-    image_descriptions = image_descriptions or []
-
-    content = clean_separator_lines(content)
-
-    doc = Document()
-
-    # Title
-    title_para = doc.add_heading(clean_markdown_formatting(title), 0)
-    title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-    doc.add_paragraph()
-
-    # Meta info
-    meta_para = doc.add_paragraph()
-    run = meta_para.add_run(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n")
-    run.font.size = Pt(10)
-    run.font.color.rgb = RGBColor(100, 100, 100)
-    run.italic = True
-
-    wc = meta_info.get("word_count", "N/A")
-    rt = meta_info.get("reading_time", "N/A")
-
-    run = meta_para.add_run(f"Word Count: {wc}\n")
-    run.font.size = Pt(10)
-    run.font.color.rgb = RGBColor(100, 100, 100)
-
-    run = meta_para.add_run(f"Reading Time: {rt}\n")
-    run.font.size = Pt(10)
-    run.font.color.rgb = RGBColor(100, 100, 100)
-
-    doc.add_paragraph()
+async def prefetch_images(images: List[str]) -> List[Optional[bytes]]:
+    """
+    Load all export images as normalized JPEG bytes concurrently
+    (EXPORT_IMAGE_CONCURRENCY downloads at a time). Cached images skip the
+    network and Pillow entirely; a source listed twice is loaded once.
+    Returns images in input order, None where loading failed.
+    """
+    semaphore = asyncio.Semaphore(SETTINGS["EXPORT_IMAGE_CONCURRENCY"])
 
-    # Images
-    if images:
-        doc.add_heading("Visual Content", level=2)
-        doc.add_paragraph()
+    async def fetch(src: str) -> Optional[bytes]:
+        key = image_cache.make_key(src)
+        data = await asyncio.to_thread(image_cache.get, key)
+        if data is not None:
+            return data
 
-        for idx, img_url in enumerate(images, 1):
+        async with semaphore:
             try:
-                if img_url.startswith("data:image"):
-                    header, b64data = img_url.split(",", 1)
-                    img = Image.open(BytesIO(base64.b64decode(b64data)))
-
-                    tmp_file = f"temp_docx_img_{int(time.time() * 1000)}_{idx}.jpg"
-                    img.save(tmp_file, "JPEG", quality=85)
-
-                    doc.add_picture(tmp_file, width=Inches(6))
-
-                    caption_para = doc.add_paragraph()
-                    desc = image_descriptions[idx - 1] if idx - 1 < len(image_descriptions) else "Content Image"
-                    caption_run = caption_para.add_run(f"Figure {idx}: {desc}")
-                    caption_run.font.size = Pt(9)
-                    caption_run.italic = True
-                    caption_run.font.color.rgb = RGBColor(100, 100, 100)
-                    caption_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-                    try:
-                        os.remove(tmp_file)
-                    except Exception:
-                        pass
-
-                elif img_url.startswith("http"):
-                    headers = {
-                        "User-Agent": "Mozilla/5.0",
-                        "Accept": "image/*",
-                    }
-                    resp = requests.get(img_url, timeout=25, stream=True, headers=headers)
+                if src.startswith("http"):
+                    resp = await http_client.get(src, headers=IMAGE_REQUEST_HEADERS)
                     resp.raise_for_status()
-
-                    img = Image.open(BytesIO(resp.content))
-                    if img.mode in ("RGBA", "LA", "P"):
-                        background = Image.new("RGB", img.size, (255, 255, 255))
-                        if img.mode == "P":
-                            img = img.convert("RGBA")
-                        background.paste(img, mask=img.split()[-1] if img.mode == "RGBA" else None)
-                        img = background
-
-                    tmp_file = f"temp_docx_img_{int(time.time() * 1000)}_{idx}.jpg"
-                    img.save(tmp_file, "JPEG", quality=85)
-                    doc.add_picture(tmp_file, width=Inches(6))
-
-                    caption_para = doc.add_paragraph()
-                    desc = image_descriptions[idx - 1] if idx - 1 < len(image_descriptions) else "Content Image"
-                    caption_run = caption_para.add_run(f"Figure {idx}: {desc}")
-                    caption_run.font.size = Pt(9)
-                    caption_run.italic = True
-                    caption_run.font.color.rgb = RGBColor(100, 100, 100)
-                    caption_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-                    try:
-                        os.remove(tmp_file)
-                    except Exception:
-                        pass
-
+                    raw = resp.content
                 else:
-                    # local path
-                    doc.add_picture(img_url, width=Inches(6))
-                    caption_para = doc.add_paragraph()
-                    desc = image_descriptions[idx - 1] if idx - 1 < len(image_descriptions) else "Content Image"
-                    caption_run = caption_para.add_run(f"Figure {idx}: {desc}")
-                    caption_run.font.size = Pt(9)
-                    caption_run.italic = True
-                    caption_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-                doc.add_paragraph()
-            except Exception:
-                p = doc.add_paragraph()
-                desc = image_descriptions[idx - 1] if idx - 1 < len(image_descriptions) else "Content Image"
-                run_err = p.add_run(f"[Figure {idx}: {desc} could not be loaded]")
-                run_err.italic = True
-                run_err.font.color.rgb = RGBColor(150, 150, 150)
-
-    heading_pattern = re.compile(r"^\s*(#{1,6})\s*(.*)")
-
-    # Content
-    for line in content.split("\n"):
-        line_stripped = line.strip()
-        if not line_stripped:
-            doc.add_paragraph()
-            continue
-
-        m = heading_pattern.match(line_stripped)
-        if m:
-            level = len(m.group(1))
-            heading_text = clean_markdown_formatting(line_stripped)
-            level_map = {1: 1, 2: 2, 3: 3}
-            doc.add_heading(heading_text, level=level_map.get(level, 4))
-            continue
-
-        if line_stripped.startswith("- ") or line_stripped.startswith("* "):
-            para = doc.add_paragraph(style="List Bullet")
-            para.add_run(clean_markdown_formatting(line_stripped[2:]))
-            continue
-
-        label, sep, rest = line_stripped.partition(":")
-        if sep and len(label.split()) <= 5 and all(w[:1].isupper() for w in label.split() if w):
-            para = doc.add_paragraph()
-            run_label = para.add_run(clean_markdown_formatting(label) + ":")
-            run_label.bold = True
-            if rest.strip():
-                para.add_run(" " + clean_markdown_formatting(rest.strip()))
-        else:
-            para = doc.add_paragraph()
-            para.add_run(clean_markdown_formatting(line_stripped))
-
-    docx_file = BytesIO()
-    doc.save(docx_file)
-    docx_file.seek(0)
-    return docx_file.getvalue()
-
-
-def generate_html(
-    title: str,
-    content: str,
-    meta_info: Dict[str, Any],
-    images: Optional[List[str]] = None,
-    image_descriptions: Optional[List[str]] = None,
-) -> bytes:
-    """
-    Generate styled HTML report, similar to your Streamlit export.
-    """
-    images = images or []
-    image_descriptions = image_descriptions or []
-
-    title_clean = clean_markdown_formatting(title)
-    content = clean_separator_lines(content)
-
-    html_template = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title_clean}</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.8;
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 30px;
-            color: #333;
-            background-color: #f8f9fa;
-        }}
-        .container {{
-            background: white;
-            padding: 40px;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            color: #2c3e50;
-            border-bottom: 4px solid #3498db;
-            padding-bottom: 15px;
-            margin-bottom: 30px;
-            font-size: 2.5em;
-        }}
-        h2 {{
-            color: #34495e;
-            margin-top: 40px;
-            margin-bottom: 20px;
-            font-size: 1.8em;
-            border-left: 4px solid #3498db;
-            padding-left: 15px;
-        }}
-        h3 {{
-            color: #555;
-            margin-top: 30px;
-            margin-bottom: 15px;
-            font-size: 1.4em;
-        }}
-        h4, h5, h6 {{
-            color: #555;
-            margin-top: 25px;
-            margin-bottom: 10px;
-        }}
-        .meta-info {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 20px;
-            border-radius: 8px;
-            margin: 25px 0;
-            font-size: 0.95em;
-        }}
-        .image-gallery {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 20px;
-            margin: 30px 0;
-        }}
-        .image-gallery img {{
-            width: 100%;
-            height: auto;
-            border-radius: 10px;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-            transition: transform 0.3s ease;
-        }}
-        .image-gallery img:hover {{
-            transform: scale(1.02);
-        }}
-        p {{
-            margin-bottom: 15px;
-            line-height: 1.8;
-        }}
-        blockquote {{
-            border-left: 5px solid #3498db;
-            margin: 25px 0;
-            padding: 15px 25px;
-            color: #555;
-            font-style: italic;
-            background: #ecf0f1;
-            border-radius: 5px;
-        }}
-        ul, ol {{
-            margin: 20px 0;
-            padding-left: 30px;
-        }}
-        li {{
-            margin-bottom: 12px;
-            line-height: 1.6;
-        }}
-        .caption {{
-            text-align: center;
-            font-size: 0.85em;
-            color: #666;
-            margin-top: 5px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>{title_clean}</h1>
-        <div class="meta-info">
-            <p><strong>📅 Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M')}</p>
-            <p><strong>📝 Word Count:</strong> {meta_info.get('word_count', 'N/A')}</p>
-            <p><strong>⏱️ Reading Time:</strong> {meta_info.get('reading_time', 'N/A')}</p>
-            <p><strong>🎯 SEO Score:</strong> {meta_info.get('seo_score', 'N/A')}</p>
-        </div>
-"""
+                    raw = await asyncio.to_thread(read_image_source, src)
+                data = await asyncio.to_thread(normalize_image, raw)
+            except Exception as e:
+                print(f"Could not load export image {src[:80]}: {e}")
+                return None
 
-    # Images
-    if images:
-        html_template += "        <h2>Visual Content</h2>\n"
-        html_template += '        <div class="image-gallery">\n'
-        for i, img_url in enumerate(images):
-            desc = image_descriptions[i] if i < len(image_descriptions) else "Content Image"
-            html_template += "            <div>\n"
-            html_template += f'                <img src="{img_url}" alt="Content image {i+1}" loading="lazy" />\n'
-            html_template += f'                <div class="caption">Figure {i+1}: {desc}</div>\n'
-            html_template += "            </div>\n"
-        html_template += "        </div>\n"
-
-    html_template += '        <div class="content">\n'
-
-    heading_pattern = re.compile(r"^\s*(#{1,6})\s*(.*)")
-    in_list = False
-
-    for line in content.split("\n"):
-        raw = line.rstrip()
-        stripped = raw.strip()
-
-        if not stripped:
-            if in_list:
-                html_template += "        </ul>\n"
-                in_list = False
-            html_template += "        <br>\n"
-            continue
-
-        m = heading_pattern.match(stripped)
-        if m:
-            if in_list:
-                html_template += "        </ul>\n"
-                in_list = False
-
-            level = len(m.group(1))
-            heading_text = clean_markdown_formatting(stripped)
-            tag = {1: "h1", 2: "h2", 3: "h3", 4: "h4", 5: "h5"}.get(level, "h6")
-            html_template += f"        <{tag}>{heading_text}</{tag}>\n"
-            continue
-
-        if stripped.startswith("> "):
-            if in_list:
-                html_template += "        </ul>\n"
-                in_list = False
-            html_template += f"        <blockquote>{clean_markdown_formatting(stripped[2:])}</blockquote>\n"
-            continue
-
-        if stripped.startswith("- ") or stripped.startswith("* "):
-            if not in_list:
-                html_template += "        <ul>\n"
-                in_list = True
-            text_line = clean_markdown_formatting(stripped[2:])
-            html_template += f"            <li>{text_line}</li>\n"
-            continue
-
-        if in_list:
-            html_template += "        </ul>\n"
-            in_list = False
-
-        label, sep, rest = stripped.partition(":")
-        if sep and len(label.split()) <= 5 and all(w[:1].isupper() for w in label.split() if w):
-            label_html = clean_markdown_formatting(label)
-            rest_html = clean_markdown_formatting(rest.strip()) if rest.strip() else ""
-            html_template += f"        <p><strong>{label_html}:</strong> {rest_html}</p>\n"
-        else:
-            text_line = clean_markdown_formatting(stripped)
-            html_template += f"        <p>{text_line}</p>\n"
-
-    if in_list:
-        html_template += "        </ul>\n"
-
-    html_template += """
-        </div>
-    </div>
-</body>
-</html>
-"""
-    return html_template.encode("utf-8")
+        await asyncio.to_thread(image_cache.set, key, data)
+        return data
+
+    sources = list(dict.fromkeys(images))
+    loaded = dict(zip(sources, await asyncio.gather(*(fetch(src) for src in sources))))
+    return [loaded[src] for src in images]
 
 
 # =========================================================
@@ -1027,6 +941,83 @@ async def health_check():
     }
 
 
+async def run_blog_generation(
+    request: BlogGenerationRequest,
+    progress: Optional[Callable[[str, float], Awaitable[None]]] = None,
+) -> BlogGenerationResponse:
+    """
+    Generate blog content + images for a request.
+    Shared by /api/blog/generate and background jobs; errors propagate.
+    """
+    async def report(stage: str, percent: float):
+        if progress:
+            await progress(stage, percent)
+
+    # 1) Generate blog content
+    await report("content", 0)
+    generate = generate_sectioned_blog_with_llm if request.parallelSections else generate_blog_with_llm
+    blog_content = await generate(**blog_llm_kwargs(request), use_cache=request.useCache)
+
+    # 2) Basic metrics
+    word_count = len(blog_content.split())
+    reading_time = max(1, int(word_count / 230))
+
+    all_images: List[str] = []
+    image_descriptions: List[str] = []
+
+    # 3) AI Images (Gemini)
+    if request.useAiImages and ENV_GEMINI_API_KEY:
+        await report("ai_images", 60)
+        image_prompts = await get_ai_image_prompts(request.topic, request.numAiImages, request.useCache)
+
+        # Captions and images are independent: run them side by side
+        image_titles, image_urls = await asyncio.gather(
+            generate_image_captions_from_prompts(request.topic, image_prompts, request.useCache),
+            generate_gemini_images(image_prompts),
+        )
+
+        for idx, img_url in enumerate(image_urls):
+            if img_url:
+                all_images.append(img_url)
+                desc = image_titles[idx] if idx < len(image_titles) else request.topic
+                image_descriptions.append(f"{desc} (Source: Gemini)")
+
+    # 4) Pexels images
+    if request.usePexels and ENV_PEXELS_API_KEY:
+        await report("stock_images", 90)
+        pexels_images = await fetch_pexels_images(request.topic, request.numPexelsImages)
+        all_images.extend(pexels_images)
+        for _ in pexels_images:
+            image_descriptions.append(f"Stock photo related to {request.topic}")
+
+    return BlogGenerationResponse(
+        success=True,
+        title=f"{request.topic}: A Comprehensive Guide",
+        content=blog_content,
+        wordCount=word_count,
+        readingTime=f"{reading_time} min",
+        images=all_images,
+        imageDescriptions=image_descriptions,
+        seoScore="N/A",
+    )
+
+
+async def generate_blog_coalesced(
+    request: BlogGenerationRequest,
+    progress: Optional[Callable[[str, float], Awaitable[None]]] = None,
+) -> BlogGenerationResponse:
+    """
+    run_blog_generation, but identical requests already in flight share its result.
+    Only the caller that started the work receives progress updates.
+    Requests with useCache=False always run on their own.
+    """
+    if not request.useCache:
+        return await run_blog_generation(request, progress)
+
+    key = SingleFlight.make_key(jsonable_encoder(request))
+    return await blog_generation_flight.do(key, lambda: run_blog_generation(request, progress))
+
+
 @app.post("/api/blog/generate", response_model=BlogGenerationResponse)
 async def generate_blog(request: BlogGenerationRequest):
     """
@@ -1040,70 +1031,7 @@ async def generate_blog(request: BlogGenerationRequest):
                 detail="GROQ_API_KEY not configured in environment (.env)",
             )
 
-        # 1) Generate blog content
-        blog_content = generate_blog_with_llm(
-            topic=request.topic,
-            category=request.category,
-            niche=request.niche,
-            keywords=request.keywords,
-            target_audience=request.targetAudience,
-            content_intent=request.contentIntent,
-            expertise_level=request.expertiseLevel,
-            tone=request.tone,
-            length=request.length,
-            writing_style=request.writingStyle,
-            additional_context=request.additionalContext,
-        )
-
-        # 2) Basic metrics
-        word_count = len(blog_content.split())
-        reading_time = max(1, int(word_count / 230))
-
-        all_images: List[str] = []
-        image_descriptions: List[str] = []
-
-        # 3) AI Images (Gemini)
-        if request.useAiImages and ENV_GEMINI_API_KEY:
-            # Prefer your structured infographic/flowchart prompts
-            image_prompts = [
-                f"{request.topic} infographic, clean layout, labeled sections, icons, flat vector design, pastel colors, corporate look, boxes with labels, arrows showing relationships, modern UI infographic, high resolution",
-                f"{request.topic} overview infographic, blocks with titles, arrows, minimal flow structure, flat modern vector style, pastel theme",
-                f"{request.topic} visual summary infographic, simplified labeled blocks, icons, modern flat UI, clean corporate infographic style",
-                f"{request.topic} flowchart diagram, rectangular blocks with labels, arrows between steps, white background, thin lines, flat vector style, professional process diagram",
-                f"{request.topic} decision flowchart, diamond decision nodes, labeled rectangles, directional arrows, minimal pastel colors, clean schematic diagram",
-                f"{request.topic} process flowchart, linear step-by-step boxes, arrows connecting each stage, modern vector workflow diagram",
-            ][: request.numAiImages]
-
-            if not image_prompts:
-                image_prompts = generate_image_prompts(request.topic, request.numAiImages)
-
-            image_titles = generate_image_captions_from_prompts(request.topic, image_prompts)
-
-            for idx, prompt in enumerate(image_prompts):
-                img_url = generate_gemini_image(prompt)
-                if img_url:
-                    all_images.append(img_url)
-                    desc = image_titles[idx] if idx < len(image_titles) else request.topic
-                    image_descriptions.append(f"{desc} (Source: Gemini)")
-                await asyncio.sleep(0.5)
-
-        # 4) Pexels images
-        if request.usePexels and ENV_PEXELS_API_KEY:
-            pexels_images = fetch_pexels_images(request.topic, request.numPexelsImages)
-            all_images.extend(pexels_images)
-            for _ in pexels_images:
-                image_descriptions.append(f"Stock photo related to {request.topic}")
-
-        return BlogGenerationResponse(
-            success=True,
-            title=f"{request.topic}: A Comprehensive Guide",
-            content=blog_content,
-            wordCount=word_count,
-            readingTime=f"{reading_time} min",
-            images=all_images,
-            imageDescriptions=image_descriptions,
-            seoScore="N/A",
-        )
+        return await generate_blog_coalesced(request)
 
     except HTTPException:
         raise
@@ -1112,75 +1040,422 @@ async def generate_blog(request: BlogGenerationRequest):
         return BlogGenerationResponse(success=False, error=str(e))
 
 
+def sse_event(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.post("/api/blog/generate/stream")
+async def generate_blog_stream(request: BlogGenerationRequest, http_request: Request):
+    """
+    Streaming variant of /api/blog/generate using Server-Sent Events.
+
+    Events: `token` (LLM text as it arrives), `metrics` (title, word count,
+    reading time), one `image` per image as soon as it is ready, then `done`
+    or `error`. Image generation starts immediately and overlaps the text.
+    Stops all upstream work when the client disconnects.
+    """
+    if not ENV_GROQ_API_KEY:
+        raise HTTPException(
+            status_code=500,
+            detail="GROQ_API_KEY not configured in environment (.env)",
+        )
+
+    async def events():
+        gemini_tasks: Dict[asyncio.Task, int] = {}
+        captions_task = None
+        pexels_task = None
+
+        try:
+            if request.useAiImages and ENV_GEMINI_API_KEY:
+                image_prompts = await get_ai_image_prompts(request.topic, request.numAiImages, request.useCache)
+                captions_task = asyncio.ensure_future(
+                    generate_image_captions_from_prompts(request.topic, image_prompts, request.useCache)
+                )
+                for idx, prompt in enumerate(image_prompts):
+                    gemini_tasks[asyncio.ensure_future(generate_gemini_image(prompt))] = idx
+
+            if request.usePexels and ENV_PEXELS_API_KEY:
+                pexels_task = asyncio.ensure_future(
+                    fetch_pexels_images(request.topic, request.numPexelsImages)
+                )
+
+            # 1) Stream blog content
+            chunks: List[str] = []
+            token_stream = stream_blog_with_llm(
+                build_blog_messages(**blog_llm_kwargs(request)), use_cache=request.useCache
+            )
+            try:
+                async for token in token_stream:
+                    chunks.append(token)
+                    yield sse_event("token", {"text": token})
+                    if len(chunks) % 25 == 0 and await http_request.is_disconnected():
+                        return
+            finally:
+                await token_stream.aclose()
+
+            # 2) Basic metrics
+            blog_content = "".join(chunks)
+            word_count = len(blog_content.split())
+            reading_time = max(1, int(word_count / 230))
+            yield sse_event("metrics", {
+                "title": f"{request.topic}: A Comprehensive Guide",
+                "wordCount": word_count,
+                "readingTime": f"{reading_time} min",
+                "seoScore": "N/A",
+            })
+
+            # 3) Images, in completion order
+            image_titles = await captions_task if captions_task else []
+            image_count = 0
+            pending = set(gemini_tasks)
+            if pexels_task:
+                pending.add(pexels_task)
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if await http_request.is_disconnected():
+                    return
+
+                for task in done:
+                    if task.exception():
+                        continue
+                    if task is pexels_task:
+                        images = [
+                            (url, f"Stock photo related to {request.topic}", "pexels")
+                            for url in task.result()
+                        ]
+                    elif task.result():
+                        idx = gemini_tasks[task]
+                        desc = image_titles[idx] if idx < len(image_titles) else request.topic
+                        images = [(task.result(), f"{desc} (Source: Gemini)", "gemini")]
+                    else:
+                        images = []
+
+                    for url, description, source in images:
+                        yield sse_event("image", {
+                            "index": image_count,
+                            "url": url,
+                            "description": description,
+                            "source": source,
+                        })
+                        image_count += 1
+
+            yield sse_event("done", {"success": True, "imageCount": image_count})
+
+        except Exception as e:
+            traceback.print_exc()
+            yield sse_event("error", {"success": False, "error": str(e)})
+
+        finally:
+            for task in [*gemini_tasks, captions_task, pexels_task]:
+                if task and not task.done():
+                    task.cancel()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def export_filename(title: str, fmt: str) -> str:
+    """
+    Download and archive entry name for an export. The title is reduced to a
+    plain ASCII basename so it can neither escape or nest inside a ZIP nor
+    break the Content-Disposition header.
+    """
+    stem = re.sub(r"[^A-Za-z0-9._-]+", "_", title).strip("._-")[:100]
+    return f"{stem or 'blog'}.{fmt}"
+
+
+def attachment(filename: str) -> Dict[str, str]:
+    return {"Content-Disposition": f'attachment; filename="{filename}"'}
+
+
+def parse_image_mode(image_mode: str) -> str:
+    image_mode = image_mode.lower()
+    if image_mode not in HTML_IMAGE_MODES:
+        raise HTTPException(
+            status_code=400, detail="Invalid imageMode. Use 'original', 'inline', or 'files'."
+        )
+    return image_mode
+
+
+def needs_loaded_images(fmt: str, image_mode: str) -> bool:
+    """HTML only needs image bytes when it re-encodes or ships them"""
+    return fmt != "html" or image_mode != "original"
+
+
+async def export_html(request: ExportRequest, image_mode: str, loaded_images: Optional[List[Optional[bytes]]]):
+    """
+    HTML export. Streamed chunk by chunk, except in "files" image mode, which
+    returns a ZIP of the page and its images/ folder.
+    """
+    if image_mode == "files":
+        html_bytes = await render_pool.run(
+            render_export, "html", request.title, request.content, request.metaInfo,
+            request.images, request.imageDescriptions, loaded_images, None, image_mode,
+        )
+        files = {export_filename(request.title, "html"): html_bytes, **html_image_files(loaded_images)}
+        archive = await asyncio.to_thread(build_zip, files)
+        return Response(
+            content=archive,
+            media_type="application/zip",
+            headers=attachment(export_filename(request.title, "zip")),
+        )
+
+    sources = request.images
+    if image_mode != "original":
+        sources = await render_pool.run(html_image_sources, request.images, image_mode, loaded_images)
+
+    return StreamingResponse(
+        iter_html(request.title, request.content, request.metaInfo, sources, request.imageDescriptions),
+        media_type=EXPORT_FORMATS["html"],
+        headers=attachment(export_filename(request.title, "html")),
+    )
+
+
 @app.post("/api/blog/export")
 async def export_blog(request: ExportRequest):
     """
     Export blog to PDF, DOCX or HTML.
     Expects metaInfo keys: word_count, reading_time, seo_score (optional).
+    imageMode (HTML only): original | inline (downscaled data URIs) | files (ZIP with images/).
     """
     try:
         fmt = request.format.lower()
+        if fmt not in EXPORT_FORMATS:
+            raise HTTPException(status_code=400, detail="Invalid format. Use 'pdf', 'docx', or 'html'.")
+        image_mode = parse_image_mode(request.imageMode)
 
-        if fmt == "pdf":
-            pdf_bytes = generate_pdf(
-                request.title,
-                request.content,
-                request.metaInfo,
-                images=request.images,
-                image_descriptions=request.imageDescriptions,
-            )
-            return Response(
-                content=pdf_bytes,
-                media_type="application/pdf",
-                headers={
-                    "Content-Disposition": f'attachment; filename="{request.title.replace(" ", "_")}.pdf"'
-                },
-            )
-
-        if fmt == "docx":
-            docx_bytes = generate_docx(
-                request.title,
-                request.content,
-                request.metaInfo,
-                images=request.images,
-                image_descriptions=request.imageDescriptions,
-            )
-            return Response(
-                content=docx_bytes,
-                media_type=(
-                    "application/vnd.openxmlformats-"
-                    "officedocument.wordprocessingml.document"
-                ),
-                headers={
-                    "Content-Disposition": f'attachment; filename="{request.title.replace(" ", "_")}.docx"'
-                },
-            )
+        # Fetch every image up front, then lay out in a render worker process
+        loaded_images = None
+        if needs_loaded_images(fmt, image_mode):
+            loaded_images = await prefetch_images(request.images)
 
         if fmt == "html":
-            html_bytes = generate_html(
+            return await export_html(request, image_mode, loaded_images)
+
+        data = await render_pool.run(
+            render_export,
+            fmt,
+            request.title,
+            request.content,
+            request.metaInfo,
+            request.images,
+            request.imageDescriptions,
+            loaded_images,
+        )
+        return Response(
+            content=data,
+            media_type=EXPORT_FORMATS[fmt],
+            headers=attachment(export_filename(request.title, fmt)),
+        )
+
+    except HTTPException:
+        raise
+    except RenderError as e:
+        raise HTTPException(status_code=503, detail=f"Export failed: {str(e)}")
+    except Exception as e:
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
+
+
+@app.post("/api/blog/export/bundle")
+async def export_bundle(request: ExportBundleRequest):
+    """
+    Export several formats of one blog as a ZIP.
+    Content is parsed and images are fetched once, then every format is
+    rendered concurrently in the render process pool. With imageMode
+    "files" the HTML references an images/ folder shipped in the ZIP.
+    """
+    formats = list(dict.fromkeys(fmt.lower() for fmt in request.formats))
+    invalid = [fmt for fmt in formats if fmt not in EXPORT_FORMATS]
+    if not formats or invalid:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid formats: {', '.join(invalid) or 'none given'}. Use 'pdf', 'docx', or 'html'.",
+        )
+    image_mode = parse_image_mode(request.imageMode)
+
+    try:
+        blocks = parse_markdown(request.content)
+        loaded_images = None
+        if any(needs_loaded_images(fmt, image_mode) for fmt in formats):
+            loaded_images = await prefetch_images(request.images)
+
+        rendered = await asyncio.gather(*(
+            render_pool.run(
+                render_export,
+                fmt,
                 request.title,
                 request.content,
                 request.metaInfo,
-                images=request.images,
-                image_descriptions=request.imageDescriptions,
-            )
-            return Response(
-                content=html_bytes,
-                media_type="text/html; charset=utf-8",
-                headers={
-                    "Content-Disposition": f'attachment; filename="{request.title.replace(" ", "_")}.html"'
-                },
+                request.images,
+                request.imageDescriptions,
+                loaded_images if needs_loaded_images(fmt, image_mode) else None,
+                blocks,
+                image_mode,
             )
+            for fmt in formats
+        ))
+
+        files = {export_filename(request.title, fmt): data for fmt, data in zip(formats, rendered)}
+        if "html" in formats and image_mode == "files":
+            files.update(html_image_files(loaded_images))
+        archive = await asyncio.to_thread(build_zip, files)
+        return Response(
+            content=archive,
+            media_type="application/zip",
+            headers=attachment(export_filename(request.title, "zip")),
+        )
 
-        raise HTTPException(status_code=400, detail="Invalid format. Use 'pdf', 'docx', or 'html'.")
-
-    except HTTPException:
-        raise
+    except RenderError as e:
+        raise HTTPException(status_code=503, detail=f"Export failed: {str(e)}")
     except Exception as e:
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
 
 
+# =========================================================
+# Background Jobs (queued generation, status in the tasks table)
+# =========================================================
+
+async def blog_generation_job(payload: Dict[str, Any], progress) -> Dict[str, Any]:
+    response = await generate_blog_coalesced(BlogGenerationRequest(**payload), progress)
+    return jsonable_encoder(response)
+
+
+async def full_pipeline_job(payload: Dict[str, Any], progress) -> Dict[str, Any]:
+    return await agent_manager.create_full_blog(dict(payload), progress_callback=progress)
+
+
+job_queue.register("blog_generation", blog_generation_job)
+job_queue.register("full_pipeline", full_pipeline_job)
+
+
+@app.on_event("startup")
+async def start_job_queue():
+    await job_queue.start()
+
+
+@app.on_event("startup")
+async def start_task_recorder():
+    await task_recorder.start()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """
+    Tear everything down in dependency order from this single hook: running
+    jobs are cancelled (and recorded as such) while the clients they use are
+    still open, buffered agent results are written next, and the database
+    thread closes last.
+    """
+    await job_queue.stop()
+    await task_recorder.stop()
+    await close_groq_client()
+    await http_client.aclose()
+    render_pool.shutdown()
+    await asyncio.to_thread(db.close)
+
+
+async def submit_job(job_type: str, payload: Dict[str, Any], blog_id: Optional[int] = None) -> JobSubmitResponse:
+    try:
+        job_id = await job_queue.submit(job_type, payload, blog_id=blog_id)
+    except QueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return JobSubmitResponse(jobId=job_id, status="pending")
+
+
+@app.post("/api/jobs/blog", response_model=JobSubmitResponse, status_code=202)
+async def submit_blog_job(request: BlogGenerationRequest):
+    """
+    Queue /api/blog/generate work; poll /api/jobs/{id} for the result.
+    """
+    if not ENV_GROQ_API_KEY:
+        raise HTTPException(
+            status_code=500,
+            detail="GROQ_API_KEY not configured in environment (.env)",
+        )
+    return await submit_job("blog_generation", jsonable_encoder(request))
+
+
+@app.post("/api/jobs/pipeline", response_model=JobSubmitResponse, status_code=202)
+async def submit_pipeline_job(request: PipelineJobRequest):
+    """
+    Queue the full multi-agent pipeline (AgentManager.create_full_blog) for a new blog.
+    """
+    blog_id = await db.create_blog(
+        f"{request.topic}: Complete Guide",
+        request.topic,
+        request.targetAudience,
+        request.tone,
+        request.length,
+    )
+    payload = {
+        "blog_id": blog_id,
+        "topic": request.topic,
+        "target_audience": request.targetAudience,
+        "tone": request.tone,
+        "length_category": request.length,
+        "keywords": [k.strip() for k in request.keywords.split(",") if k.strip()],
+    }
+    try:
+        return await submit_job("full_pipeline", payload, blog_id=blog_id)
+    except HTTPException:
+        # Rejected jobs must not leave a blog behind that nothing will ever fill in
+        await db.delete_blog(blog_id)
+        raise
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: int):
+    """
+    Status, progress and (once completed) result of a queued job.
+    """
+    job = await job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return JSONResponse(job)
+
+
+# =========================================================
+# Blog Listing (keyset pagination over the blogs table)
+# =========================================================
+
+def encode_blog_cursor(blog: Dict[str, Any]) -> str:
+    """Opaque page cursor holding the (created_at, id) key of the last blog on a page"""
+    key = json.dumps([blog["created_at"], blog["id"]])
+    return base64.urlsafe_b64encode(key.encode("utf-8")).decode("ascii")
+
+
+def decode_blog_cursor(cursor: str) -> tuple:
+    try:
+        created_at, blog_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return str(created_at), int(blog_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@app.get("/api/blogs")
+async def list_blogs(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    topic: Optional[str] = None,
+):
+    """
+    One page of blogs, newest first. Pass the returned nextCursor to get the
+    following page; each page is a single index seek regardless of how deep it is.
+    """
+    before = decode_blog_cursor(cursor) if cursor else None
+    # One extra row tells whether another page follows
+    blogs = await db.list_blogs(status=status, topic=topic, before=before, limit=limit + 1)
+    next_cursor = encode_blog_cursor(blogs[limit - 1]) if len(blogs) > limit else None
+    return JSONResponse({"blogs": blogs[:limit], "nextCursor": next_cursor})
+
+
 # =========================================================
 # Dashboard / Agent Monitor / Analytics-style endpoints
 # (Optional: no DB, just static/sample data like Streamlit)
@@ -1214,6 +1489,14 @@ async def get_active_agents():
     return [AgentInfo(**a) for a in agents]
 
 
+@app.get("/api/agents/stats")
+async def get_agent_stats():
+    """
+    Accumulated run statistics of every pooled agent in this worker process.
+    """
+    return JSONResponse({"agents": agent_pool.get_stats()})
+
+
 @app.get("/api/analytics/overview")
 async def analytics_overview():
     """
@@ -1245,6 +1528,14 @@ async def analytics_overview():
         }
     )
 
+
+@app.get("/api/analytics/summary")
+async def analytics_summary():
+    """
+    Blog and task counts by status plus average scores, read from the database.
+    """
+    return JSONResponse(await db.get_analytics_summary())
+
 @app.get("/")
 def root():
     return {"message": "Blog Creation Backend is running!"}
@@ -1,555 +1,104 @@
 import asyncio
-from typing import Dict, Any, List
+from contextvars import ContextVar
+from typing import Dict, Any, List, Optional, Callable, Awaitable
 import random
 
-from agents.phase0.brainstorming_agent import BrainstormingAgent
-from agents.phase0.self_learning_superviser_agent import SelfLearningSuperviserAgent
-# ==== Phase 1 imports ====
-from agents.phase1.brand_alignment_agent import BrandAlignmentAgent
-from agents.phase1.audience_analysis_agent import AudienceAnalysisAgent
-from agents.phase1.audience_persona_agent import AudiencePersonaAgent
-from agents.phase1.audience_sentiment_agent import AudienceSentimentAgent
-from agents.phase1.competitor_analysis_agent import CompetitorAnalysisAgent
-from agents.phase1.context_gathering_agent import ContextGatheringAgent
-from agents.phase1.context_history_agent import ContextHistoryAgent
-from agents.phase1.ethical_bias_agent import EthicalBiasAgent
-from agents.phase1.final_topic_selection_agent import FinalTopicSelectionAgent
-from agents.phase1.goal_definition_agent import GoalDefinitionAgent
-from agents.phase1.niche_authority_agent import NicheAuthorityAgent
-from agents.phase1.regulatory_landscape_agent import RegulatoryLandscapeAgent
-from agents.phase1.semantic_gap_agent import SemanticGapAgent
-from agents.phase1.topic_generation_agent import TopicGenerationAgent
-from agents.phase1.topic_list_monitoring_agent import TopicListMonitoringAgent
-from agents.phase1.topic_uniqueness_validation_agent import TopicUniquenessValidationAgent
-from agents.phase1.topic_validation_agent import TopicValidationAgent
-
-# ==== Phase 2 imports ====
-from agents.phase2.literature_content_gap_checker_agent import LiteratureContentGapCheckerAgent
-from agents.phase2.outline_structuring_agent import OutlineStructuringAgent
-from agents.phase2.reference_validation_agent import ReferenceValidationAgent
-from agents.phase2.research_agent import ResearchAgent
-from agents.phase2.research_harvesting_agent import ResearchHarvestingAgent
-from agents.phase2.source_credibility_agent import SourceCredibilityAgent
-from agents.phase2.source_reliability_agent import SourceReliabilityAgent
-from agents.phase2.source_reliability_scoring_agent import SourceReliabilityScoringAgent
-from agents.phase2.source_reliability_validation_agent import SourceReliabilityValidationAgent
-
-# ==== Phase 3 imports ====
-from agents.phase3.keyword_clustering_agent import KeywordClusteringAgent
-from agents.phase3.keyword_extraction import KeywordExtractionAgent
-from agents.phase3.keyword_integration_planning_agent import KeywordIntegrationPlanningAgent
-from agents.phase3.semantic_seo_integration_agent import SemanticSEOIntegrationAgent
-from agents.phase3.seo_roadmapping_agent import SEORoadmappingAgent
-from agents.phase3.voice_search_optimization_agent import VoiceSearchOptimizationAgent
-
-# ==== Phase 4 imports ====
-from agents.phase4.data_quote_insertion_agent import DataQuoteInsertionAgent
-from agents.phase4.draft_introduction_agent import DraftIntroductionAgent
-from agents.phase4.example_story_integration_agent import ExampleStoryIntegrationAgent
-from agents.phase4.meta_description_snippet_agent import MetaDescriptionSnippetAgent
-from agents.phase4.meta_snippet_generator_agent import MetaSnippetGeneratorAgent
-from agents.phase4.scaling_cloning_agent import ScalingCloningAgent
-from agents.phase4.section_body_writer_agent import SectionBodyWriterAgent
-from agents.phase4.section_writing_agent import SectionWritingAgent
-from agents.phase4.snippet_generator_agent import SnippetGeneratorAgent
-from agents.phase4.title_generation_agent import TitleGenerationAgent
-
-# ==== Phase 5 imports ====
-from agents.phase5.content_sensitivity_moderation_agent import ContentSensitivityModerationAgent
-from agents.phase5.data_stat_insertion_agent import DataStatInsertionAgent
-from agents.phase5.dynamic_example_inserter_agent import DynamicExampleInserterAgent
-from agents.phase5.image_generation_agent import ImageGenerationAgent
-from agents.phase5.image_prompting_agent import ImagePromptingAgent
-from agents.phase5.image_resizer_agent import ImageResizerAgent
-from agents.phase5.image_resizing_optimization_agent import ImageResizingOptimizationAgent
-from agents.phase5.image_rights_agent import ImageRightsAgent
-from agents.phase5.image_rights_verification_agent import ImageRightsVerificationAgent
-from agents.phase5.interactive_content_embedder_agent import InteractiveContentEmbedderAgent
-from agents.phase5.multimedia_embed_agent import MultimediaEmbedAgent
-from agents.phase5.poll_popup_suggestion_agent import PollPopupSuggestionAgent
-from agents.phase5.quote_curation_agent import QuoteCurationAgent
-from agents.phase5.stat_injector_agent import StatInjectorAgent
-
-# ==== Phase 6 imports ====
-from agents.phase6.backlink_health_linkrot_monitor_agent import BacklinkHealthLinkRotMonitorAgent
-from agents.phase6.backlink_monitor_agent import BacklinkMonitorAgent
-from agents.phase6.backlink_placement_agent import BacklinkPlacementAgent
-from agents.phase6.backlink_quality_tracker_agent import BacklinkQualityTrackerAgent
-from agents.phase6.broken_link_redirect_monitor_agent import BrokenLinkRedirectMonitorAgent
-from agents.phase6.call_to_action_writer_agent import CallToActionWriterAgent
-from agents.phase6.internal_external_linking_agent import InternalExternalLinkingAgent
-from agents.phase6.keyword_placement_agent import KeywordPlacementAgent
-from agents.phase6.meta_data_completion_agent import MetaDataCompletionAgent
-from agents.phase6.meta_description_agent import MetaDescriptionAgent
-from agents.phase6.ranking_monitor_agent import RankingMonitorAgent
-from agents.phase6.rich_snippet_schema_markup_generator_agent import RichSnippetSchemaMarkupGeneratorAgent
-from agents.phase6.schema_markup_agent import SchemaMarkupAgent
-from agents.phase6.schema_markup_generator_agent import SchemaMarkupGeneratorAgent
-from agents.phase6.subheading_agent import SubheadingAgent
-
-# ==== Phase 7 imports ====
-from agents.phase7.clarity_readability_agent import ClarityReadabilityAgent
-from agents.phase7.formatting_agent import FormattingAgent
-from agents.phase7.grammar_checker_agent import GrammarCheckerAgent
-from agents.phase7.human_review_trigger_agent import HumanReviewTriggerAgent
-from agents.phase7.paraphrase_agent import ParaphraseAgent
-from agents.phase7.readability_clarity_agent import ReadabilityClarityAgent
-from agents.phase7.spelling_punctuation_agent import SpellingPunctuationAgent
-from agents.phase7.style_guide_compliance_agent import StyleGuideComplianceAgent
-from agents.phase7.visual_preview_agent import VisualPreviewAgent
-
-# ==== Phase 8 imports ====
-from agents.phase8.ai_hallucination_detection_agent import AIHallucinationDetectionAgent
-from agents.phase8.content_hallucination_detection_agent import ContentHallucinationDetectionAgent
-from agents.phase8.deep_fact_reference_cross_validation_agent import DeepFactReferenceCrossValidationAgent
-from agents.phase8.final_originality_validator_agent import FinalOriginalityValidatorAgent
-from agents.phase8.originality_check_plagiarism_detection_agent import OriginalityCheckPlagiarismDetectionAgent
-from agents.phase8.paraphrase_correction_agent import ParaphraseCorrectionAgent
-from agents.phase8.plagiarism_detection_agent import PlagiarismDetectionAgent
-from agents.phase8.plagiarism_paraphrase_agent import PlagiarismParaphraseAgent
-from agents.phase8.post_publish_hallucination_recheck_agent import PostPublishHallucinationRecheckAgent
-
-# ==== Phase 9 imports ====
-from agents.phase9.ad_placement_agent import AdPlacementAgent
-from agents.phase9.ad_response_monitor_agent import AdResponseMonitorAgent
-from agents.phase9.ad_script_integration_agent import AdScriptIntegrationAgent
-from agents.phase9.content_monetization_strategy_agent import ContentMonetizationStrategyAgent
-
-# ==== Phase 10 imports ====
-from agents.phase10.scheduling_agent import SchedulingAgent
-from agents.phase10.cms_upload_agent import CMSUploadAgent
-from agents.phase10.final_review_approval_agent import FinalReviewApprovalAgent
-from agents.phase10.formatting_preview_agent import FormattingPreviewAgent
-from agents.phase10.publication_confirmation_agent import PublicationConfirmationAgent
-from agents.phase10.publish_timing_agent import PublishTimingAgent
-from agents.phase10.publish_timing_conflict_agent import PublishTimingConflictAgent
-from agents.phase10.scheduled_posting_agent import ScheduledPostingAgent
-from agents.phase10.scheduling_agent import SchedulingAgent
-
-# ==== Phase 11 imports ====
-from agents.phase11.social_media_generator_agent import SocialMediaGeneratorAgent
-from agents.phase11.promotion_generation_agent import PromotionGenerationAgent
-from agents.phase11.promotion_scheduler_agent import PromotionSchedulerAgent
-from agents.phase11.newsletter_content_generator_agent import NewsletterContentGeneratorAgent
-
-# ==== Phase 12 imports ====
-from agents.phase12.content_relevance_drift_detector_agent import ContentRelevanceDriftDetectorAgent
-from agents.phase12.content_update_recommendation_agent import ContentUpdateRecommendationAgent
-from agents.phase12.update_suggestion_agent import UpdateSuggestionAgent
-from agents.phase12.seo_performance_tracker_agent import SEOPerformanceTrackerAgent
-from agents.phase12.engagement_analytics_agent import EngagementAnalyticsAgent
-from agents.phase12.analytics_agent import AnalyticsAgent
-from agents.phase12.blog_performance_monitoring_agent import BlogPerformanceMonitoringAgent
-from agents.phase12.historical_seo_impact_analyzer_agent import HistoricalSEOImpactAnalyzerAgent
-from agents.phase12.publishing_report_agent import PublishingReportAgent
-from agents.phase12.update_rewrite_suggestion_agent import UpdateRewriteSuggestionAgent
-
-# ==== Phase 13 imports ====
-from agents.phase13.chatbot_agent import ChatbotAgent
-from agents.phase13.chatbot_analytics_agent import ChatbotAnalyticsAgent
-from agents.phase13.feedback_analysis_agent import FeedbackAnalysisAgent
-from agents.phase13.feedback_iteration_agent import FeedbackIterationAgent
-from agents.phase13.feedback_moderation_agent import FeedbackModerationAgent
-from agents.phase13.feedback_popup_agent import FeedbackPopupAgent
-from agents.phase13.poll_comment_agent import PollCommentAgent
-from agents.phase13.review_collection_agent import ReviewCollectionAgent
-
-# ==== Phase 14 imports ====
-from agents.phase14.human_in_loop_review_agent import HumanInTheLoopReviewAgent
-from agents.phase14.accessibility_compliance_agent import AccessibilityComplianceAgent
-from agents.phase14.accessibility_review_agent import AccessibilityReviewAgent
-from agents.phase14.bias_inclusive_language_agent import BiasInclusiveLanguageAgent
-from agents.phase14.compliance_agent import ComplianceAgent
-from agents.phase14.compliance_snapshot_agent import ComplianceSnapshotAgent
-from agents.phase14.privacy_data_minimization_agent import PrivacyDataMinimizationAgent
-from agents.phase14.regulatory_compliance_agent import RegulatoryComplianceAgent
-from agents.phase14.regulatory_compliance_duplicate_agent import RegulatoryComplianceDuplicateAgent
-
-# ==== Phase 15 imports ====
-from agents.phase15.content_parsing_segmentation_agent import ContentParsingSegmentationAgent
-from agents.phase15.content_rewriting_paraphrasing_agent import ContentRewritingParaphrasingAgent
-from agents.phase15.url_content_extraction_agent import URLContentExtractionAgent
-
-# ==== Phase 16 imports ====
-from agents.phase16.security_review_agent import SecurityReviewAgent
-from agents.phase16.tamper_detection_agent import TamperDetectionAgent
-from agents.phase16.live_post_health_agent import LivePostHealthAgent
-from agents.phase16.broken_media_asset_recovery_agent import BrokenMediaAssetRecoveryAgent
-from agents.phase16.content_tamper_detection_agent import ContentTamperDetectionAgent
-from agents.phase16.internal_crawlability_indexation_tester_agent import InternalCrawlabilityIndexationTesterAgent
-from agents.phase16.negative_seo_malicious_spam_detection_agent import NegativeSEOMaliciousSpamDetectionAgent
-from agents.phase16.search_engine_algorithm_change_monitor_agent import SearchEngineAlgorithmChangeMonitorAgent
-from agents.phase16.security_review_agent import SecurityReviewAgent
-from agents.phase16.traffic_spike_anomaly_response_agent import TrafficSpikeAnomalyResponseAgent
-from agents.phase16.user_session_journey_analysis_agent import UserSessionJourneyAnalysisAgent
-
-# ==== Phase 17 imports ====
-from agents.phase17.change_suggestion_aggregator_agent import ChangeSuggestionAggregatorAgent
-from agents.phase17.editorial_workflow_agent import EditorialWorkflowAgent
-from agents.phase17.peer_review_collaborative_editing_agent import PeerReviewCollaborativeEditingAgent
-
-# ==== Phase 18 imports ====
-from agents.phase18.tag_fixing_agent import TagFixingAgent
-from agents.phase18.table_generator_agent import TableGeneratorAgent
-from agents.phase18.localization_agent import LocalizationAgent
-from agents.phase18.sentiment_analysis_agent import SentimentAnalysisAgent
-from agents.phase18.semantic_consistency_validator_agent import SemanticConsistencyValidatorAgent
-from agents.phase18.ux_journey_simulator_agent import UXJourneySimulatorAgent
-from agents.phase18.content_gap_checker_agent import ContentGapCheckerAgent
-from agents.phase18.content_increment_agent import ContentIncrementAgent
-from agents.phase18.content_localization_cultural_adaptation_agent import ContentLocalizationCulturalAdaptationAgent
-from agents.phase18.fact_updater_agent import FactUpdaterAgent
-from agents.phase18.increment_function_agent import IncrementFunctionAgent
-from agents.phase18.incremental_function_agent import IncrementalFunctionAgent
-from agents.phase18.localization_agent import LocalizationAgent
-from agents.phase18.social_proof_collector_agent import SocialProofCollectorAgent
-from agents.phase18.table_chart_generator_agent import TableChartGeneratorAgent
-from agents.phase18.table_formatter_agent import TableFormatterAgent
-from agents.phase18.tag_checker_agent import TagCheckerAgent
-
+from config.settings import SETTINGS, PHASE_CONFIG
+from utils.agent_pool import agent_pool
+from utils.agent_scheduler import AgentScheduler
+from utils.task_recorder import task_recorder
 
 
+# Event loop time by which the current create_full_blog call must finish
+_pipeline_deadline: ContextVar[Optional[float]] = ContextVar("pipeline_deadline", default=None)
 
 
 class AgentManager:
     def __init__(self):
-        pass
-    async def core_system_learning_phase(self, blog_data: Dict) -> Dict:
-        agents = [
-            SelfLearningSuperviserAgent(),
-            BrainstormingAgent()
-        ]
-        results = {}
-        for agent in agents:
-            output = await agent.execute(blog_data)
-            results[agent.__class__.__name__] = output
+        self.pool = agent_pool
+        self.scheduler = AgentScheduler()
+
+    def get_agent_stats(self) -> List[Dict[str, Any]]:
+        """Accumulated statistics of every agent used by this process"""
+        return self.pool.get_stats()
+
+    def prewarm(self, phase_names: List[str] = None) -> int:
+        """Import and construct the agents of the given phases ahead of the first request"""
+        return self.pool.prewarm(phase_names)
+
+    async def _run_phase(self, phase_name: str, blog_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a phase's registered agents within the phase and pipeline deadlines and record their results"""
+        agents = self.pool.get_phase(phase_name)
+        parallel = PHASE_CONFIG.get(phase_name, {}).get("parallel", True)
+
+        deadline = asyncio.get_running_loop().time() + SETTINGS["PHASE_TIMEOUT_SECONDS"]
+        pipeline_deadline = _pipeline_deadline.get()
+        if pipeline_deadline is not None:
+            deadline = min(deadline, pipeline_deadline)
+
+        results = await self.scheduler.run(agents, blog_data, parallel=parallel, deadline=deadline)
+        for result in results.values():
+            task_recorder.record(result, blog_id=blog_data.get("blog_id"))
         return {"status": "completed", "agent_results": results}
 
+    async def core_system_learning_phase(self, blog_data: Dict) -> Dict:
+        return await self._run_phase("Core System & Learning", blog_data)
+
     async def ideation_phase(self, blog_data: Dict[str, Any]) -> Dict[str, Any]:
-        agents = [
-            BrandAlignmentAgent(),
-            AudienceAnalysisAgent(),
-            AudiencePersonaAgent(),
-            AudienceSentimentAgent(),
-            CompetitorAnalysisAgent(),
-            ContextGatheringAgent(),
-            ContextHistoryAgent(),
-            EthicalBiasAgent(),
-            FinalTopicSelectionAgent(),
-            GoalDefinitionAgent(),
-            NicheAuthorityAgent(),
-            RegulatoryLandscapeAgent(),
-            SemanticGapAgent(),
-            TopicGenerationAgent(),
-            TopicListMonitoringAgent(),
-            TopicUniquenessValidationAgent(),
-            TopicValidationAgent()
-        ]
-        results = {}
-        for agent in agents:
-            output = await agent.execute(blog_data)
-            results[agent.__class__.__name__] = output
-        return {
-            "status": "completed",
-            "agent_results": results
-        }
+        return await self._run_phase("Ideation & Planning", blog_data)
 
     async def research_phase(self, blog_data: Dict[str, Any]) -> Dict[str, Any]:
-        agents = [
-            LiteratureContentGapCheckerAgent(),
-            OutlineStructuringAgent(),
-            ReferenceValidationAgent(),
-            ResearchAgent(),
-            ResearchHarvestingAgent(),
-            SourceCredibilityAgent(),
-            SourceReliabilityAgent(),
-            SourceReliabilityScoringAgent(),
-            SourceReliabilityValidationAgent()
-        ]
-        results = {}
-        for agent in agents:
-            output = await agent.execute(blog_data)
-            results[agent.__class__.__name__] = output
-        return {
-            "status": "completed",
-            "agent_results": results
-        }
+        return await self._run_phase("Research & Structuring", blog_data)
 
     async def seo_phase(self, blog_data: Dict[str, Any]) -> Dict[str, Any]:
-        agents = [
-            KeywordClusteringAgent(),
-            KeywordExtractionAgent(),
-            KeywordIntegrationPlanningAgent(),
-            SemanticSEOIntegrationAgent(),
-            SEORoadmappingAgent(),
-            VoiceSearchOptimizationAgent()
-        ]
-        results = {}
-        for agent in agents:
-            output = await agent.execute(blog_data)
-            results[agent.__class__.__name__] = output
-        return {
-            "status": "completed",
-            "agent_results": results
-        }
+        return await self._run_phase("SEO & Keyword Preparation", blog_data)
 
 
     async def content_generation_phase(self, blog_data: Dict[str, Any]) -> Dict[str, Any]:
-        agents = [
-            DataQuoteInsertionAgent(),
-            DraftIntroductionAgent(),
-            ExampleStoryIntegrationAgent(),
-            MetaDescriptionSnippetAgent(),
-            MetaSnippetGeneratorAgent(),
-            ScalingCloningAgent(),
-            SectionBodyWriterAgent(),
-            SectionWritingAgent(),
-            SnippetGeneratorAgent(),
-            TitleGenerationAgent()
-        ]
-        results = {}
-        for agent in agents:
-            output = await agent.execute(blog_data)
-            results[agent.__class__.__name__] = output
-        return {"status": "completed", "agent_results": results}
+        return await self._run_phase("Drafting & Content Generation", blog_data)
     
     async def content_enrichment_phase(self, blog_data: Dict[str, Any]) -> Dict[str, Any]:
-        agents = [
-           ContentSensitivityModerationAgent(),
-           DataStatInsertionAgent(),
-           DynamicExampleInserterAgent(),
-           ImageGenerationAgent(),
-           ImagePromptingAgent(),
-           ImageResizerAgent(),
-           ImageResizingOptimizationAgent(),
-           ImageRightsAgent(),
-           ImageRightsVerificationAgent(),
-           InteractiveContentEmbedderAgent(),
-           MultimediaEmbedAgent(),
-           PollPopupSuggestionAgent(),
-           QuoteCurationAgent(),
-           StatInjectorAgent()
-        ]
-        results = {}
-        for agent in agents:
-            output = await agent.execute(blog_data)
-            results[agent.__class__.__name__] = output
-        return {"status": "completed", "agent_results": results}
+        return await self._run_phase("Content Enrichment", blog_data)
 
     async def seo_optimization_phase(self, blog_data: Dict[str, Any]) -> Dict[str, Any]:
-        agents = [
-            BacklinkHealthLinkRotMonitorAgent(),
-            BacklinkMonitorAgent(),
-            BacklinkPlacementAgent(),
-            BacklinkQualityTrackerAgent(),
-            BrokenLinkRedirectMonitorAgent(),
-            CallToActionWriterAgent(),
-            InternalExternalLinkingAgent(),
-            KeywordPlacementAgent(),
-            MetaDataCompletionAgent(),
-            MetaDescriptionAgent(),
-            RankingMonitorAgent(),
-            RichSnippetSchemaMarkupGeneratorAgent(),
-            SchemaMarkupAgent(),
-            SchemaMarkupGeneratorAgent(),
-            SubheadingAgent()
-        ]
-        results = {}
-        for agent in agents:
-            output = await agent.execute(blog_data)
-            results[agent.__class__.__name__] = output
-        return {"status": "completed", "agent_results": results}
+        return await self._run_phase("SEO Optimization & Linking", blog_data)
 
     async def editing_phase(self, blog_data: Dict[str, Any]) -> Dict[str, Any]:
-        agents = [
-            ClarityReadabilityAgent(),
-            FormattingAgent(),
-            GrammarCheckerAgent(),
-            HumanReviewTriggerAgent(),
-            ParaphraseAgent(),
-            ReadabilityClarityAgent(),
-            SpellingPunctuationAgent(),
-            StyleGuideComplianceAgent(),
-            VisualPreviewAgent()
-        ]
-        results = {}
-        for agent in agents:
-            output = await agent.execute(blog_data)
-            results[agent.__class__.__name__] = output
-        return {"status": "completed", "agent_results": results}
+        return await self._run_phase("Editing & Validation", blog_data)
 
     async def plagiarism_phase(self, blog_data: Dict[str, Any]) -> Dict[str, Any]:
-        agents = [
-            AIHallucinationDetectionAgent(),
-            ContentHallucinationDetectionAgent(),
-            DeepFactReferenceCrossValidationAgent(),
-            FinalOriginalityValidatorAgent(),
-            OriginalityCheckPlagiarismDetectionAgent(),
-            ParaphraseCorrectionAgent(),
-            PlagiarismDetectionAgent(),
-            PlagiarismParaphraseAgent(),
-            PostPublishHallucinationRecheckAgent()
-        ]
-        results = {}
-        for agent in agents:
-            output = await agent.execute(blog_data)
-            results[agent.__class__.__name__] = output
-        return {"status": "completed", "agent_results": results}
+        return await self._run_phase("Plagiarism & Originality", blog_data)
 
 
     async def phase9_ads_and_monetization(self, blog_data: Dict[str, Any]) -> Dict:
-        agents = [
-            AdPlacementAgent(),
-            AdResponseMonitorAgent(),
-            AdScriptIntegrationAgent(),
-            ContentMonetizationStrategyAgent()
-        ]
-        results = {}
-        for agent in agents:
-            results[agent.__class__.__name__] = await agent.execute(blog_data)
-        return {"status": "completed", "agent_results": results}
+        return await self._run_phase("Ads & Monetization", blog_data)
 
     async def phase10_scheduling_publishing(self, blog_data: Dict[str, Any]) -> Dict:
-        agents = [
-            SchedulingAgent(),
-            CMSUploadAgent(),
-            ScheduledPostingAgent(),
-            PublishTimingAgent(),
-            PublishTimingConflictAgent(),
-            PublicationConfirmationAgent(),
-            FormattingPreviewAgent(),
-            FinalReviewApprovalAgent(),
-        ]
-        results = {}
-        for agent in agents:
-            results[agent.__class__.__name__] = await agent.execute(blog_data)
-        return {"status": "completed", "agent_results": results}
+        return await self._run_phase("Scheduling & Publishing", blog_data)
 
     async def phase11_promotion(self, blog_data: Dict[str, Any]) -> Dict:
-        agents = [
-            SocialMediaGeneratorAgent(),
-            PromotionGenerationAgent(),
-            PromotionSchedulerAgent(),
-            NewsletterContentGeneratorAgent()
-        ]
-        results = {}
-        for agent in agents:
-            results[agent.__class__.__name__] = await agent.execute(blog_data)
-        return {"status": "completed", "agent_results": results}
+        return await self._run_phase("Promotion", blog_data)
 
     async def phase12_analytics_update(self, blog_data: Dict[str, Any]) -> Dict:
-        agents = [
-            AnalyticsAgent(),
-            BlogPerformanceMonitoringAgent(),
-            ContentRelevanceDriftDetectorAgent(),
-            ContentUpdateRecommendationAgent(),
-            EngagementAnalyticsAgent(),
-            HistoricalSEOImpactAnalyzerAgent(),
-            PublishingReportAgent(),
-            SEOPerformanceTrackerAgent(),
-            UpdateRewriteSuggestionAgent(),
-            UpdateSuggestionAgent()
-        ]
-        results = {}
-        for agent in agents:
-            results[agent.__class__.__name__] = await agent.execute(blog_data)
-        return {"status": "completed", "agent_results": results}
+        return await self._run_phase("Analytics & Update", blog_data)
 
     async def phase13_chatbot_feedback(self, blog_data: Dict[str, Any]) -> Dict:
-        agents = [
-            ChatbotAgent(),
-            FeedbackAnalysisAgent(),
-            FeedbackModerationAgent(),
-            FeedbackIterationAgent(),
-            ChatbotAnalyticsAgent(),
-            FeedbackPopupAgent(),
-            PollCommentAgent(),
-            ReviewCollectionAgent()
-        ]
-        results = {}
-        for agent in agents:
-            results[agent.__class__.__name__] = await agent.execute(blog_data)
-        return {"status": "completed", "agent_results": results}
+        return await self._run_phase("Chatbot & Feedback", blog_data)
 
     async def phase14_quality_assurance(self, blog_data: Dict[str, Any]) -> Dict:
-        agents = [
-            HumanInTheLoopReviewAgent(),
-            AccessibilityComplianceAgent(),
-            AccessibilityReviewAgent(),
-            BiasInclusiveLanguageAgent(),
-            ComplianceAgent(),
-            ComplianceSnapshotAgent(),
-            PrivacyDataMinimizationAgent(),
-            RegulatoryComplianceAgent(),
-            RegulatoryComplianceDuplicateAgent()
-        ]
-        results = {}
-        for agent in agents:
-            results[agent.__class__.__name__] = await agent.execute(blog_data)
-        return {"status": "completed", "agent_results": results}
+        return await self._run_phase("Quality Assurance & Compliance", blog_data)
 
     async def phase15_archiving_version_control(self, blog_data: Dict[str, Any]) -> Dict:
-        agents = [
-            ContentParsingSegmentationAgent(),
-            ContentRewritingParaphrasingAgent(),
-            URLContentExtractionAgent()
-        ]
-        results = {}
-        for agent in agents:
-            results[agent.__class__.__name__] = await agent.execute(blog_data)
-        return {"status": "completed", "agent_results": results}
+        return await self._run_phase("Content Acquisition & Cloning", blog_data)
 
     async def phase16_safety_security_monitoring(self, blog_data: Dict[str, Any]) -> Dict:
-        agents = [
-            SecurityReviewAgent(),
-           BrokenMediaAssetRecoveryAgent(),
-           ContentTamperDetectionAgent(),
-           InternalCrawlabilityIndexationTesterAgent(),
-           LivePostHealthAgent(),
-           NegativeSEOMaliciousSpamDetectionAgent(),
-           SearchEngineAlgorithmChangeMonitorAgent(),
-           TamperDetectionAgent(),
-           TrafficSpikeAnomalyResponseAgent(),
-           UserSessionJourneyAnalysisAgent()
-        ]
-        results = {}
-        for agent in agents:
-            results[agent.__class__.__name__] = await agent.execute(blog_data)
-        return {"status": "completed", "agent_results": results}
+        return await self._run_phase("Safety, Security & Monitoring", blog_data)
 
     async def phase17_team_collaboration_workflow(self, blog_data: Dict[str, Any]) -> Dict:
-        agents = [
-            ChangeSuggestionAggregatorAgent(),
-            EditorialWorkflowAgent(),PeerReviewCollaborativeEditingAgent()
-        ]
-        results = {}
-        for agent in agents:
-            results[agent.__class__.__name__] = await agent.execute(blog_data)
-        return {"status": "completed", "agent_results": results}
+        return await self._run_phase("Editorial Management & Collaboration", blog_data)
 
     async def phase18_auxiliary_support(self, blog_data: Dict[str, Any]) -> Dict:
-        agents = [
-            TagFixingAgent(),
-            TableChartGeneratorAgent(),
-            IncrementalFunctionAgent(),
-            LocalizationAgent(),
-            SentimentAnalysisAgent(),
-            SemanticConsistencyValidatorAgent(),
-            UXJourneySimulatorAgent(),
-            ContentGapCheckerAgent(),
-            ContentIncrementAgent(),
-            ContentLocalizationCulturalAdaptationAgent(),
-            FactUpdaterAgent(),
-            IncrementFunctionAgent(),
-            SocialProofCollectorAgent(),
-            TableGeneratorAgent(),
-            TableFormatterAgent(),
-            TagCheckerAgent(),
-        ]
-        results = {}
-        for agent in agents:
-            results[agent.__class__.__name__] = await agent.execute(blog_data)
-        return {"status": "completed", "agent_results": results}
+        return await self._run_phase("Auxiliary/Support", blog_data)
 
     async def execute_phase(self, phase_name: str, blog_data: Dict) -> Dict:
         phase_methods = {
@@ -557,8 +106,8 @@ class AgentManager:
             "Ideation & Planning": self.ideation_phase,
             "Research & Structuring": self.research_phase,
             "SEO & Keyword Preparation": self.seo_phase,
-            "Drafting & Content generation": self.content_generation_phase,
-            "Content Enrichment":self.enrichment_phase,
+            "Drafting & Content Generation": self.content_generation_phase,
+            "Content Enrichment": self.content_enrichment_phase,
             "SEO Optimization & Linking": self.seo_optimization_phase,
             "Editing & Validation": self.editing_phase,
             "Plagiarism Check": self.plagiarism_phase,
@@ -579,8 +128,14 @@ class AgentManager:
         return {"status": "error", "message": f"Unknown phase: {phase_name}"}
 
 
-    async def create_full_blog(self, blog_data: Dict) -> Dict:
-        """Execute complete blog creation workflow"""
+    async def create_full_blog(self, blog_data: Dict, progress_callback: Callable[[str, float], Awaitable[None]] = None) -> Dict:
+        """
+        Execute complete blog creation workflow
+
+        Args:
+            blog_data: Blog inputs (topic, tone, target_audience, ...)
+            progress_callback: Optional coroutine called with (phase, percent done) as each phase starts
+        """
         phases = [
             "Ideation & Planning",
             "Research & Structuring",
@@ -603,13 +158,28 @@ class AgentManager:
             "Auxiliary/Support"
         ]
 
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + SETTINGS["PIPELINE_TIMEOUT_SECONDS"]
+        token = _pipeline_deadline.set(deadline)
+
         results = {}
-        for phase in phases:
-            phase_result = await self.execute_phase(phase, blog_data)
-            results[phase] = phase_result
-            # Update blog_data with results for next phase if completed
-            if phase_result.get("status") == "completed":
-                blog_data.update(phase_result)
+        try:
+            for index, phase in enumerate(phases):
+                if progress_callback:
+                    await progress_callback(phase, index / len(phases) * 100)
+
+                if loop.time() >= deadline:
+                    results[phase] = {"status": "error", "message": "Pipeline time budget exhausted"}
+                    continue
+
+                phase_result = await self.execute_phase(phase, blog_data)
+                results[phase] = phase_result
+                # Accumulate agent results so later phases can depend on earlier agents
+                if phase_result.get("status") == "completed":
+                    agent_results = {**blog_data.get("agent_results", {}), **phase_result["agent_results"]}
+                    blog_data.update(phase_result, agent_results=agent_results)
+        finally:
+            _pipeline_deadline.reset(token)
 
         return {
             "status": "completed",
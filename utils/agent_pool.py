@@ -0,0 +1,122 @@
+import logging
+from importlib import import_module
+from typing import Dict, Any, List, Type, Iterable
+
+from agents.base_agent import BaseAgent
+from config.agent_registry import AGENT_REGISTRY
+
+
+class AgentPool:
+    """
+    Process-wide registry that constructs each agent class once and reuses it.
+
+    Agents keep per-invocation state in the input they are given (the
+    scheduler hands every run its own copy of the blog data), so a single
+    instance can serve concurrent requests while its success/failure counters
+    and execution times accumulate across them.
+
+    Agent modules listed in AGENT_REGISTRY are imported the first time their
+    phase is requested, not when this module is imported.
+    """
+
+    def __init__(self, registry: Dict[str, List[str]] = None):
+        self.registry = registry if registry is not None else AGENT_REGISTRY
+        self._agents: Dict[Type[BaseAgent], BaseAgent] = {}
+        self._phase_classes: Dict[str, List[Type[BaseAgent]]] = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @staticmethod
+    def load_class(path: str) -> Type[BaseAgent]:
+        """
+        Import an agent class from its dotted path
+
+        Args:
+            path: Dotted path, e.g. "agents.phase1.brand_alignment_agent.BrandAlignmentAgent"
+
+        Returns:
+            Agent class
+        """
+        module_path, _, class_name = path.rpartition(".")
+        return getattr(import_module(module_path), class_name)
+
+    def get_phase(self, phase_name: str) -> List[BaseAgent]:
+        """
+        Get shared instances of a phase's agents, importing their modules on first use
+
+        Args:
+            phase_name: Phase name as listed in AGENT_REGISTRY
+
+        Returns:
+            Agent instances in registry order
+        """
+        classes = self._phase_classes.get(phase_name)
+        if classes is None:
+            if phase_name not in self.registry:
+                raise KeyError(f"No agents registered for phase: {phase_name}")
+            classes = [self.load_class(path) for path in self.registry[phase_name]]
+            self._phase_classes[phase_name] = classes
+            self.logger.debug(f"Loaded {len(classes)} agents for {phase_name}")
+        return self.get_many(classes)
+
+    def prewarm(self, phase_names: Iterable[str] = None) -> int:
+        """
+        Import and construct agents ahead of the first request
+
+        Args:
+            phase_names: Phases to load; all registered phases if None
+
+        Returns:
+            Number of agents loaded
+        """
+        count = 0
+        for phase_name in (self.registry if phase_names is None else phase_names):
+            try:
+                count += len(self.get_phase(phase_name))
+            except KeyError as e:
+                self.logger.warning(e.args[0])
+        return count
+
+    def get(self, agent_class: Type[BaseAgent]) -> BaseAgent:
+        """
+        Get the shared instance of an agent class, constructing it on first use
+
+        Args:
+            agent_class: BaseAgent subclass
+
+        Returns:
+            Shared agent instance
+        """
+        agent = self._agents.get(agent_class)
+        if agent is None:
+            agent = agent_class()
+            self._agents[agent_class] = agent
+            self.logger.debug(f"Constructed {agent_class.__name__}")
+        return agent
+
+    def get_many(self, agent_classes: List[Type[BaseAgent]]) -> List[BaseAgent]:
+        """Get shared instances for several agent classes, preserving order"""
+        return [self.get(agent_class) for agent_class in agent_classes]
+
+    def get_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get accumulated statistics of every agent constructed so far
+
+        Returns:
+            List of BaseAgent.get_stats() dictionaries, keyed additionally by class
+        """
+        return [
+            {"class": agent_class.__name__, **agent.get_stats()}
+            for agent_class, agent in self._agents.items()
+        ]
+
+    def reset_stats(self):
+        """Reset statistics of every pooled agent"""
+        for agent in self._agents.values():
+            agent.reset_stats()
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+
+# Shared by every AgentManager in the process
+agent_pool = AgentPool()
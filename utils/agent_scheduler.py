@@ -0,0 +1,132 @@
+import asyncio
+import logging
+from typing import Dict, Any, List, Optional
+
+from agents.base_agent import BaseAgent
+from config.settings import SETTINGS
+
+
+class AgentScheduler:
+    """
+    Dependency-aware scheduler for the agents of a single phase.
+
+    Agents are keyed by class name, the same key used in ``agent_results``.
+    ``BaseAgent.dependencies`` may reference either that key or the agent's
+    display name. Dependencies on agents of earlier phases are satisfied by
+    the ``agent_results`` already present in ``blog_data``.
+
+    Agents are driven through ``BaseAgent.run_with_timeout`` so retries,
+    metrics and dependency checks apply, and no agent outlives
+    AGENT_TIMEOUT_SECONDS or the deadline of the phase it runs in.
+    """
+
+    def __init__(self, max_concurrency: int = None, agent_timeout: float = None):
+        self.max_concurrency = max_concurrency or SETTINGS["MAX_CONCURRENT_AGENTS"]
+        self.agent_timeout = agent_timeout or SETTINGS["AGENT_TIMEOUT_SECONDS"]
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def build_graph(self, agents: List[BaseAgent], completed: Dict[str, Any]) -> Dict[str, List[str]]:
+        """
+        Build the in-phase dependency graph and return it in topological order
+
+        Args:
+            agents: Agents of the phase
+            completed: Results of agents that already ran in earlier phases
+
+        Returns:
+            Ordered mapping of agent key -> keys of in-phase agents it waits for
+        """
+        keys = {}
+        for agent in agents:
+            key = agent.__class__.__name__
+            keys[key] = key
+            keys.setdefault(agent.name, key)
+
+        graph = {}
+        for agent in agents:
+            key = agent.__class__.__name__
+            edges = []
+            for dependency in agent.dependencies:
+                if dependency in keys:
+                    edges.append(keys[dependency])
+                elif dependency not in completed:
+                    self.logger.warning(f"{key} depends on unknown agent: {dependency}")
+            graph[key] = edges
+
+        ordered = {}
+        while len(ordered) < len(graph):
+            ready = [
+                key for key, edges in graph.items()
+                if key not in ordered and all(edge in ordered for edge in edges)
+            ]
+            if not ready:
+                remaining = [key for key in graph if key not in ordered]
+                raise ValueError(f"Dependency cycle detected among: {', '.join(remaining)}")
+            for key in ready:
+                ordered[key] = graph[key]
+
+        return ordered
+
+    async def run(
+        self,
+        agents: List[BaseAgent],
+        blog_data: Dict[str, Any],
+        parallel: bool = True,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run agents as soon as their dependencies complete
+
+        Args:
+            agents: Agents of the phase
+            blog_data: Shared blog data; each agent receives its own shallow copy
+            parallel: Run independent agents concurrently; False runs one at a time
+            deadline: Event loop time by which every agent must have finished
+
+        Returns:
+            Standardized agent results keyed by class name, in the order agents were given
+        """
+        loop = asyncio.get_running_loop()
+        prior_results = blog_data.get("agent_results", {})
+        graph = self.build_graph(agents, prior_results)
+        agents_by_key = {agent.__class__.__name__: agent for agent in agents}
+        semaphore = asyncio.Semaphore(self.max_concurrency if parallel else 1)
+        results = {}
+        tasks = {}
+
+        async def run_agent(key: str) -> Dict[str, Any]:
+            agent = agents_by_key[key]
+            if graph[key]:
+                await asyncio.gather(*(tasks[edge] for edge in graph[key]))
+                failed = [edge for edge in graph[key] if results[edge].get("status") != "success"]
+                if failed:
+                    results[key] = agent.error_result(
+                        f"Skipped: dependencies failed: {', '.join(failed)}", "DependencyError"
+                    )
+                    return results[key]
+
+            async with semaphore:
+                timeout = self.agent_timeout
+                if deadline is not None:
+                    timeout = min(timeout, deadline - loop.time())
+
+                if timeout <= 0:
+                    results[key] = agent.error_result("Skipped: phase deadline exceeded", "TimeoutError")
+                    return results[key]
+
+                input_data = dict(blog_data)
+                input_data["agent_results"] = {**prior_results, **results}
+                results[key] = await agent.run_with_timeout(input_data, timeout)
+            return results[key]
+
+        for key in graph:
+            tasks[key] = asyncio.ensure_future(run_agent(key))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+
+        return {agent.__class__.__name__: results[agent.__class__.__name__] for agent in agents}
@@ -0,0 +1,124 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Any, List, Optional, Callable, Iterable
+
+from utils import database
+
+
+class AsyncDatabase:
+    """
+    Async facade over utils.database for the FastAPI handlers.
+
+    Every call runs on one dedicated thread: its single-worker executor
+    queues the calls in order, and all of them share that thread's pooled
+    connection. SQLite serializes writers anyway, so more threads would only
+    contend for the file lock; the event loop never waits on the database.
+    """
+
+    def __init__(self):
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        return self._executor
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking database function on the database thread
+
+        Args:
+            func: Function from utils.database (or any function using get_connection)
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            The function's return value
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
+    def close(self):
+        """Finish queued calls, close the connection and stop the thread"""
+        if self._executor is not None:
+            self._executor.submit(database.close_connection)
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    # Schema
+
+    async def init_db(self):
+        return await self.run(database.init_db)
+
+    # Blogs
+
+    async def create_blog(self, title: str, topic: str, target_audience: str, tone: str, length_category: str) -> int:
+        return await self.run(database.create_blog, title, topic, target_audience, tone, length_category)
+
+    async def get_blog(self, blog_id: int) -> Optional[Dict[str, Any]]:
+        return await self.run(database.get_blog, blog_id)
+
+    async def update_blog(self, blog_id: int, **fields):
+        return await self.run(database.update_blog, blog_id, **fields)
+
+    async def delete_blog(self, blog_id: int):
+        return await self.run(database.delete_blog, blog_id)
+
+    async def get_all_blogs(self) -> List[tuple]:
+        return await self.run(database.get_all_blogs)
+
+    async def list_blogs(self, status: str = None, topic: str = None, before: Optional[tuple] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        return await self.run(database.list_blogs, status, topic, before, limit)
+
+    # Agents
+
+    async def get_agent_stats(self) -> List[tuple]:
+        return await self.run(database.get_agent_stats)
+
+    # Tasks
+
+    async def create_task(self, task_type: str, blog_id: int = None, agent_id: int = None, status: str = "pending") -> int:
+        return await self.run(database.create_task, task_type, blog_id, agent_id, status)
+
+    async def update_task(self, task_id: int, **fields):
+        return await self.run(database.update_task, task_id, **fields)
+
+    async def record_task_results(self, rows: List[tuple]):
+        return await self.run(database.record_task_results, rows)
+
+    async def get_task(self, task_id: int) -> Optional[Dict[str, Any]]:
+        return await self.run(database.get_task, task_id)
+
+    async def list_tasks(self, status: str = None, task_type: str = None, blog_id: int = None, limit: int = 50) -> List[Dict[str, Any]]:
+        return await self.run(database.list_tasks, status, task_type, blog_id, limit)
+
+    async def fail_interrupted_tasks(self, task_types: Iterable[str], message: str = "Interrupted by server restart") -> int:
+        return await self.run(database.fail_interrupted_tasks, list(task_types), message)
+
+    # Analytics
+
+    async def record_metrics(self, blog_id: int, metrics: Dict[str, float]):
+        return await self.run(database.record_metrics, blog_id, metrics)
+
+    async def get_blog_metrics(self, blog_id: int) -> Dict[str, float]:
+        return await self.run(database.get_blog_metrics, blog_id)
+
+    async def get_analytics_summary(self) -> Dict[str, Any]:
+        return await self.run(database.get_analytics_summary)
+
+    # LLM cache
+
+    async def get_cached_response(self, key: str, min_created_at: float) -> Optional[tuple]:
+        return await self.run(database.get_cached_response, key, min_created_at)
+
+    async def set_cached_response(self, key: str, value: str, created_at: float):
+        return await self.run(database.set_cached_response, key, value, created_at)
+
+    async def purge_cached_responses(self, min_created_at: float) -> int:
+        return await self.run(database.purge_cached_responses, min_created_at)
+
+
+# Shared by all request handlers in the process
+db = AsyncDatabase()
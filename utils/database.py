@@ -1,14 +1,29 @@
 import sqlite3
 import os
+import threading
 from datetime import datetime
 
 DATABASE_PATH = "data/blog_suite.db"
 
+# Applied to every pooled connection. WAL lets readers run alongside a writer;
+# synchronous=NORMAL is durable across application crashes in WAL mode.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -20000,  # KiB, i.e. ~20 MB of page cache per connection
+    "mmap_size": 256 * 1024 * 1024,
+    "temp_store": "MEMORY",
+}
+SQLITE_BUSY_TIMEOUT = 10.0
+SQLITE_CACHED_STATEMENTS = 256
+
+_local = threading.local()
+
 def init_db():
     """Initialize the database with required tables"""
-    os.makedirs("data", exist_ok=True)
+    os.makedirs(os.path.dirname(DATABASE_PATH) or ".", exist_ok=True)
 
-    conn = sqlite3.connect(DATABASE_PATH)
+    conn = get_connection()
     cursor = conn.cursor()
 
     # Blogs table
@@ -84,12 +99,97 @@ def init_db():
         )
     """)
 
+    # LLM response cache (see utils/llm_cache.py)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS llm_cache (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            created_at REAL NOT NULL
+        )
+    """)
+
     conn.commit()
-    conn.close()
+
+    # Columns and indexes added after the initial schema
+    apply_migrations(conn)
 
     # Initialize agents if not exists
     populate_agents()
 
+def ensure_column(cursor, table, column, definition):
+    """Add a column to an existing table if it is missing"""
+    cursor.execute(f"PRAGMA table_info({table})")
+    if column not in [row[1] for row in cursor.fetchall()]:
+        cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+# Schema changes after the initial tables, applied once each in version order.
+# A step is an SQL statement or a callable taking the cursor; never edit a
+# released migration, append a new version instead.
+MIGRATIONS = [
+    (1, "tasks.progress column", [
+        lambda cursor: ensure_column(cursor, "tasks", "progress", "TEXT"),
+    ]),
+    (2, "listing and lookup indexes", [
+        "CREATE INDEX IF NOT EXISTS idx_blogs_created_at ON blogs (created_at, id)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_blog_id ON tasks (blog_id)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_agent_id ON tasks (agent_id)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_status_type ON tasks (status, task_type)",
+        "CREATE INDEX IF NOT EXISTS idx_analytics_blog_metric ON analytics (blog_id, metric_name, recorded_at)",
+        "CREATE INDEX IF NOT EXISTS idx_llm_cache_created_at ON llm_cache (created_at)",
+    ]),
+    (3, "unique agent names", [
+        # Point tasks at the surviving row of each name, drop the duplicates, then enforce uniqueness
+        """
+        UPDATE tasks SET agent_id = (
+            SELECT MIN(keep.id) FROM agents keep
+            WHERE keep.name = (SELECT name FROM agents WHERE id = tasks.agent_id)
+        )
+        WHERE agent_id IN (SELECT id FROM agents WHERE id NOT IN (SELECT MIN(id) FROM agents GROUP BY name))
+        """,
+        "DELETE FROM agents WHERE id NOT IN (SELECT MIN(id) FROM agents GROUP BY name)",
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_agents_name ON agents (name)",
+    ]),
+    (4, "filtered blog listing indexes", [
+        "CREATE INDEX IF NOT EXISTS idx_blogs_status_created_at ON blogs (status, created_at, id)",
+        "CREATE INDEX IF NOT EXISTS idx_blogs_topic_created_at ON blogs (topic, created_at, id)",
+    ]),
+]
+
+def apply_migrations(conn):
+    """Apply pending MIGRATIONS, each in its own transaction, and return the applied versions"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    done = {row[0] for row in conn.execute("SELECT version FROM schema_migrations")}
+    applied = []
+    for version, name, steps in MIGRATIONS:
+        if version in done:
+            continue
+        # IMMEDIATE takes the write lock up front, so concurrent workers apply each version once
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if conn.execute("SELECT 1 FROM schema_migrations WHERE version = ?", (version,)).fetchone():
+                conn.rollback()  # Applied by another process meanwhile
+                continue
+            cursor = conn.cursor()
+            for step in steps:
+                if callable(step):
+                    step(cursor)
+                else:
+                    cursor.execute(step)
+            cursor.execute("INSERT INTO schema_migrations (version, name) VALUES (?, ?)", (version, name))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        applied.append(version)
+    return applied
+
 def populate_agents():
     """Populate the agents table with all 169 agents"""
     agents_data = [
@@ -164,63 +264,251 @@ def populate_agents():
         ("Content Sensitivity/Moderation Agent", "Content Enrichment"),
     ]
 
-    conn = sqlite3.connect(DATABASE_PATH)
-    cursor = conn.cursor()
-
-    for name, phase in agents_data[:50]:  # First 50 agents for demo
-        cursor.execute("""
+    with get_connection() as conn:
+        conn.executemany("""
             INSERT OR IGNORE INTO agents (name, phase) VALUES (?, ?)
-        """, (name, phase))
-
-    conn.commit()
-    conn.close()
+        """, agents_data[:50])  # First 50 agents for demo
 
 def get_connection():
-    """Get database connection"""
-    return sqlite3.connect(DATABASE_PATH)
+    """
+    Get this thread's pooled database connection, opening it on first use.
+
+    Connections live as long as their thread (the asyncio.to_thread workers
+    are long-lived), keep their prepared statements cached, and are used as
+    ``with conn:`` blocks so each write commits or rolls back as a unit.
+    """
+    path = os.path.abspath(DATABASE_PATH)
+    conn = getattr(_local, "conn", None)
+    if conn is not None and _local.path == path:
+        return conn
+
+    if conn is not None:
+        conn.close()
+    conn = sqlite3.connect(
+        path, timeout=SQLITE_BUSY_TIMEOUT, cached_statements=SQLITE_CACHED_STATEMENTS
+    )
+    for pragma, value in SQLITE_PRAGMAS.items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
+    _local.conn = conn
+    _local.path = path
+    return conn
+
+def close_connection():
+    """Close this thread's pooled connection, if any"""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
 
 def create_blog(title, topic, target_audience, tone, length_category):
     """Create a new blog entry"""
-    conn = get_connection()
-    cursor = conn.cursor()
+    with get_connection() as conn:
+        cursor = conn.execute("""
+            INSERT INTO blogs (title, topic, target_audience, tone, length_category)
+            VALUES (?, ?, ?, ?, ?)
+        """, (title, topic, target_audience, tone, length_category))
 
-    cursor.execute("""
-        INSERT INTO blogs (title, topic, target_audience, tone, length_category)
-        VALUES (?, ?, ?, ?, ?)
-    """, (title, topic, target_audience, tone, length_category))
-
-    blog_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
-
-    return blog_id
+    return cursor.lastrowid
 
 def get_all_blogs():
     """Get all blogs"""
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("""
+    return get_connection().execute("""
         SELECT id, title, topic, status, created_at, seo_score, quality_score
-        FROM blogs ORDER BY created_at DESC
-    """)
-
-    blogs = cursor.fetchall()
-    conn.close()
-
-    return blogs
+        FROM blogs ORDER BY created_at DESC, id DESC
+    """).fetchall()
+
+def list_blogs(status=None, topic=None, before=None, limit=20):
+    """Get one page of blogs as dicts, newest first, starting after the (created_at, id) key in before"""
+    filters = {"status": status, "topic": topic}
+    conditions = [f"{column} = ?" for column, value in filters.items() if value is not None]
+    params = [value for value in filters.values() if value is not None]
+    if before is not None:
+        # Keyset condition: seeks the (filter, created_at, id) index instead of skipping OFFSET rows
+        conditions.append("(created_at, id) < (?, ?)")
+        params.extend(before)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    cursor = get_connection().cursor()
+    cursor.row_factory = sqlite3.Row
+
+    cursor.execute(f"""
+        SELECT id, title, topic, status, target_audience, tone, length_category,
+               seo_score, quality_score, created_at, updated_at
+        FROM blogs {where} ORDER BY created_at DESC, id DESC LIMIT ?
+    """, params + [limit])
+
+    return [dict(row) for row in cursor]
 
 def get_agent_stats():
     """Get agent statistics"""
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("""
+    return get_connection().execute("""
         SELECT name, phase, status, success_count, failure_count
         FROM agents ORDER BY success_count DESC LIMIT 10
-    """)
+    """).fetchall()
+
+def create_task(task_type, blog_id=None, agent_id=None, status="pending"):
+    """Create a task entry and return its id"""
+    with get_connection() as conn:
+        cursor = conn.execute("""
+            INSERT INTO tasks (blog_id, agent_id, task_type, status)
+            VALUES (?, ?, ?, ?)
+        """, (blog_id, agent_id, task_type, status))
+
+    return cursor.lastrowid
+
+def update_task(task_id, **fields):
+    """Update columns of a task entry (status, progress, result, error_message, timestamps, blog_id)"""
+    allowed = {"status", "progress", "result", "error_message", "started_at", "completed_at", "blog_id"}
+    columns = [column for column in fields if column in allowed]
+    if not columns:
+        return
+
+    assignments = ", ".join(f"{column} = ?" for column in columns)
+    with get_connection() as conn:
+        conn.execute(
+            f"UPDATE tasks SET {assignments} WHERE id = ?",
+            [fields[column] for column in columns] + [task_id]
+        )
+
+def record_task_results(rows):
+    """Insert finished task rows (blog_id, agent name, task_type, status, started_at, completed_at, result, error_message) in one transaction"""
+    with get_connection() as conn:
+        conn.executemany("""
+            INSERT INTO tasks (blog_id, agent_id, task_type, status, started_at, completed_at, result, error_message)
+            VALUES (?, (SELECT id FROM agents WHERE name = ? LIMIT 1), ?, ?, ?, ?, ?, ?)
+        """, rows)
 
-    stats = cursor.fetchall()
-    conn.close()
+def get_task(task_id):
+    """Get a task entry as a dict, or None"""
+    cursor = get_connection().cursor()
+    cursor.row_factory = sqlite3.Row
+
+    cursor.execute("""
+        SELECT id, blog_id, agent_id, task_type, status, progress, started_at,
+               completed_at, result, error_message
+        FROM tasks WHERE id = ?
+    """, (task_id,))
+
+    row = cursor.fetchone()
+    return dict(row) if row else None
+
+def fail_interrupted_tasks(task_types, message="Interrupted by server restart"):
+    """Mark tasks of the given types that never finished as failed"""
+    if not task_types:
+        return 0
+
+    placeholders = ", ".join("?" for _ in task_types)
+    with get_connection() as conn:
+        cursor = conn.execute(f"""
+            UPDATE tasks SET status = 'failed', error_message = ?, completed_at = CURRENT_TIMESTAMP
+            WHERE status IN ('pending', 'running') AND task_type IN ({placeholders})
+        """, [message] + list(task_types))
+
+    return cursor.rowcount
+
+def get_cached_response(key, min_created_at):
+    """Get a cached LLM response newer than min_created_at, or None"""
+    return get_connection().execute("""
+        SELECT value, created_at FROM llm_cache WHERE key = ? AND created_at >= ?
+    """, (key, min_created_at)).fetchone()
+
+def set_cached_response(key, value, created_at):
+    """Store an LLM response in the cache table"""
+    with get_connection() as conn:
+        conn.execute("""
+            INSERT OR REPLACE INTO llm_cache (key, value, created_at) VALUES (?, ?, ?)
+        """, (key, value, created_at))
+
+def purge_cached_responses(min_created_at):
+    """Delete cached LLM responses older than min_created_at"""
+    with get_connection() as conn:
+        cursor = conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (min_created_at,))
+
+    return cursor.rowcount
+
+def get_blog(blog_id):
+    """Get a blog entry as a dict, or None"""
+    cursor = get_connection().cursor()
+    cursor.row_factory = sqlite3.Row
+
+    cursor.execute("SELECT * FROM blogs WHERE id = ?", (blog_id,))
+
+    row = cursor.fetchone()
+    return dict(row) if row else None
+
+def update_blog(blog_id, **fields):
+    """Update columns of a blog entry (content, status, scores, ...) and its updated_at"""
+    allowed = {
+        "title", "content", "meta_description", "keywords", "status", "topic",
+        "target_audience", "tone", "length_category", "seo_score", "quality_score",
+    }
+    columns = [column for column in fields if column in allowed]
+    if not columns:
+        return
+
+    assignments = ", ".join(f"{column} = ?" for column in columns)
+    with get_connection() as conn:
+        conn.execute(
+            f"UPDATE blogs SET {assignments}, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+            [fields[column] for column in columns] + [blog_id]
+        )
+
+def delete_blog(blog_id):
+    """Delete a blog entry"""
+    with get_connection() as conn:
+        conn.execute("DELETE FROM blogs WHERE id = ?", (blog_id,))
+
+def list_tasks(status=None, task_type=None, blog_id=None, limit=50):
+    """Get the most recent task entries as dicts, optionally filtered"""
+    filters = {"status": status, "task_type": task_type, "blog_id": blog_id}
+    conditions = [f"{column} = ?" for column, value in filters.items() if value is not None]
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    cursor = get_connection().cursor()
+    cursor.row_factory = sqlite3.Row
+
+    cursor.execute(f"""
+        SELECT id, blog_id, agent_id, task_type, status, progress, started_at,
+               completed_at, error_message
+        FROM tasks {where} ORDER BY id DESC LIMIT ?
+    """, [value for value in filters.values() if value is not None] + [limit])
+
+    return [dict(row) for row in cursor.fetchall()]
+
+def record_metrics(blog_id, metrics):
+    """Store several named metric values for a blog in one transaction"""
+    with get_connection() as conn:
+        conn.executemany("""
+            INSERT INTO analytics (blog_id, metric_name, metric_value) VALUES (?, ?, ?)
+        """, [(blog_id, name, value) for name, value in metrics.items()])
+
+def get_blog_metrics(blog_id):
+    """Get the latest value of every metric recorded for a blog"""
+    rows = get_connection().execute("""
+        SELECT metric_name, metric_value FROM analytics
+        WHERE blog_id = ? ORDER BY recorded_at, id
+    """, (blog_id,)).fetchall()
+
+    return dict(rows)
+
+def get_analytics_summary():
+    """Get blog and task counts by status plus average blog scores"""
+    conn = get_connection()
 
-    return stats
+    blogs_by_status = dict(conn.execute(
+        "SELECT status, COUNT(*) FROM blogs GROUP BY status"
+    ).fetchall())
+    tasks_by_status = dict(conn.execute(
+        "SELECT status, COUNT(*) FROM tasks GROUP BY status"
+    ).fetchall())
+    avg_seo, avg_quality = conn.execute(
+        "SELECT AVG(seo_score), AVG(quality_score) FROM blogs"
+    ).fetchone()
+
+    return {
+        "blogs_total": sum(blogs_by_status.values()),
+        "blogs_by_status": blogs_by_status,
+        "tasks_by_status": tasks_by_status,
+        "avg_seo_score": avg_seo,
+        "avg_quality_score": avg_quality,
+    }
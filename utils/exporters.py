@@ -0,0 +1,726 @@
+import re
+import base64
+import zipfile
+from io import BytesIO
+from datetime import datetime
+from html import escape
+from typing import List, Optional, Dict, Any, Tuple, Iterator
+
+from fpdf import FPDF
+from docx import Document
+from docx.shared import Pt, RGBColor, Inches
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from PIL import Image
+
+from utils.http_client import http_client
+from utils.image_cache import image_cache
+from utils.markdown_blocks import (
+    Block, parse_markdown, strip_inline_markdown, BLANK, HEADING, BULLET, NUMBERED, QUOTE, LABELED,
+)
+
+
+# =========================================================
+# Text Cleaning Helpers
+# =========================================================
+
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7F]+")
+
+
+def clean_text(text: str) -> str:
+    """Remove emojis & unsupported chars for PDF safety."""
+    return _NON_ASCII_RE.sub(" ", text)
+
+
+def clean_markdown_formatting(text: str) -> str:
+    """
+    Remove markdown formatting like **bold**, *italic*, and leading # from headings.
+    """
+    return strip_inline_markdown(text)
+
+
+def sanitize_caption(caption: str, max_words: int = 8) -> str:
+    caption = re.sub(r"[^\w\s]", " ", caption)
+    caption = re.sub(r"\s+", " ", caption).strip()
+
+    words = caption.split()
+    if not words:
+        return "Image"
+
+    words = words[:max_words]
+    words = [w[:20] for w in words]
+    return " ".join(words)
+
+
+# =========================================================
+# PDF / DOCX / HTML generation (from your app2.py)
+# =========================================================
+
+IMAGE_REQUEST_HEADERS = {"User-Agent": "Mozilla/5.0", "Accept": "image/*"}
+EXIF_ORIENTATION = 0x0112
+
+
+def decode_image(data: bytes) -> Image.Image:
+    img = Image.open(BytesIO(data))
+    img.load()
+    return img
+
+
+def flatten_to_rgb(img: Image.Image) -> Image.Image:
+    """
+    Normalize to RGB for JPEG output, compositing transparency onto white.
+    """
+    if img.mode == "RGB":
+        return img
+    if img.mode in ("RGBA", "LA", "P"):
+        img = img.convert("RGBA")
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        background.paste(img, mask=img.split()[3])
+        return background
+    return img.convert("RGB")
+
+
+def encode_jpeg(img: Image.Image, quality: int = 85) -> bytes:
+    buffer = BytesIO()
+    img.save(buffer, "JPEG", quality=quality)
+    return buffer.getvalue()
+
+
+def normalize_image(data: bytes) -> bytes:
+    """
+    Decode any supported image and re-encode it as an RGB JPEG. An upright
+    RGB JPEG is returned as is, so it is never re-encoded on the way in.
+    """
+    img = decode_image(data)
+    if img.format == "JPEG" and img.mode == "RGB" and img.getexif().get(EXIF_ORIENTATION, 1) == 1:
+        return data
+    return encode_jpeg(flatten_to_rgb(img), quality=90)
+
+
+def read_image_source(img_url_or_path: str) -> bytes:
+    """
+    Raw bytes of a data URI, http(s) URL or local path (blocking).
+    """
+    if img_url_or_path.startswith("data:image"):
+        header, b64data = img_url_or_path.split(",", 1)
+        return base64.b64decode(b64data)
+    if img_url_or_path.startswith("http"):
+        resp = http_client.get_sync(img_url_or_path, headers=IMAGE_REQUEST_HEADERS)
+        resp.raise_for_status()
+        return resp.content
+    with open(img_url_or_path, "rb") as f:
+        return f.read()
+
+
+def load_image(img_url_or_path: str) -> bytes:
+    """
+    Normalized JPEG bytes of an image source, from the processed-image cache
+    when available (blocking).
+    """
+    key = image_cache.make_key(img_url_or_path)
+    data = image_cache.get(key)
+    if data is None:
+        data = normalize_image(read_image_source(img_url_or_path))
+        image_cache.set(key, data)
+    return data
+
+
+def image_rendition(img_url_or_path: str, width_px: int, img: Optional[bytes] = None) -> bytes:
+    """
+    JPEG of an image scaled down to width_px (never up), from the
+    processed-image cache when available. img is the prefetched normalized
+    JPEG; without it the image is loaded here. An image already narrow enough
+    is returned as the normalized JPEG itself rather than encoded again.
+    """
+    key = image_cache.make_key(img_url_or_path, width_px)
+    rendition = image_cache.get(key)
+    if rendition is None:
+        data = img if img is not None else load_image(img_url_or_path)
+        source = decode_image(data)
+        w, h = source.size
+        if w <= width_px:
+            return data
+        source = source.resize((width_px, max(1, int(h * width_px / w))), Image.Resampling.LANCZOS)
+        rendition = encode_jpeg(source)
+        image_cache.set(key, rendition)
+    return rendition
+
+
+def inline_image_uri(img_url_or_path: str, width_px: int, img: Optional[bytes] = None) -> str:
+    """Size-reduced rendition of an image as a JPEG data URI"""
+    encoded = base64.b64encode(image_rendition(img_url_or_path, width_px, img)).decode("ascii")
+    return f"data:image/jpeg;base64,{encoded}"
+
+
+def add_image_to_pdf(
+    pdf: FPDF,
+    img_url_or_path: str,
+    max_width: int = 160,
+    caption: str = "",
+    img: Optional[bytes] = None,
+) -> bool:
+    """
+    Place an image with its caption. img is the prefetched normalized JPEG;
+    without it the image is loaded here. The resized rendition is cached.
+    """
+    try:
+        usable_width = pdf.w - pdf.l_margin - pdf.r_margin
+        new_w = min(max_width, usable_width)
+        # Convert mm → px (approx 3.78 px/mm)
+        width_px = int(new_w * 3.78)
+
+        rendition = image_rendition(img_url_or_path, width_px, img)
+
+        x = pdf.l_margin + (usable_width - new_w) / 2
+        pdf.image(BytesIO(rendition), x=x, w=new_w)
+
+        pdf.ln(4)
+
+        if caption:
+            safe_caption = sanitize_caption(caption)
+            page_width = pdf.w - pdf.l_margin - pdf.r_margin
+            pdf.set_font("helvetica", "I", 9)
+            pdf.set_text_color(110, 110, 110)
+            pdf.multi_cell(page_width, 5, safe_caption, 0, "C")
+            pdf.set_text_color(40, 40, 40)
+            pdf.ln(3)
+
+        return True
+
+    except Exception:
+        add_pdf_image_placeholder(pdf)
+        return False
+
+
+def add_pdf_image_placeholder(pdf: FPDF):
+    pdf.set_font("helvetica", "I", 9)
+    pdf.set_text_color(150, 150, 150)
+    pdf.multi_cell(0, 5, "[Image could not be loaded]", 0, "C")
+    pdf.set_text_color(40, 40, 40)
+    pdf.ln(4)
+
+
+def generate_pdf(
+    title: str,
+    content: str,
+    meta_info: Dict[str, Any],
+    images: Optional[List[str]] = None,
+    image_descriptions: Optional[List[str]] = None,
+    loaded_images: Optional[List[Optional[bytes]]] = None,
+    blocks: Optional[Tuple[Block, ...]] = None,
+) -> bytes:
+    """
+    loaded_images, if given, holds the prefetched JPEG bytes aligned with images
+    (None marks one that failed); otherwise each image is loaded during layout.
+    blocks, if given, is the already parsed content.
+    """
+    images = images or []
+    image_descriptions = image_descriptions or []
+
+    blocks = blocks if blocks is not None else parse_markdown(content)
+    title = title[:150]
+
+    pdf = FPDF(orientation="P", unit="mm", format="A4")
+    pdf.set_left_margin(15)
+    pdf.set_right_margin(15)
+    pdf.set_auto_page_break(auto=True, margin=15)
+    pdf.add_page()
+
+    # Title
+    pdf.set_font("helvetica", "B", 20)
+    pdf.multi_cell(0, 10, clean_markdown_formatting(title), 0, "C")
+    pdf.ln(4)
+
+    # Divider
+    pdf.set_draw_color(52, 152, 219)
+    pdf.set_line_width(0.8)
+    y = pdf.get_y()
+    pdf.line(pdf.l_margin, y, pdf.w - pdf.r_margin, y)
+    pdf.ln(8)
+
+    # Meta info
+    pdf.set_font("helvetica", "", 10)
+    pdf.set_text_color(90, 90, 90)
+    pdf.cell(0, 5, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}", 0, 1)
+
+    # Expecting keys like word_count, reading_time, seo_score
+    for key, val in meta_info.items():
+        label = key.replace("_", " ").title()
+        pdf.cell(0, 5, f"{label}: {val}", 0, 1)
+
+    pdf.set_text_color(40, 40, 40)
+    pdf.ln(8)
+
+    # Images section
+    if images:
+        pdf.set_font("helvetica", "B", 14)
+        pdf.cell(0, 8, "Visual Content", 0, 1)
+        pdf.ln(2)
+
+        for i, img in enumerate(images):
+            desc = image_descriptions[i] if i < len(image_descriptions) else "Image"
+            caption = f"Figure {i+1}: {sanitize_caption(desc)}"
+            if loaded_images is None:
+                add_image_to_pdf(pdf, img, max_width=170, caption=caption)
+            elif loaded_images[i] is not None:
+                add_image_to_pdf(pdf, img, max_width=170, caption=caption, img=loaded_images[i])
+            else:
+                add_pdf_image_placeholder(pdf)
+
+        pdf.ln(4)
+
+    page_width = pdf.w - pdf.l_margin - pdf.r_margin
+
+    for block in blocks:
+        text = clean_text(block.text)
+
+        if block.kind == BLANK:
+            pdf.ln(3)
+
+        elif block.kind == HEADING:
+            if block.level == 1:
+                pdf.set_font("helvetica", "B", 16)
+            elif block.level == 2:
+                pdf.set_font("helvetica", "B", 13)
+            else:
+                pdf.set_font("helvetica", "B", 12)
+
+            pdf.multi_cell(0, 7, text, 0, "L")
+            pdf.ln(2)
+
+        elif block.kind == NUMBERED:
+            pdf.set_font("helvetica", "", 11)
+
+            indent = pdf.l_margin + 5
+            pdf.set_x(indent)
+            pdf.cell(8, 6, f"{block.marker}.", 0, 0)
+            pdf.multi_cell(page_width - 13, 6, text, 0, "L")
+
+        elif block.kind == BULLET:
+            pdf.set_font("helvetica", "", 11)
+            pdf.set_x(pdf.l_margin + 5)
+            pdf.multi_cell(page_width - 5, 6, f"- {text}", 0, "L")
+
+        elif block.kind == QUOTE:
+            pdf.set_font("helvetica", "I", 11)
+            pdf.set_text_color(120, 120, 120)
+            pdf.multi_cell(page_width, 6, text, 0, "L")
+            pdf.set_text_color(40, 40, 40)
+
+        elif block.kind == LABELED:
+            pdf.set_font("helvetica", "", 11)
+            pdf.multi_cell(page_width, 6, f"{clean_text(block.label)}: {text}", 0, "L")
+
+        else:
+            pdf.set_font("helvetica", "", 11)
+            pdf.multi_cell(page_width, 6, text, 0, "L")
+
+    return bytes(pdf.output())
+
+
+def generate_docx(
+    title: str,
+    content: str,
+    meta_info: Dict[str, Any],
+    images: Optional[List[str]] = None,
+    image_descriptions: Optional[List[str]] = None,
+    loaded_images: Optional[List[Optional[bytes]]] = None,
+    blocks: Optional[Tuple[Block, ...]] = None,
+) -> bytes:
+    """
+    loaded_images and blocks work as in generate_pdf.
+    """
+    images = images or []
+    image_descriptions = image_descriptions or []
+
+    blocks = blocks if blocks is not None else parse_markdown(content)
+
+    doc = Document()
+
+    # Title
+    title_para = doc.add_heading(clean_markdown_formatting(title), 0)
+    title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    doc.add_paragraph()
+
+    # Meta info
+    meta_para = doc.add_paragraph()
+    run = meta_para.add_run(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n")
+    run.font.size = Pt(10)
+    run.font.color.rgb = RGBColor(100, 100, 100)
+    run.italic = True
+
+    wc = meta_info.get("word_count", "N/A")
+    rt = meta_info.get("reading_time", "N/A")
+
+    run = meta_para.add_run(f"Word Count: {wc}\n")
+    run.font.size = Pt(10)
+    run.font.color.rgb = RGBColor(100, 100, 100)
+
+    run = meta_para.add_run(f"Reading Time: {rt}\n")
+    run.font.size = Pt(10)
+    run.font.color.rgb = RGBColor(100, 100, 100)
+
+    doc.add_paragraph()
+
+    # Images
+    if images:
+        doc.add_heading("Visual Content", level=2)
+        doc.add_paragraph()
+
+        for idx, img_url in enumerate(images, 1):
+            desc = image_descriptions[idx - 1] if idx - 1 < len(image_descriptions) else "Content Image"
+            try:
+                img = loaded_images[idx - 1] if loaded_images is not None else load_image(img_url)
+                if img is None:
+                    raise ValueError(f"Figure {idx} was not fetched")
+
+                doc.add_picture(BytesIO(img), width=Inches(6))
+
+                caption_para = doc.add_paragraph()
+                caption_run = caption_para.add_run(f"Figure {idx}: {desc}")
+                caption_run.font.size = Pt(9)
+                caption_run.italic = True
+                caption_run.font.color.rgb = RGBColor(100, 100, 100)
+                caption_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+                doc.add_paragraph()
+            except Exception:
+                p = doc.add_paragraph()
+                run_err = p.add_run(f"[Figure {idx}: {desc} could not be loaded]")
+                run_err.italic = True
+                run_err.font.color.rgb = RGBColor(150, 150, 150)
+
+    # Content
+    for block in blocks:
+        if block.kind == BLANK:
+            doc.add_paragraph()
+
+        elif block.kind == HEADING:
+            doc.add_heading(block.text, level=min(block.level, 4))
+
+        elif block.kind == BULLET:
+            para = doc.add_paragraph(style="List Bullet")
+            para.add_run(block.text)
+
+        elif block.kind == NUMBERED:
+            para = doc.add_paragraph()
+            para.add_run(f"{block.marker}. {block.text}")
+
+        elif block.kind == QUOTE:
+            para = doc.add_paragraph(style="Quote")
+            para.add_run(block.text)
+
+        elif block.kind == LABELED:
+            para = doc.add_paragraph()
+            run_label = para.add_run(block.label + ":")
+            run_label.bold = True
+            if block.text:
+                para.add_run(" " + block.text)
+
+        else:
+            para = doc.add_paragraph()
+            para.add_run(block.text)
+
+    docx_file = BytesIO()
+    doc.save(docx_file)
+    docx_file.seek(0)
+    return docx_file.getvalue()
+
+
+HTML_CHUNK_LINES = 256
+
+
+def iter_html(
+    title: str,
+    content: str,
+    meta_info: Dict[str, Any],
+    images: Optional[List[str]] = None,
+    image_descriptions: Optional[List[str]] = None,
+    blocks: Optional[Tuple[Block, ...]] = None,
+) -> Iterator[str]:
+    """
+    Generate styled HTML report, similar to your Streamlit export, as a
+    sequence of chunks: the head, then the gallery and content in batches of
+    HTML_CHUNK_LINES lines. images are used as <img> sources verbatim.
+    """
+    images = images or []
+    image_descriptions = image_descriptions or []
+
+    # Every interpolated value is escaped; html.escape quotes " and ' for attributes too
+    title_clean = escape(clean_markdown_formatting(title))
+    meta = {key: escape(str(meta_info.get(key, "N/A"))) for key in ("word_count", "reading_time", "seo_score")}
+    blocks = blocks if blocks is not None else parse_markdown(content)
+
+    yield f"""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title_clean}</title>
+    <style>
+        body {{
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            line-height: 1.8;
+            max-width: 900px;
+            margin: 0 auto;
+            padding: 30px;
+            color: #333;
+            background-color: #f8f9fa;
+        }}
+        .container {{
+            background: white;
+            padding: 40px;
+            border-radius: 10px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }}
+        h1 {{
+            color: #2c3e50;
+            border-bottom: 4px solid #3498db;
+            padding-bottom: 15px;
+            margin-bottom: 30px;
+            font-size: 2.5em;
+        }}
+        h2 {{
+            color: #34495e;
+            margin-top: 40px;
+            margin-bottom: 20px;
+            font-size: 1.8em;
+            border-left: 4px solid #3498db;
+            padding-left: 15px;
+        }}
+        h3 {{
+            color: #555;
+            margin-top: 30px;
+            margin-bottom: 15px;
+            font-size: 1.4em;
+        }}
+        h4, h5, h6 {{
+            color: #555;
+            margin-top: 25px;
+            margin-bottom: 10px;
+        }}
+        .meta-info {{
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 20px;
+            border-radius: 8px;
+            margin: 25px 0;
+            font-size: 0.95em;
+        }}
+        .image-gallery {{
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+            gap: 20px;
+            margin: 30px 0;
+        }}
+        .image-gallery img {{
+            width: 100%;
+            height: auto;
+            border-radius: 10px;
+            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+            transition: transform 0.3s ease;
+        }}
+        .image-gallery img:hover {{
+            transform: scale(1.02);
+        }}
+        p {{
+            margin-bottom: 15px;
+            line-height: 1.8;
+        }}
+        blockquote {{
+            border-left: 5px solid #3498db;
+            margin: 25px 0;
+            padding: 15px 25px;
+            color: #555;
+            font-style: italic;
+            background: #ecf0f1;
+            border-radius: 5px;
+        }}
+        ul, ol {{
+            margin: 20px 0;
+            padding-left: 30px;
+        }}
+        li {{
+            margin-bottom: 12px;
+            line-height: 1.6;
+        }}
+        .caption {{
+            text-align: center;
+            font-size: 0.85em;
+            color: #666;
+            margin-top: 5px;
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>{title_clean}</h1>
+        <div class="meta-info">
+            <p><strong>📅 Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M')}</p>
+            <p><strong>📝 Word Count:</strong> {meta['word_count']}</p>
+            <p><strong>⏱️ Reading Time:</strong> {meta['reading_time']}</p>
+            <p><strong>🎯 SEO Score:</strong> {meta['seo_score']}</p>
+        </div>
+"""
+
+    parts: List[str] = []
+
+    # Images
+    if images:
+        parts.append("        <h2>Visual Content</h2>\n")
+        parts.append('        <div class="image-gallery">\n')
+        for i, img_url in enumerate(images):
+            desc = image_descriptions[i] if i < len(image_descriptions) else "Content Image"
+            parts.append("            <div>\n")
+            parts.append(f'                <img src="{escape(img_url)}" alt="Content image {i+1}" loading="lazy" />\n')
+            parts.append(f'                <div class="caption">Figure {i+1}: {escape(desc)}</div>\n')
+            parts.append("            </div>\n")
+        parts.append("        </div>\n")
+
+    parts.append('        <div class="content">\n')
+
+    open_list = ""
+
+    for block in blocks:
+        if len(parts) >= HTML_CHUNK_LINES:
+            yield "".join(parts)
+            parts = []
+
+        list_tag = {BULLET: "ul", NUMBERED: "ol"}.get(block.kind, "")
+        if open_list and open_list != list_tag:
+            parts.append(f"        </{open_list}>\n")
+            open_list = ""
+
+        text = escape(block.text)
+
+        if block.kind == BLANK:
+            parts.append("        <br>\n")
+
+        elif block.kind == HEADING:
+            tag = f"h{block.level}"
+            parts.append(f"        <{tag}>{text}</{tag}>\n")
+
+        elif block.kind == QUOTE:
+            parts.append(f"        <blockquote>{text}</blockquote>\n")
+
+        elif list_tag:
+            if not open_list:
+                start = f' start="{escape(block.marker)}"' if block.kind == NUMBERED else ""
+                parts.append(f"        <{list_tag}{start}>\n")
+                open_list = list_tag
+            parts.append(f"            <li>{text}</li>\n")
+
+        elif block.kind == LABELED:
+            parts.append(f"        <p><strong>{escape(block.label)}:</strong> {text}</p>\n")
+
+        else:
+            parts.append(f"        <p>{text}</p>\n")
+
+    if open_list:
+        parts.append(f"        </{open_list}>\n")
+
+    parts.append("""
+        </div>
+    </div>
+</body>
+</html>
+""")
+    yield "".join(parts)
+
+
+def generate_html(
+    title: str,
+    content: str,
+    meta_info: Dict[str, Any],
+    images: Optional[List[str]] = None,
+    image_descriptions: Optional[List[str]] = None,
+    blocks: Optional[Tuple[Block, ...]] = None,
+) -> bytes:
+    """
+    The whole HTML report at once; see iter_html.
+    """
+    return "".join(iter_html(title, content, meta_info, images, image_descriptions, blocks)).encode("utf-8")
+
+
+HTML_IMAGE_MODES = ("original", "inline", "files")
+HTML_INLINE_IMAGE_WIDTH = 800
+HTML_IMAGE_FILE = "images/figure-{}.jpg"
+
+
+def html_image_sources(
+    images: List[str],
+    image_mode: str = "original",
+    loaded_images: Optional[List[Optional[bytes]]] = None,
+) -> List[str]:
+    """
+    <img> sources for an HTML export.
+
+    original: the sources as given (remote URLs, full data URIs)
+    inline: JPEG data URIs scaled down to HTML_INLINE_IMAGE_WIDTH
+    files: relative paths of the files from html_image_files
+    Images that could not be loaded keep their original source.
+    """
+    if image_mode == "original":
+        return list(images)
+
+    sources = []
+    for i, src in enumerate(images):
+        img = loaded_images[i] if loaded_images is not None else None
+        if loaded_images is not None and img is None:
+            sources.append(src)
+        elif image_mode == "files":
+            sources.append(HTML_IMAGE_FILE.format(i + 1))
+        else:
+            sources.append(inline_image_uri(src, HTML_INLINE_IMAGE_WIDTH, img))
+    return sources
+
+
+def html_image_files(loaded_images: List[Optional[bytes]]) -> Dict[str, bytes]:
+    """Image files shipped next to an HTML export in "files" mode"""
+    return {
+        HTML_IMAGE_FILE.format(i + 1): img
+        for i, img in enumerate(loaded_images)
+        if img is not None
+    }
+
+
+EXPORT_FORMATS = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "html": "text/html; charset=utf-8",
+}
+
+
+def render_export(
+    fmt: str,
+    title: str,
+    content: str,
+    meta_info: Dict[str, Any],
+    images: Optional[List[str]] = None,
+    image_descriptions: Optional[List[str]] = None,
+    loaded_images: Optional[List[Optional[bytes]]] = None,
+    blocks: Optional[Tuple[Block, ...]] = None,
+    image_mode: str = "original",
+) -> bytes:
+    """
+    Render one export format. Module-level and fed only picklable arguments,
+    so it can run in a worker process. image_mode applies to HTML only.
+    """
+    if fmt == "pdf":
+        return generate_pdf(title, content, meta_info, images, image_descriptions, loaded_images, blocks)
+    if fmt == "docx":
+        return generate_docx(title, content, meta_info, images, image_descriptions, loaded_images, blocks)
+    if fmt == "html":
+        sources = html_image_sources(images or [], image_mode, loaded_images)
+        return generate_html(title, content, meta_info, sources, image_descriptions, blocks)
+    raise ValueError(f"Unsupported export format: {fmt}")
+
+
+def build_zip(files: Dict[str, bytes]) -> bytes:
+    """Pack rendered exports into an in-memory ZIP archive"""
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
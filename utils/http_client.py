@@ -0,0 +1,123 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict, Optional, AsyncIterator
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from config.settings import SETTINGS
+
+
+class HTTPClient:
+    """
+    Process-wide pooled HTTP clients for outbound calls.
+
+    Async code uses one ``httpx.AsyncClient`` and sync code (the export
+    renderers) one ``requests.Session``; both keep connections alive so
+    repeated calls to the same host skip DNS, TCP and TLS setup. At most
+    HTTP_MAX_CONNECTIONS_PER_HOST requests per host are in flight on each
+    client, and every request defaults to REQUEST_TIMEOUT seconds.
+    """
+
+    def __init__(self, timeout: float = None, max_connections: int = None, max_per_host: int = None):
+        self.timeout = timeout or SETTINGS["REQUEST_TIMEOUT"]
+        self.max_connections = max_connections or SETTINGS["HTTP_MAX_CONNECTIONS"]
+        self.max_per_host = max_per_host or SETTINGS["HTTP_MAX_CONNECTIONS_PER_HOST"]
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._session: Optional[requests.Session] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._async_client
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            # pool_block makes pool_maxsize a hard per-host cap instead of a keep-alive hint
+            adapter = HTTPAdapter(
+                pool_connections=self.max_connections,
+                pool_maxsize=self.max_per_host,
+                pool_block=True,
+            )
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """
+        GET through the shared async client
+
+        Args:
+            url: Absolute URL
+            **kwargs: Passed to httpx.AsyncClient.get (headers, params, timeout, ...)
+
+        Returns:
+            httpx.Response with the body read
+        """
+        async with self._host_limit(url):
+            return await self.async_client.get(url, **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, url: str, **kwargs) -> AsyncIterator[httpx.Response]:
+        """
+        GET through the shared async client without reading the body
+
+        Args:
+            url: Absolute URL
+            **kwargs: Passed to httpx.AsyncClient.stream
+
+        Yields:
+            httpx.Response whose body is consumed with aiter_bytes()
+        """
+        async with self._host_limit(url):
+            async with self.async_client.stream("GET", url, **kwargs) as response:
+                yield response
+
+    def get_sync(self, url: str, **kwargs) -> requests.Response:
+        """
+        GET through the shared requests session
+
+        Args:
+            url: Absolute URL
+            **kwargs: Passed to requests.Session.get (headers, params, timeout, ...)
+
+        Returns:
+            requests.Response
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.get(url, **kwargs)
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = self._host_limits[host] = asyncio.Semaphore(self.max_per_host)
+        return limit
+
+    async def aclose(self):
+        """Close both clients and drop pooled connections"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        self._host_limits.clear()
+
+
+# Shared by main.py and the API wrappers in utils
+http_client = HTTPClient()
@@ -0,0 +1,129 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+from config.settings import SETTINGS
+
+
+class ImageCache:
+    """
+    Cache of processed export images (normalized RGB JPEG bytes).
+
+    Keys combine a SHA-256 of the image source (URL, data URI or path) with
+    the target width of the rendition. Lookups hit an in-memory LRU bounded
+    to IMAGE_CACHE_MAX_MEMORY_MB first and IMAGE_CACHE_FOLDER on disk second.
+    Methods are blocking and thread-safe, so export renderers running in
+    worker threads can share one instance; disk errors are logged and
+    treated as misses.
+    """
+
+    def __init__(self, folder: str = None, max_memory_bytes: int = None, ttl: float = None):
+        self.folder = folder or SETTINGS["IMAGE_CACHE_FOLDER"]
+        self.max_memory_bytes = max_memory_bytes or SETTINGS["IMAGE_CACHE_MAX_MEMORY_MB"] * 1024 * 1024
+        self.ttl = ttl or SETTINGS["IMAGE_CACHE_TTL"]
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @staticmethod
+    def make_key(source: str, width: Optional[int] = None) -> str:
+        """
+        Key of one rendition of an image source
+
+        Args:
+            source: URL, data URI or local path
+            width: Target width in pixels; None for the full-size normalized image
+        """
+        digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        return f"{digest}_{width or 'full'}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached JPEG bytes or None"""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return data
+
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) >= self.ttl:
+                raise FileNotFoundError(path)
+            with open(path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except OSError as e:
+            self.logger.warning(f"Image cache read failed: {e}")
+            self.misses += 1
+            return None
+
+        self._remember(key, data)
+        self.hits += 1
+        return data
+
+    def set(self, key: str, data: bytes):
+        """Store JPEG bytes in both tiers"""
+        self._remember(key, data)
+        path = self._path(key)
+        # Render workers are separate processes, so the thread id alone is not unique
+        partial = f"{path}.{os.getpid()}.{threading.get_ident()}.part"
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            with open(partial, "wb") as file:
+                file.write(data)
+            os.replace(partial, path)
+        except OSError as e:
+            self.logger.warning(f"Image cache write failed: {e}")
+
+    def purge_expired(self) -> int:
+        """Delete renditions older than IMAGE_CACHE_TTL from disk"""
+        if not os.path.isdir(self.folder):
+            return 0
+
+        removed = 0
+        cutoff = time.time() - self.ttl
+        for name in os.listdir(self.folder):
+            path = os.path.join(self.folder, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+        }
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.folder, f"{key}.jpg")
+
+    def _remember(self, key: str, data: bytes):
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous)
+            self._memory[key] = data
+            self._memory_bytes += len(data)
+            while self._memory_bytes > self.max_memory_bytes and len(self._memory) > 1:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+
+
+# Shared by the PDF and DOCX renderers
+image_cache = ImageCache()
@@ -0,0 +1,169 @@
+import asyncio
+import json
+import logging
+from datetime import datetime
+from typing import Dict, Any, Callable, Awaitable, Optional, List
+
+from config.settings import SETTINGS
+from utils.async_database import db
+
+ProgressCallback = Callable[[str, float], Awaitable[None]]
+JobHandler = Callable[[Dict[str, Any], ProgressCallback], Awaitable[Any]]
+
+
+class QueueFullError(RuntimeError):
+    """Raised when a job is submitted while the queue is at capacity"""
+
+
+class JobQueue:
+    """
+    Background job queue served by a fixed pool of asyncio workers.
+
+    Every job is a row in the SQLite ``tasks`` table: submit() inserts it as
+    'pending', a worker moves it to 'running' and finally to 'completed' or
+    'failed' with its JSON result or error. Progress reported by the handler
+    is written to the row as it happens, so status survives in the database
+    even after the worker process is gone.
+    """
+
+    def __init__(self, concurrency: int = None, max_size: int = None):
+        self.concurrency = concurrency or SETTINGS["MAX_CONCURRENT_JOBS"]
+        self.max_size = max_size or SETTINGS["JOB_QUEUE_SIZE"]
+        self._handlers: Dict[str, JobHandler] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        # Queue slots claimed by submit() calls still writing their tasks row
+        self._reserved = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def register(self, job_type: str, handler: JobHandler):
+        """
+        Register the coroutine that executes jobs of a given type
+
+        Args:
+            job_type: Stored as tasks.task_type
+            handler: Called with (payload, progress) and returns a JSON-serializable result
+        """
+        self._handlers[job_type] = handler
+
+    @property
+    def job_types(self) -> List[str]:
+        return list(self._handlers)
+
+    async def start(self):
+        """Fail jobs left unfinished by a previous process and start the workers"""
+        if self._workers:
+            return
+
+        interrupted = await db.fail_interrupted_tasks(self.job_types)
+        if interrupted:
+            self.logger.warning(f"Marked {interrupted} interrupted jobs as failed")
+
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{i}")
+            for i in range(self.concurrency)
+        ]
+
+    async def stop(self):
+        """Cancel the workers; running jobs are recorded as failed"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit(self, job_type: str, payload: Dict[str, Any], blog_id: int = None) -> int:
+        """
+        Persist a job and enqueue it
+
+        Args:
+            job_type: A registered job type
+            payload: JSON-serializable handler input
+            blog_id: Optional blog the job belongs to
+
+        Returns:
+            Job id (tasks.id)
+        """
+        if job_type not in self._handlers:
+            raise ValueError(f"Unknown job type: {job_type}")
+        if self._queue is None:
+            raise RuntimeError("Job queue is not running")
+        if self._queue.qsize() + self._reserved >= self.max_size:
+            raise QueueFullError(f"Job queue is full ({self.max_size} jobs waiting)")
+
+        # Claim the slot before awaiting the insert so concurrent submits cannot overfill the queue
+        self._reserved += 1
+        try:
+            job_id = await db.create_task(job_type, blog_id)
+        finally:
+            self._reserved -= 1
+        self._queue.put_nowait((job_id, job_type, payload))
+        return job_id
+
+    async def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the persisted state of a job
+
+        Returns:
+            Dict with status, progress, result and error, or None if unknown
+        """
+        row = await db.get_task(job_id)
+        if not row or row["task_type"] not in self._handlers:
+            return None
+
+        return {
+            "jobId": row["id"],
+            "type": row["task_type"],
+            "status": row["status"],
+            "blogId": row["blog_id"],
+            "progress": json.loads(row["progress"]) if row["progress"] else None,
+            "result": json.loads(row["result"]) if row["result"] else None,
+            "error": row["error_message"],
+            "startedAt": row["started_at"],
+            "completedAt": row["completed_at"],
+        }
+
+    async def _worker(self):
+        while True:
+            job_id, job_type, payload = await self._queue.get()
+            try:
+                await self._run_job(job_id, job_type, payload)
+            except Exception:
+                # A failed status write must not take a worker (and its concurrency slot) with it
+                self.logger.exception(f"Job {job_id} ({job_type}) could not be recorded")
+            finally:
+                self._queue.task_done()
+
+    async def _run_job(self, job_id: int, job_type: str, payload: Dict[str, Any]):
+        async def progress(stage: str, percent: float):
+            # Best effort: a failed progress write must not abort the job
+            state = json.dumps({"stage": stage, "percent": round(percent, 1)})
+            try:
+                await db.update_task(job_id, progress=state)
+            except Exception as e:
+                self.logger.warning(f"Job {job_id} progress update failed: {e}")
+
+        try:
+            await db.update_task(job_id, status="running", started_at=datetime.now().isoformat())
+            result = await self._handlers[job_type](payload, progress)
+        except asyncio.CancelledError:
+            # Shielded so the row is still written on the database thread while this task unwinds
+            await asyncio.shield(db.update_task(
+                job_id, status="failed", error_message="Cancelled on shutdown",
+                completed_at=datetime.now().isoformat()
+            ))
+            raise
+        except Exception as e:
+            self.logger.exception(f"Job {job_id} ({job_type}) failed")
+            await db.update_task(
+                job_id, status="failed", error_message=str(e),
+                completed_at=datetime.now().isoformat()
+            )
+            return
+
+        await db.update_task(
+            job_id, status="completed",
+            result=json.dumps(result, default=str),
+            progress=json.dumps({"stage": "completed", "percent": 100.0}),
+            completed_at=datetime.now().isoformat()
+        )
@@ -0,0 +1,98 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
+
+from config.settings import SETTINGS
+from utils.async_database import db
+
+
+class LLMCache:
+    """
+    Content-addressed cache for LLM completions.
+
+    Keys are a SHA-256 of the rendered messages, model, temperature and token
+    limit. Lookups hit an in-memory LRU first and the SQLite ``llm_cache``
+    table second; entries older than CACHE_DURATION seconds are ignored, and
+    writes delete them from SQLite at most every LLM_CACHE_PURGE_INTERVAL
+    seconds. Database errors are logged and treated as misses, never raised.
+    """
+
+    def __init__(self, ttl: float = None, max_entries: int = None):
+        self.ttl = ttl or SETTINGS["CACHE_DURATION"]
+        self.max_entries = max_entries or SETTINGS["LLM_CACHE_MAX_ENTRIES"]
+        self.purge_interval = SETTINGS["LLM_CACHE_PURGE_INTERVAL"]
+        self._next_purge = time.time() + self.purge_interval
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @staticmethod
+    def make_key(model: str, messages: List[Dict[str, str]], temperature: float, max_tokens: int) -> str:
+        """Hash everything that determines the completion"""
+        payload = json.dumps(
+            {"model": model, "messages": messages, "temperature": temperature, "max_tokens": max_tokens},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return a fresh cached completion or None"""
+        now = time.time()
+
+        entry = self._memory.get(key)
+        if entry is not None:
+            created_at, value = entry
+            if now - created_at < self.ttl:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._memory[key]
+
+        try:
+            row = await db.get_cached_response(key, now - self.ttl)
+        except sqlite3.Error as e:
+            self.logger.warning(f"LLM cache read failed: {e}")
+            row = None
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        value, created_at = row
+        self._remember(key, value, created_at)
+        self.hits += 1
+        return value
+
+    async def set(self, key: str, value: str):
+        """Store a completion in both tiers"""
+        created_at = time.time()
+        self._remember(key, value, created_at)
+        try:
+            await db.set_cached_response(key, value, created_at)
+            if created_at >= self._next_purge:
+                self._next_purge = created_at + self.purge_interval
+                await self.purge_expired()
+        except sqlite3.Error as e:
+            self.logger.warning(f"LLM cache write failed: {e}")
+
+    async def purge_expired(self) -> int:
+        """Drop expired entries from the SQLite tier"""
+        return await db.purge_cached_responses(time.time() - self.ttl)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "memory_entries": len(self._memory)}
+
+    def _remember(self, key: str, value: str, created_at: float):
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+
+# Shared by all request handlers in the process
+llm_cache = LLMCache()
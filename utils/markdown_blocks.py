@@ -0,0 +1,87 @@
+import re
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+
+HEADING = "heading"
+BULLET = "bullet"
+NUMBERED = "numbered"
+QUOTE = "quote"
+LABELED = "labeled"
+PARAGRAPH = "paragraph"
+BLANK = "blank"
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s*(.*)")
+_NUMBERED_RE = re.compile(r"^(\d+)\.\s+(.*)")
+_BOLD_RE = re.compile(r"\*\*(.*?)\*\*")
+_ITALIC_RE = re.compile(r"(?<!\*)\*(?!\*)([^*]+?)\*(?!\*)")
+_LEADING_HASHES_RE = re.compile(r"^\s*#{1,6}\s*")
+
+
+class Block(NamedTuple):
+    """
+    One block of a parsed blog. ``text`` is already stripped of inline
+    markdown; ``level`` is the heading level, ``marker`` the list number and
+    ``label`` the bold lead-in of a labeled paragraph ("Label: text").
+    """
+    kind: str
+    text: str = ""
+    level: int = 0
+    marker: str = ""
+    label: str = ""
+
+
+def strip_inline_markdown(text: str) -> str:
+    """Remove **bold**, *italic* and leading # markers"""
+    text = _BOLD_RE.sub(r"\1", text)
+    text = _ITALIC_RE.sub(r"\1", text)
+    return _LEADING_HASHES_RE.sub("", text)
+
+
+def is_separator(line: str) -> bool:
+    """Lines made only of =, -, _, * or # (e.g. "====") carry no content"""
+    return bool(line) and all(c in "=-_*#" for c in line)
+
+
+def _is_label(label: str) -> bool:
+    words = label.split()
+    return 0 < len(words) <= 5 and all(w[:1].isupper() for w in words)
+
+
+def _parse_line(line: str) -> Block:
+    m = _HEADING_RE.match(line)
+    if m:
+        return Block(HEADING, strip_inline_markdown(m.group(2)), level=len(m.group(1)))
+
+    m = _NUMBERED_RE.match(line)
+    if m:
+        return Block(NUMBERED, strip_inline_markdown(m.group(2)), marker=m.group(1))
+
+    if line.startswith("- ") or line.startswith("* "):
+        return Block(BULLET, strip_inline_markdown(line[2:]))
+
+    if line.startswith("> "):
+        return Block(QUOTE, strip_inline_markdown(line[2:]))
+
+    label, sep, rest = line.partition(":")
+    if sep and _is_label(label):
+        return Block(LABELED, strip_inline_markdown(rest.strip()), label=strip_inline_markdown(label))
+
+    return Block(PARAGRAPH, strip_inline_markdown(line))
+
+
+@lru_cache(maxsize=64)
+def parse_markdown(content: str) -> Tuple[Block, ...]:
+    """
+    Parse blog markdown into blocks, one per non-separator line.
+
+    The result is immutable and cached per content, so the PDF, DOCX and HTML
+    renderers of one export share a single parse.
+    """
+    blocks = []
+    for raw in content.split("\n"):
+        line = raw.strip()
+        if not line:
+            blocks.append(Block(BLANK))
+        elif not is_separator(line):
+            blocks.append(_parse_line(line))
+    return tuple(blocks)
@@ -1,20 +1,75 @@
-import requests
 import asyncio
-from typing import Dict, List, Optional
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import aiofiles
+
 from config.settings import SETTINGS
+from utils.http_client import http_client
+from utils.single_flight import SingleFlight
 
 class PexelsAPI:
-    def __init__(self):
-        self.api_key = SETTINGS.get("PEXELS_API_KEY")
+    """
+    Async Pexels client.
+
+    Search results are cached in memory per query, page size, page and
+    orientation for PEXELS_CACHE_TTL seconds, and identical searches already
+    in flight share one request. The X-Ratelimit-* headers of every response
+    are tracked and the remaining count is decremented as each request is
+    sent: once fewer than PEXELS_RATE_LIMIT_RESERVE requests remain, calls
+    share one schedule of start slots spaced out over the rest of the
+    window, and with none left they are not sent until the window resets.
+    """
+
+    def __init__(self, api_key: str = None):
+        self.api_key = api_key or SETTINGS.get("PEXELS_API_KEY")
         self.base_url = "https://api.pexels.com/v1"
         self.headers = {"Authorization": self.api_key}
-
-    async def search_images(self, query: str, per_page: int = 5, page: int = 1) -> Dict:
-        """Search for images using Pexels API"""
+        self.cache_ttl = SETTINGS["PEXELS_CACHE_TTL"]
+        self.cache_max_entries = SETTINGS["PEXELS_CACHE_MAX_ENTRIES"]
+        self._cache: "OrderedDict[Tuple, Tuple[float, Dict]]" = OrderedDict()
+        self._searches = SingleFlight()
+        self.rate_limit_remaining: Optional[int] = None
+        self.rate_limit_reset: Optional[float] = None
+        self._next_slot = 0.0
+
+    async def search_images(
+        self, query: str, per_page: int = 5, page: int = 1,
+        orientation: str = None, mock_fallback: bool = True
+    ) -> Dict:
+        """Search for images using Pexels API, served from cache when fresh"""
 
         if not self.api_key or self.api_key == "YOUR_PEXELS_API_KEY":
             # Return mock data if API key not configured
-            return self.get_mock_response(query, per_page)
+            return self.get_mock_response(query, per_page) if mock_fallback else {"photos": []}
+
+        cache_key = (query.strip().lower(), per_page, page, orientation)
+        entry = self._cache.get(cache_key)
+        if entry is not None:
+            created_at, data = entry
+            if time.time() - created_at < self.cache_ttl:
+                self._cache.move_to_end(cache_key)
+                return data
+            del self._cache[cache_key]
+
+        data = await self._searches.do(
+            repr(cache_key), lambda: self._search(query, per_page, page, orientation)
+        )
+        if data is None:
+            return self.get_mock_response(query, per_page) if mock_fallback else {"photos": []}
+
+        self._cache[cache_key] = (time.time(), data)
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > self.cache_max_entries:
+            self._cache.popitem(last=False)
+        return data
+
+    async def _search(self, query: str, per_page: int, page: int, orientation: Optional[str]) -> Optional[Dict]:
+        if not await self._throttle():
+            print("Pexels API rate limit exhausted until the window resets")
+            return None
 
         try:
             url = f"{self.base_url}/search"
@@ -23,18 +78,62 @@ class PexelsAPI:
                 "per_page": per_page,
                 "page": page
             }
+            if orientation:
+                params["orientation"] = orientation
 
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
+            response = await http_client.get(url, headers=self.headers, params=params)
+            self._record_rate_limit(response.headers)
 
             if response.status_code == 200:
                 return response.json()
             else:
                 print(f"Pexels API error: {response.status_code}")
-                return self.get_mock_response(query, per_page)
+                return None
 
         except Exception as e:
             print(f"Error calling Pexels API: {e}")
-            return self.get_mock_response(query, per_page)
+            return None
+
+    async def _throttle(self) -> bool:
+        """
+        Claim one request from the rate-limit window and wait for its start slot.
+        False if no request may be sent. Everything up to the sleep runs without
+        awaiting, so concurrent callers claim requests and slots one at a time.
+        """
+        if self.rate_limit_remaining is None or self.rate_limit_reset is None:
+            return True
+
+        now = time.time()
+        window = self.rate_limit_reset - now
+        if window <= 0:
+            self.rate_limit_remaining = None
+            return True
+        if self.rate_limit_remaining <= 0:
+            return False
+
+        remaining = self.rate_limit_remaining
+        self.rate_limit_remaining -= 1
+        if remaining < SETTINGS["PEXELS_RATE_LIMIT_RESERVE"]:
+            interval = min(window / remaining, SETTINGS["PEXELS_MAX_THROTTLE_SECONDS"])
+            start = max(now, self._next_slot)
+            self._next_slot = start + interval
+            if start > now:
+                await asyncio.sleep(start - now)
+        return True
+
+    def _record_rate_limit(self, headers):
+        try:
+            remaining = int(headers["X-Ratelimit-Remaining"]) if "X-Ratelimit-Remaining" in headers else None
+            reset = float(headers["X-Ratelimit-Reset"]) if "X-Ratelimit-Reset" in headers else self.rate_limit_reset
+        except ValueError:
+            return
+        if remaining is None:
+            return
+        # Within the same window the headers predate requests sent since; keep the lower count
+        if reset == self.rate_limit_reset and self.rate_limit_remaining is not None:
+            remaining = min(remaining, self.rate_limit_remaining)
+        self.rate_limit_remaining = remaining
+        self.rate_limit_reset = reset
 
     def get_mock_response(self, query: str, per_page: int) -> Dict:
         """Generate mock Pexels response for development"""
@@ -70,15 +169,18 @@ class PexelsAPI:
             "next_page": f"https://api.pexels.com/v1/search/?page=2&per_page={per_page}&query={query}"
         }
 
-    def get_image_info(self, photo_id: int) -> Optional[Dict]:
+    async def get_image_info(self, photo_id: int) -> Optional[Dict]:
         """Get detailed information about a specific photo"""
 
         if not self.api_key or self.api_key == "YOUR_PEXELS_API_KEY":
             return None
+        if not await self._throttle():
+            return None
 
         try:
             url = f"{self.base_url}/photos/{photo_id}"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = await http_client.get(url, headers=self.headers)
+            self._record_rate_limit(response.headers)
 
             if response.status_code == 200:
                 return response.json()
@@ -89,19 +191,35 @@ class PexelsAPI:
             print(f"Error getting photo info: {e}")
             return None
 
-    def download_image(self, image_url: str, filename: str) -> bool:
-        """Download image from Pexels URL"""
+    async def download_image(self, image_url: str, filename: str, chunk_size: int = 64 * 1024) -> bool:
+        """Stream an image from a Pexels URL to disk in chunks"""
 
+        partial = f"{filename}.part"
         try:
-            response = requests.get(image_url, timeout=30)
+            async with http_client.stream(image_url) as response:
+                if response.status_code != 200:
+                    return False
 
-            if response.status_code == 200:
-                with open(filename, 'wb') as file:
-                    file.write(response.content)
-                return True
-            else:
-                return False
+                async with aiofiles.open(partial, "wb") as file:
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        await file.write(chunk)
+
+            os.replace(partial, filename)
+            return True
 
         except Exception as e:
             print(f"Error downloading image: {e}")
+            if os.path.exists(partial):
+                os.remove(partial)
             return False
+
+    def get_stats(self) -> Dict:
+        return {
+            "cached_searches": len(self._cache),
+            "rate_limit_remaining": self.rate_limit_remaining,
+            "rate_limit_reset": self.rate_limit_reset,
+        }
+
+
+# Shared by all request handlers in the process
+pexels_api = PexelsAPI()
@@ -0,0 +1,218 @@
+import asyncio
+import logging
+import multiprocessing
+import signal
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Dict, Any, Callable, Optional, Set
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+from config.settings import SETTINGS
+
+
+class RenderError(RuntimeError):
+    """Raised when a render job times out or its worker process dies"""
+
+
+class RenderTimeout(BaseException):
+    """
+    Raised inside a worker when its job runs past the deadline. A BaseException
+    so that broad ``except Exception`` handlers in renderers cannot swallow it.
+    """
+
+
+def _limit_memory(limit_bytes: int):
+    """Worker initializer: cap the address space of the worker process"""
+    if resource is not None and limit_bytes > 0:
+        resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, limit_bytes))
+
+
+def _raise_render_timeout(signum, frame):
+    raise RenderTimeout()
+
+
+def _run_with_deadline(call: Callable, timeout: float) -> Any:
+    """Run a job in the worker, timing it from when it actually starts"""
+    if not hasattr(signal, "setitimer"):  # Windows: only the parent-side limit applies
+        return call()
+    signal.signal(signal.SIGALRM, _raise_render_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return call()
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+class RenderPool:
+    """
+    Process pool for CPU-bound rendering (FPDF layout, python-docx, Pillow).
+
+    Workers are spawned on first use, each capped to RENDER_MEMORY_LIMIT_MB
+    of address space, so a runaway export fails with MemoryError in its
+    worker instead of growing the API process. Jobs running longer than
+    RENDER_TIMEOUT_SECONDS are interrupted by a timer in their worker, and
+    jobs still queued after that long are cancelled; both raise RenderError
+    and leave the pool alone. Only a job that ignores its timer (stuck in
+    native code) retires its executor: new jobs go to a fresh pool while
+    the other jobs already on the old one finish, and only then are the old
+    workers (including the stuck one) terminated. A worker that
+    dies breaks its whole executor; every job caught by that is retried once
+    in a process of its own, so only the document that crashes fails.
+    """
+
+    # How often a retired executor is checked for remaining jobs
+    DRAIN_POLL_SECONDS = 0.5
+    # Extra time a started job gets for its worker-side timer to fire
+    DEADLINE_GRACE_SECONDS = 5
+
+    def __init__(self, workers: int = None, timeout: float = None, memory_limit_mb: int = None):
+        self.workers = workers or SETTINGS["RENDER_WORKERS"]
+        self.timeout = timeout or SETTINGS["RENDER_TIMEOUT_SECONDS"]
+        self.memory_limit_mb = SETTINGS["RENDER_MEMORY_LIMIT_MB"] if memory_limit_mb is None else memory_limit_mb
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Jobs submitted to each live or retired executor, and the timed-out ones among them
+        self._in_flight: Dict[ProcessPoolExecutor, Set[Future]] = {}
+        self._stuck: Dict[ProcessPoolExecutor, Set[Future]] = {}
+        self._draining: Set[asyncio.Task] = set()
+        self.completed = 0
+        self.timeouts = 0
+        self.queue_timeouts = 0
+        self.crashes = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = self._new_executor(self.workers)
+        return self._executor
+
+    def _new_executor(self, workers: int) -> ProcessPoolExecutor:
+        # Spawned rather than forked so workers do not inherit the event loop's threads
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_limit_memory,
+            initargs=(self.memory_limit_mb * 1024 * 1024,),
+        )
+
+    async def run(self, func: Callable, *args, timeout: float = None, **kwargs) -> Any:
+        """
+        Run a module-level function with picklable arguments in a worker
+
+        Args:
+            func: Function importable by the worker process
+            *args: Positional arguments
+            timeout: Seconds before giving up; RENDER_TIMEOUT_SECONDS if None
+            **kwargs: Keyword arguments
+
+        Returns:
+            The function's return value; exceptions raised by it propagate
+        """
+        timeout = timeout or self.timeout
+        call = partial(func, *args, **kwargs)
+
+        executor = self.executor
+        try:
+            return await self._run_on(executor, call, timeout, func.__name__)
+        except BrokenProcessPool:
+            self.crashes += 1
+            self._retire(executor)
+
+        # Some job on the pool killed its worker; retry alone so a repeat offender only fails itself
+        self.logger.warning(f"Render worker died; retrying {func.__name__} in its own process")
+        isolated = self._new_executor(1)
+        try:
+            return await self._run_on(isolated, call, timeout, func.__name__)
+        except BrokenProcessPool:
+            self.crashes += 1
+            raise RenderError(f"Render worker died while running {func.__name__}")
+        finally:
+            self._terminate(isolated)
+
+    async def _run_on(self, executor: ProcessPoolExecutor, call: Callable, timeout: float, name: str) -> Any:
+        future = executor.submit(_run_with_deadline, call, timeout)
+        self._in_flight.setdefault(executor, set()).add(future)
+        # Shielded: a parent-side timeout must not cancel the job, only stop waiting for it
+        waiter = asyncio.wrap_future(future)
+        try:
+            try:
+                result = await asyncio.wait_for(asyncio.shield(waiter), timeout)
+            except asyncio.TimeoutError:
+                if future.cancel():
+                    self.queue_timeouts += 1
+                    raise RenderError(f"{name} waited over {timeout}s for a render worker")
+                # Started at some point; its worker-side timer is the accurate clock
+                try:
+                    result = await asyncio.wait_for(
+                        asyncio.shield(waiter), timeout + self.DEADLINE_GRACE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    self.timeouts += 1
+                    waiter.add_done_callback(lambda f: f.cancelled() or f.exception())  # Resolved by retirement
+                    self._stuck.setdefault(executor, set()).add(future)
+                    self._retire(executor)
+                    raise RenderError(f"{name} is stuck past its {timeout}s limit")
+        except RenderTimeout:
+            self.timeouts += 1
+            raise RenderError(f"{name} timed out after {timeout}s")
+        finally:
+            if future not in self._stuck.get(executor, ()):
+                self._in_flight.get(executor, set()).discard(future)
+
+        self.completed += 1
+        return result
+
+    def shutdown(self):
+        """Stop the live and retired workers; queued jobs are cancelled"""
+        for task in self._draining:
+            task.cancel()
+        self._draining.clear()
+        for executor in set(self._in_flight) | {self._executor} - {None}:
+            self._terminate(executor)
+        self._executor = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "completed": self.completed,
+            "timeouts": self.timeouts,
+            "queue_timeouts": self.queue_timeouts,
+            "crashes": self.crashes,
+            "draining_pools": len(self._draining),
+        }
+
+    def _retire(self, executor: ProcessPoolExecutor):
+        """Send new jobs to a fresh pool and terminate this one once its other jobs finish"""
+        if self._executor is not executor:
+            return  # Already retired by another job
+        self.logger.warning("Retiring render pool")
+        self._executor = None
+        task = asyncio.get_running_loop().create_task(self._drain(executor))
+        self._draining.add(task)
+        task.add_done_callback(self._draining.discard)
+
+    async def _drain(self, executor: ProcessPoolExecutor):
+        # Stuck jobs never finish on their own; every other job either finishes or times out (becoming stuck)
+        while any(
+            not future.done() and future not in self._stuck.get(executor, ())
+            for future in self._in_flight.get(executor, ())
+        ):
+            await asyncio.sleep(self.DRAIN_POLL_SECONDS)
+        self._terminate(executor)
+
+    def _terminate(self, executor: ProcessPoolExecutor):
+        # ProcessPoolExecutor cannot cancel running work; terminate its workers directly
+        for process in list((getattr(executor, "_processes", None) or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+        self._in_flight.pop(executor, None)
+        self._stuck.pop(executor, None)
+
+
+# Shared by the export endpoints
+render_pool = RenderPool()
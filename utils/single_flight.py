@@ -0,0 +1,58 @@
+import asyncio
+import hashlib
+import json
+from typing import Dict, Any, Callable, Awaitable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one in-flight computation.
+
+    The first caller for a key starts the work; callers arriving while it is
+    still running await the same result (or exception). Each caller is
+    shielded, so one client cancelling does not cancel the work for the rest.
+    Nothing is kept once the computation finishes.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.started = 0
+        self.shared = 0
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run func() for key unless an identical call is already in flight
+
+        Args:
+            key: Identity of the computation
+            func: Zero-argument coroutine factory, only called by the first caller
+
+        Returns:
+            The shared result
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+            self.started += 1
+        else:
+            self.shared += 1
+
+        return await asyncio.shield(future)
+
+    def _forget(self, key: str, future: asyncio.Future):
+        self._inflight.pop(key, None)
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not future.cancelled():
+            future.exception()
+
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+    @staticmethod
+    def make_key(payload: Any) -> str:
+        """Stable hash of a JSON-serializable payload"""
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
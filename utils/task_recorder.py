@@ -0,0 +1,134 @@
+import asyncio
+import json
+import logging
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+
+from config.settings import SETTINGS
+from utils import database
+from utils.async_database import db
+
+
+class TaskRecorder:
+    """
+    Write-behind recorder of agent results into the SQLite ``tasks`` table.
+
+    record() only appends to an in-memory buffer, so agents pay no database
+    cost. A background task writes the buffer every TASK_RECORDER_FLUSH_SECONDS,
+    or as soon as TASK_RECORDER_BATCH_SIZE results are waiting, with one
+    executemany transaction per batch on the database thread. The buffer holds
+    at most TASK_RECORDER_MAX_BUFFER results; when writes fall behind, the
+    oldest are dropped rather than growing memory. stop() writes what is left.
+    """
+
+    def __init__(self, batch_size: int = None, flush_interval: float = None, max_buffer: int = None):
+        self.batch_size = batch_size or SETTINGS["TASK_RECORDER_BATCH_SIZE"]
+        self.flush_interval = flush_interval or SETTINGS["TASK_RECORDER_FLUSH_SECONDS"]
+        self.max_buffer = max_buffer or SETTINGS["TASK_RECORDER_MAX_BUFFER"]
+        self._buffer: deque = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._stopping = False
+        self.recorded = 0
+        self.written = 0
+        self.dropped = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def record(self, result: Dict[str, Any], blog_id: int = None, task_type: str = "agent_run"):
+        """
+        Buffer one standardized agent result for writing
+
+        Args:
+            result: Dictionary returned by BaseAgent.run / run_with_timeout / error_result
+            blog_id: Blog the agent worked on, if any
+            task_type: Stored as tasks.task_type
+        """
+        if len(self._buffer) >= self.max_buffer:
+            self._buffer.popleft()
+            self.dropped += 1
+        self._buffer.append((blog_id, task_type, result))
+        self.recorded += 1
+
+        if len(self._buffer) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+
+    async def start(self):
+        """Start the background flusher"""
+        if self._flusher is None:
+            self._stopping = False
+            self._wakeup = asyncio.Event()
+            self._flusher = asyncio.create_task(self._flush_loop(), name="task-recorder")
+
+    async def stop(self):
+        """Stop the background flusher and write every buffered result"""
+        if self._flusher is not None:
+            # Woken rather than cancelled, so a write in progress is never cut short
+            self._stopping = True
+            self._wakeup.set()
+            await self._flusher
+            self._flusher = None
+            self._wakeup = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Write buffered results in batches of TASK_RECORDER_BATCH_SIZE
+
+        Returns:
+            Number of results written
+        """
+        written = 0
+        while self._buffer:
+            batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+            try:
+                await db.run(self._write, batch)
+            except Exception as e:
+                self.logger.error(f"Failed to record {len(batch)} task results: {e}")
+                self.dropped += len(batch)
+                continue
+            written += len(batch)
+        self.written += written
+        return written
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "recorded": self.recorded,
+            "written": self.written,
+            "dropped": self.dropped,
+            "pending": len(self._buffer),
+        }
+
+    async def _flush_loop(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    @staticmethod
+    def _write(batch: List[tuple]):
+        # Runs on the database thread, so serializing results stays off the event loop
+        rows = []
+        for blog_id, task_type, result in batch:
+            completed_at = result.get("timestamp") or datetime.now().isoformat()
+            started_at = (
+                datetime.fromisoformat(completed_at) - timedelta(seconds=result.get("execution_time") or 0)
+            ).isoformat()
+            rows.append((
+                blog_id,
+                result.get("agent"),
+                task_type,
+                "completed" if result.get("status") == "success" else "failed",
+                started_at,
+                completed_at,
+                json.dumps(result, default=str),
+                result.get("error"),
+            ))
+        database.record_task_results(rows)
+
+
+# Shared by the agent manager and the shutdown hook in main.py
+task_recorder = TaskRecorder()